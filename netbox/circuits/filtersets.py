@@ -3,6 +3,7 @@ from django.db.models import Q
 
 from dcim.filtersets import CableTerminationFilterSet
 from dcim.models import Region, Site, SiteGroup
+from extras.models import SearchIndexEntry
 from ipam.models import ASN
 from netbox.filtersets import ChangeLoggedModelFilterSet, NetBoxModelFilterSet, OrganizationalModelFilterSet
 from tenancy.filtersets import ContactModelFilterSet, TenancyFilterSet
@@ -70,13 +71,7 @@ class ProviderFilterSet(NetBoxModelFilterSet, ContactModelFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(account__icontains=value) |
-            Q(noc_contact__icontains=value) |
-            Q(admin_contact__icontains=value) |
-            Q(comments__icontains=value)
-        )
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
 
 class ProviderNetworkFilterSet(NetBoxModelFilterSet):
@@ -98,12 +93,7 @@ class ProviderNetworkFilterSet(NetBoxModelFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(service_id__icontains=value) |
-            Q(description__icontains=value) |
-            Q(comments__icontains=value)
-        ).distinct()
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
 
 class CircuitTypeFilterSet(OrganizationalModelFilterSet):
@@ -188,14 +178,15 @@ class CircuitFilterSet(NetBoxModelFilterSet, TenancyFilterSet, ContactModelFilte
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
+        terminations = CircuitTermination.objects.filter(
+            Q(xconnect_id__icontains=value) |
+            Q(pp_info__icontains=value) |
+            Q(description__icontains=value)
+        )
         return queryset.filter(
-            Q(cid__icontains=value) |
-            Q(terminations__xconnect_id__icontains=value) |
-            Q(terminations__pp_info__icontains=value) |
-            Q(terminations__description__icontains=value) |
-            Q(description__icontains=value) |
-            Q(comments__icontains=value)
-        ).distinct()
+            Q(pk__in=SearchIndexEntry.objects.search(value, queryset.model)) |
+            Q(pk__in=terminations.values('circuit'))
+        )
 
 
 class CircuitTerminationFilterSet(ChangeLoggedModelFilterSet, CableTerminationFilterSet):
@@ -118,6 +118,8 @@ class Circuit(NetBoxModel):
         null=True
     )
 
+    search_fields = {'cid': 'A', 'description': 'C', 'comments': 'D'}
+
     clone_fields = [
         'provider', 'type', 'status', 'tenant', 'install_date', 'commit_rate', 'description',
     ]
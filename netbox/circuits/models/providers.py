@@ -61,6 +61,8 @@ class Provider(NetBoxModel):
         to='tenancy.ContactAssignment'
     )
 
+    search_fields = {'name': 'A', 'account': 'B', 'noc_contact': 'D', 'admin_contact': 'D', 'comments': 'D'}
+
     clone_fields = [
         'asn', 'account', 'portal_url', 'noc_contact', 'admin_contact',
     ]
@@ -101,6 +103,8 @@ class ProviderNetwork(NetBoxModel):
         blank=True
     )
 
+    search_fields = {'name': 'A', 'service_id': 'B', 'description': 'C', 'comments': 'D'}
+
     class Meta:
         ordering = ('provider', 'name')
         constraints = (
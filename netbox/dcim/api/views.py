@@ -14,6 +14,7 @@ from rest_framework.viewsets import ViewSet
 from circuits.models import Circuit
 from dcim import filtersets
 from dcim.models import *
+from dcim.utils import get_cached_rack_elevation
 from extras.api.views import ConfigContextQuerySetMixin
 from ipam.models import Prefix, VLAN
 from netbox.api.authentication import IsAuthenticatedOrLoginNotRequired
@@ -196,7 +197,7 @@ class RackViewSet(NetBoxModelViewSet):
     ).annotate(
         device_count=count_related(Device, 'rack'),
         powerfeed_count=count_related(PowerFeed, 'rack')
-    )
+    ).annotate_utilization()
     serializer_class = serializers.RackSerializer
     filterset_class = filtersets.RackFilterSet
 
@@ -217,24 +218,36 @@ class RackViewSet(NetBoxModelViewSet):
 
         if data['render'] == 'svg':
             # Render and return the elevation as an SVG drawing with the correct content type
-            drawing = rack.get_elevation_svg(
-                face=data['face'],
-                user=request.user,
-                unit_width=data['unit_width'],
-                unit_height=data['unit_height'],
-                legend_width=data['legend_width'],
-                include_images=data['include_images'],
-                base_url=request.build_absolute_uri('/')
+            params = {
+                'face': data['face'],
+                'unit_width': data['unit_width'],
+                'unit_height': data['unit_height'],
+                'legend_width': data['legend_width'],
+                'include_images': data['include_images'],
+                'base_url': request.build_absolute_uri('/'),
+            }
+            drawing = get_cached_rack_elevation(
+                rack,
+                request.user,
+                lambda: rack.get_elevation_svg(user=request.user, **params).tostring(),
+                render='svg',
+                **params
             )
-            return HttpResponse(drawing.tostring(), content_type='image/svg+xml')
+            return HttpResponse(drawing, content_type='image/svg+xml')
 
         else:
             # Return a JSON representation of the rack units in the elevation
-            elevation = rack.get_rack_units(
-                face=data['face'],
-                user=request.user,
-                exclude=data['exclude'],
-                expand_devices=data['expand_devices']
+            params = {
+                'face': data['face'],
+                'exclude': data['exclude'],
+                'expand_devices': data['expand_devices'],
+            }
+            elevation = get_cached_rack_elevation(
+                rack,
+                request.user,
+                lambda: rack.get_rack_units(user=request.user, **params),
+                render='json',
+                **params
             )
 
             # Enable filtering rack units by ID
@@ -2,6 +2,7 @@ import django_filters
 from django.contrib.auth.models import User
 
 from extras.filtersets import LocalConfigContextFilterSet
+from extras.models import SearchIndexEntry
 from ipam.models import ASN, VRF
 from netbox.filtersets import (
     BaseFilterSet, ChangeLoggedModelFilterSet, OrganizationalModelFilterSet, NetBoxModelFilterSet,
@@ -151,19 +152,13 @@ class SiteFilterSet(NetBoxModelFilterSet, TenancyFilterSet, ContactModelFilterSe
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        qs_filter = (
-            Q(name__icontains=value) |
-            Q(facility__icontains=value) |
-            Q(description__icontains=value) |
-            Q(physical_address__icontains=value) |
-            Q(shipping_address__icontains=value) |
-            Q(comments__icontains=value)
-        )
+        qs_filter = Q(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
         try:
-            qs_filter |= Q(asns__asn=int(value.strip()))
+            # Match assigned ASNs using a subquery rather than a join, which would require de-duplicating the results
+            qs_filter |= Q(pk__in=Site.asns.through.objects.filter(asn__asn=int(value.strip())).values('site'))
         except ValueError:
             pass
-        return queryset.filter(qs_filter).distinct()
+        return queryset.filter(qs_filter)
 
 
 class LocationFilterSet(TenancyFilterSet, ContactModelFilterSet, OrganizationalModelFilterSet):
@@ -224,10 +219,7 @@ class LocationFilterSet(TenancyFilterSet, ContactModelFilterSet, OrganizationalM
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(description__icontains=value)
-        )
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
 
 class RackRoleFilterSet(OrganizationalModelFilterSet):
@@ -321,13 +313,7 @@ class RackFilterSet(NetBoxModelFilterSet, TenancyFilterSet, ContactModelFilterSe
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(facility_id__icontains=value) |
-            Q(serial__icontains=value.strip()) |
-            Q(asset_tag__icontains=value.strip()) |
-            Q(comments__icontains=value)
-        )
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
 
 class RackReservationFilterSet(NetBoxModelFilterSet, TenancyFilterSet):
@@ -476,10 +462,8 @@ class DeviceTypeFilterSet(NetBoxModelFilterSet):
         if not value.strip():
             return queryset
         return queryset.filter(
-            Q(manufacturer__name__icontains=value) |
-            Q(model__icontains=value) |
-            Q(part_number__icontains=value) |
-            Q(comments__icontains=value)
+            Q(pk__in=SearchIndexEntry.objects.search(value, queryset.model)) |
+            Q(manufacturer__name__icontains=value)
         )
 
     def _console_ports(self, queryset, name, value):
@@ -557,10 +541,8 @@ class ModuleTypeFilterSet(NetBoxModelFilterSet):
         if not value.strip():
             return queryset
         return queryset.filter(
-            Q(manufacturer__name__icontains=value) |
-            Q(model__icontains=value) |
-            Q(part_number__icontains=value) |
-            Q(comments__icontains=value)
+            Q(pk__in=SearchIndexEntry.objects.search(value, queryset.model)) |
+            Q(manufacturer__name__icontains=value)
         )
 
     def _console_ports(self, queryset, name, value):
@@ -925,12 +907,9 @@ class DeviceFilterSet(NetBoxModelFilterSet, TenancyFilterSet, ContactModelFilter
         if not value.strip():
             return queryset
         return queryset.filter(
-            Q(name__icontains=value) |
-            Q(serial__icontains=value.strip()) |
-            Q(inventoryitems__serial__icontains=value.strip()) |
-            Q(asset_tag__icontains=value.strip()) |
-            Q(comments__icontains=value)
-        ).distinct()
+            Q(pk__in=SearchIndexEntry.objects.search(value, queryset.model)) |
+            Q(pk__in=InventoryItem.objects.filter(serial__icontains=value.strip()).values('device'))
+        )
 
     def _has_primary_ip(self, queryset, name, value):
         params = Q(primary_ip4__isnull=False) | Q(primary_ip6__isnull=False)
@@ -1010,11 +989,7 @@ class ModuleFilterSet(NetBoxModelFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(
-            Q(serial__icontains=value.strip()) |
-            Q(asset_tag__icontains=value.strip()) |
-            Q(comments__icontains=value)
-        ).distinct()
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
 
 class DeviceComponentFilterSet(django_filters.FilterSet):
@@ -1095,11 +1070,7 @@ class DeviceComponentFilterSet(django_filters.FilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(label__icontains=value) |
-            Q(description__icontains=value)
-        )
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
 
 class ModularDeviceComponentFilterSet(DeviceComponentFilterSet):
@@ -1411,14 +1382,7 @@ class InventoryItemFilterSet(DeviceComponentFilterSet, NetBoxModelFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        qs_filter = (
-            Q(name__icontains=value) |
-            Q(part_id__icontains=value) |
-            Q(serial__icontains=value) |
-            Q(asset_tag__icontains=value) |
-            Q(description__icontains=value)
-        )
-        return queryset.filter(qs_filter)
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
 
 class InventoryItemRoleFilterSet(OrganizationalModelFilterSet):
@@ -1495,12 +1459,10 @@ class VirtualChassisFilterSet(NetBoxModelFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        qs_filter = (
-            Q(name__icontains=value) |
-            Q(members__name__icontains=value) |
-            Q(domain__icontains=value)
+        return queryset.filter(
+            Q(pk__in=SearchIndexEntry.objects.search(value, queryset.model)) |
+            Q(pk__in=Device.objects.filter(name__icontains=value).values('virtual_chassis'))
         )
-        return queryset.filter(qs_filter).distinct()
 
 
 class CableFilterSet(TenancyFilterSet, NetBoxModelFilterSet):
@@ -1548,7 +1510,7 @@ class CableFilterSet(TenancyFilterSet, NetBoxModelFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(label__icontains=value)
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
     def filter_device(self, queryset, name, value):
         queryset = queryset.filter(
@@ -1674,11 +1636,7 @@ class PowerFeedFilterSet(NetBoxModelFilterSet, CableTerminationFilterSet, PathEn
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        qs_filter = (
-            Q(name__icontains=value) |
-            Q(comments__icontains=value)
-        )
-        return queryset.filter(qs_filter)
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
 
 #
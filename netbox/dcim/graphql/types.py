@@ -147,7 +147,7 @@ class DeviceType(ConfigContextMixin, ImageAttachmentsMixin, NetBoxObjectType):
 
     class Meta:
         model = models.Device
-        fields = '__all__'
+        exclude = ('_config_context',)
         filterset_class = filtersets.DeviceFilterSet
 
     def resolve_face(self, info):
@@ -0,0 +1,18 @@
+# Generated by Django 4.0.6 on 2026-10-19 09:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dcim', '0153_created_datetimefield'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='device',
+            name='_config_context',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -113,6 +113,8 @@ class Cable(NetBoxModel):
         null=True
     )
 
+    search_fields = {'label': 'A'}
+
     class Meta:
         ordering = ['pk']
         unique_together = (
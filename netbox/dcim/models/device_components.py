@@ -66,6 +66,8 @@ class ComponentModel(NetBoxModel):
         blank=True
     )
 
+    search_fields = {'name': 'A', 'label': 'B', 'description': 'C'}
+
     class Meta:
         abstract = True
 
@@ -1062,6 +1064,8 @@ class InventoryItem(MPTTModel, ComponentModel):
 
     objects = TreeManager()
 
+    search_fields = {'name': 'A', 'part_id': 'B', 'serial': 'B', 'asset_tag': 'B', 'description': 'C'}
+
     clone_fields = ['device', 'parent', 'role', 'manufacturer', 'part_id']
 
     class Meta:
@@ -133,10 +133,19 @@ class DeviceType(NetBoxModel):
         blank=True
     )
 
+    search_fields = {'model': 'A', 'part_number': 'B', 'comments': 'D'}
+
     clone_fields = [
         'manufacturer', 'u_height', 'is_full_depth', 'subdevice_role', 'airflow',
     ]
 
+    # Related objects to prefetch when exporting many device types (see to_yaml())
+    yaml_prefetch = (
+        'manufacturer', 'consoleporttemplates', 'consoleserverporttemplates', 'powerporttemplates',
+        'poweroutlettemplates__power_port', 'interfacetemplates', 'frontporttemplates__rear_port',
+        'rearporttemplates', 'modulebaytemplates', 'devicebaytemplates',
+    )
+
     class Meta:
         ordering = ['manufacturer', 'model']
         unique_together = [
@@ -174,7 +183,7 @@ class DeviceType(NetBoxModel):
         ))
 
         # Component templates
-        if self.consoleporttemplates.exists():
+        if components := self.consoleporttemplates.all():
             data['console-ports'] = [
                 {
                     'name': c.name,
@@ -182,9 +191,9 @@ class DeviceType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.consoleporttemplates.all()
+                for c in components
             ]
-        if self.consoleserverporttemplates.exists():
+        if components := self.consoleserverporttemplates.all():
             data['console-server-ports'] = [
                 {
                     'name': c.name,
@@ -192,9 +201,9 @@ class DeviceType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.consoleserverporttemplates.all()
+                for c in components
             ]
-        if self.powerporttemplates.exists():
+        if components := self.powerporttemplates.all():
             data['power-ports'] = [
                 {
                     'name': c.name,
@@ -204,9 +213,9 @@ class DeviceType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.powerporttemplates.all()
+                for c in components
             ]
-        if self.poweroutlettemplates.exists():
+        if components := self.poweroutlettemplates.all():
             data['power-outlets'] = [
                 {
                     'name': c.name,
@@ -216,9 +225,9 @@ class DeviceType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.poweroutlettemplates.all()
+                for c in components
             ]
-        if self.interfacetemplates.exists():
+        if components := self.interfacetemplates.all():
             data['interfaces'] = [
                 {
                     'name': c.name,
@@ -227,9 +236,9 @@ class DeviceType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.interfacetemplates.all()
+                for c in components
             ]
-        if self.frontporttemplates.exists():
+        if components := self.frontporttemplates.all():
             data['front-ports'] = [
                 {
                     'name': c.name,
@@ -239,9 +248,9 @@ class DeviceType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.frontporttemplates.all()
+                for c in components
             ]
-        if self.rearporttemplates.exists():
+        if components := self.rearporttemplates.all():
             data['rear-ports'] = [
                 {
                     'name': c.name,
@@ -250,9 +259,9 @@ class DeviceType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.rearporttemplates.all()
+                for c in components
             ]
-        if self.modulebaytemplates.exists():
+        if components := self.modulebaytemplates.all():
             data['module-bays'] = [
                 {
                     'name': c.name,
@@ -260,16 +269,16 @@ class DeviceType(NetBoxModel):
                     'position': c.position,
                     'description': c.description,
                 }
-                for c in self.modulebaytemplates.all()
+                for c in components
             ]
-        if self.devicebaytemplates.exists():
+        if components := self.devicebaytemplates.all():
             data['device-bays'] = [
                 {
                     'name': c.name,
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.devicebaytemplates.all()
+                for c in components
             ]
 
         return yaml.dump(dict(data), sort_keys=False)
@@ -380,8 +389,17 @@ class ModuleType(NetBoxModel):
         to='extras.ImageAttachment'
     )
 
+    search_fields = {'model': 'A', 'part_number': 'B', 'comments': 'D'}
+
     clone_fields = ('manufacturer',)
 
+    # Related objects to prefetch when exporting many module types (see to_yaml())
+    yaml_prefetch = (
+        'manufacturer', 'consoleporttemplates', 'consoleserverporttemplates', 'powerporttemplates',
+        'poweroutlettemplates__power_port', 'interfacetemplates', 'frontporttemplates__rear_port',
+        'rearporttemplates',
+    )
+
     class Meta:
         ordering = ('manufacturer', 'model')
         unique_together = (
@@ -403,7 +421,7 @@ class ModuleType(NetBoxModel):
         ))
 
         # Component templates
-        if self.consoleporttemplates.exists():
+        if components := self.consoleporttemplates.all():
             data['console-ports'] = [
                 {
                     'name': c.name,
@@ -411,9 +429,9 @@ class ModuleType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.consoleporttemplates.all()
+                for c in components
             ]
-        if self.consoleserverporttemplates.exists():
+        if components := self.consoleserverporttemplates.all():
             data['console-server-ports'] = [
                 {
                     'name': c.name,
@@ -421,9 +439,9 @@ class ModuleType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.consoleserverporttemplates.all()
+                for c in components
             ]
-        if self.powerporttemplates.exists():
+        if components := self.powerporttemplates.all():
             data['power-ports'] = [
                 {
                     'name': c.name,
@@ -433,9 +451,9 @@ class ModuleType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.powerporttemplates.all()
+                for c in components
             ]
-        if self.poweroutlettemplates.exists():
+        if components := self.poweroutlettemplates.all():
             data['power-outlets'] = [
                 {
                     'name': c.name,
@@ -445,9 +463,9 @@ class ModuleType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.poweroutlettemplates.all()
+                for c in components
             ]
-        if self.interfacetemplates.exists():
+        if components := self.interfacetemplates.all():
             data['interfaces'] = [
                 {
                     'name': c.name,
@@ -456,9 +474,9 @@ class ModuleType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.interfacetemplates.all()
+                for c in components
             ]
-        if self.frontporttemplates.exists():
+        if components := self.frontporttemplates.all():
             data['front-ports'] = [
                 {
                     'name': c.name,
@@ -468,9 +486,9 @@ class ModuleType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.frontporttemplates.all()
+                for c in components
             ]
-        if self.rearporttemplates.exists():
+        if components := self.rearporttemplates.all():
             data['rear-ports'] = [
                 {
                     'name': c.name,
@@ -479,7 +497,7 @@ class ModuleType(NetBoxModel):
                     'label': c.label,
                     'description': c.description,
                 }
-                for c in self.rearporttemplates.all()
+                for c in components
             ]
 
         return yaml.dump(dict(data), sort_keys=False)
@@ -721,6 +739,13 @@ class Device(NetBoxModel, ConfigContextModel):
         blank=True
     )
 
+    # Cache the rendered config context data
+    _config_context = models.JSONField(
+        blank=True,
+        null=True,
+        editable=False
+    )
+
     # Generic relations
     contacts = GenericRelation(
         to='tenancy.ContactAssignment'
@@ -731,6 +756,8 @@ class Device(NetBoxModel, ConfigContextModel):
 
     objects = ConfigContextModelQuerySet.as_manager()
 
+    search_fields = {'name': 'A', 'serial': 'B', 'asset_tag': 'B', 'comments': 'D'}
+
     clone_fields = [
         'device_type', 'device_role', 'tenant', 'platform', 'site', 'location', 'rack', 'status', 'airflow', 'cluster',
     ]
@@ -1053,6 +1080,8 @@ class Module(NetBoxModel, ConfigContextModel):
         blank=True
     )
 
+    search_fields = {'serial': 'B', 'asset_tag': 'B', 'comments': 'D'}
+
     clone_fields = ('device', 'module_type')
 
     class Meta:
@@ -1140,6 +1169,8 @@ class VirtualChassis(NetBoxModel):
         blank=True
     )
 
+    search_fields = {'name': 'A', 'domain': 'B'}
+
     class Meta:
         ordering = ['name']
         verbose_name_plural = 'virtual chassis'
@@ -126,6 +126,8 @@ class PowerFeed(NetBoxModel, PathEndpoint, LinkTermination):
         blank=True
     )
 
+    search_fields = {'name': 'A', 'comments': 'D'}
+
     clone_fields = [
         'power_panel', 'rack', 'status', 'type', 'mark_connected', 'supply', 'phase', 'voltage', 'amperage',
         'max_utilization', 'available_power',
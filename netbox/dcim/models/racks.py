@@ -12,6 +12,7 @@ from django.urls import reverse
 
 from dcim.choices import *
 from dcim.constants import *
+from dcim.querysets import RackQuerySet
 from dcim.svg import RackElevationSVG
 from netbox.config import get_config
 from netbox.models import OrganizationalModel, NetBoxModel
@@ -184,6 +185,10 @@ class Rack(NetBoxModel):
         to='extras.ImageAttachment'
     )
 
+    objects = RackQuerySet.as_manager()
+
+    search_fields = {'name': 'A', 'facility_id': 'B', 'serial': 'B', 'asset_tag': 'B', 'comments': 'D'}
+
     clone_fields = [
         'site', 'location', 'tenant', 'status', 'role', 'type', 'width', 'u_height', 'desc_units', 'outer_width',
         'outer_depth', 'outer_unit',
@@ -295,9 +300,9 @@ class Rack(NetBoxModel):
             )
 
             # Determine which devices the user has permission to view
-            permitted_device_ids = []
+            permitted_device_ids = set()
             if user is not None:
-                permitted_device_ids = self.devices.restrict(user, 'view').values_list('pk', flat=True)
+                permitted_device_ids = set(self.devices.restrict(user, 'view').values_list('pk', flat=True))
 
             for device in queryset:
                 if expand_devices:
@@ -398,8 +403,11 @@ class Rack(NetBoxModel):
     def get_utilization(self):
         """
         Determine the utilization rate of the rack and return it as a percentage. Occupied and reserved units both count
-        as utilized.
+        as utilized. (See RackQuerySet.annotate_utilization() to determine the utilization of many racks at once.)
         """
+        if hasattr(self, 'utilization'):
+            return self.utilization
+
         # Determine unoccupied units
         available_units = self.get_available_units()
 
@@ -417,6 +425,9 @@ class Rack(NetBoxModel):
         """
         Determine the utilization rate of power in the rack and return it as a percentage.
         """
+        if hasattr(self, 'power_utilization'):
+            return self.power_utilization
+
         powerfeeds = PowerFeed.objects.filter(rack=self)
         available_power_total = sum(pf.available_power for pf in powerfeeds)
         if not available_power_total:
@@ -432,7 +443,7 @@ class Rack(NetBoxModel):
             _link_peer_id__in=poweroutlets.values_list('id', flat=True)
         ).aggregate(Sum('allocated_draw'))['allocated_draw__sum'] or 0
 
-        return int(allocated_draw_total / available_power_total * 100)
+        return allocated_draw_total * 100 // available_power_total
 
 
 class RackReservation(NetBoxModel):
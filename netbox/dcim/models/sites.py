@@ -295,6 +295,11 @@ class Site(NetBoxModel):
         to='extras.ImageAttachment'
     )
 
+    search_fields = {
+        'name': 'A', 'facility': 'B', 'description': 'C', 'physical_address': 'D', 'shipping_address': 'D',
+        'comments': 'D',
+    }
+
     clone_fields = [
         'status', 'region', 'group', 'tenant', 'facility', 'time_zone', 'description', 'physical_address',
         'shipping_address', 'latitude', 'longitude',
@@ -367,6 +372,8 @@ class Location(NestedGroupModel):
         to='extras.ImageAttachment'
     )
 
+    search_fields = {'name': 'A', 'description': 'C'}
+
     clone_fields = ['site', 'parent', 'tenant', 'description']
 
     class Meta:
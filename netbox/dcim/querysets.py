@@ -0,0 +1,102 @@
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import ExpressionWrapper, F, FloatField, Func, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Cast, Coalesce, Least, NullIf
+
+from utilities.querysets import RestrictedQuerySet
+
+__all__ = (
+    'RackQuerySet',
+)
+
+
+class RackQuerySet(RestrictedQuerySet):
+
+    def annotate_utilization(self):
+        """
+        Annotate the space and power utilization of each Rack (as returned by get_utilization() and
+        get_power_utilization(), respectively) using a subquery for each, rather than several queries per Rack.
+        """
+        from .models import Device, PowerFeed, PowerOutlet, PowerPort, Rack, RackReservation
+
+        # Units occupied by devices
+        device_units = Device.objects.filter(
+            rack=OuterRef('pk'),
+            position__gte=1
+        ).order_by().annotate(
+            unit=Func(
+                F('position'),
+                ExpressionWrapper(F('position') + F('device_type__u_height') - 1, output_field=IntegerField()),
+                function='generate_series',
+                output_field=IntegerField()
+            )
+        ).values('unit')
+
+        # Reserved units
+        reserved_units = RackReservation.objects.filter(
+            rack=OuterRef('pk')
+        ).order_by().annotate(
+            unit=Func(F('units'), function='unnest', output_field=IntegerField())
+        ).values('unit')
+
+        # Distinct units which are occupied and/or reserved. Any units exceeding the rack's height are nullified.
+        out_of_range = ExpressionWrapper(F('u_height') + 1, output_field=IntegerField())
+        occupied_units = Rack.objects.filter(
+            pk=OuterRef('pk')
+        ).order_by().annotate(
+            unit=NullIf(
+                Least(
+                    Func(
+                        Func(ArraySubquery(device_units), ArraySubquery(reserved_units), function='array_cat'),
+                        function='unnest',
+                        output_field=IntegerField()
+                    ),
+                    out_of_range
+                ),
+                out_of_range
+            )
+        ).values('unit').distinct()
+        occupied_unit_count = Func(
+            Func(ArraySubquery(occupied_units), Value(None), function='array_remove'),
+            function='cardinality'
+        )
+
+        # Power allocated to devices downstream of the rack's power feeds
+        allocated_draw = Subquery(
+            PowerPort.objects.filter(
+                _link_peer_type=ContentType.objects.get_for_model(PowerOutlet),
+                _link_peer_id__in=PowerOutlet.objects.filter(
+                    power_port___link_peer_type=ContentType.objects.get_for_model(PowerFeed),
+                    power_port___link_peer_id__in=PowerFeed.objects.filter(
+                        rack=OuterRef(OuterRef(OuterRef('pk')))
+                    ).values('pk')
+                ).values('pk')
+            ).order_by().annotate(
+                total=Func(F('allocated_draw'), function='SUM')
+            ).values('total')
+        )
+
+        # Power available from the rack's power feeds
+        available_power = Subquery(
+            PowerFeed.objects.filter(
+                rack=OuterRef('pk')
+            ).order_by().annotate(
+                total=Func(F('available_power'), function='SUM')
+            ).values('total')
+        )
+
+        return self.annotate(
+            # Units occupied and/or reserved, as a percentage of the rack's height
+            utilization=ExpressionWrapper(
+                Cast(occupied_unit_count, FloatField()) / F('u_height') * 100,
+                output_field=FloatField()
+            ),
+            # Allocated power as a percentage of the feeds' available power
+            power_utilization=Coalesce(
+                ExpressionWrapper(
+                    Coalesce(allocated_draw, 0) * 100 / NullIf(available_power, 0),
+                    output_field=IntegerField()
+                ),
+                0
+            )
+        )
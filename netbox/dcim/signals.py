@@ -1,12 +1,21 @@
 import logging
+from functools import partial
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import post_save, post_delete, pre_delete
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, pre_save
 from django.dispatch import receiver
 
+from extras.signals import enqueue_config_context_refresh, refresh_config_contexts
+from netbox import thread_locals
+from netbox.config import get_config
+from netbox.signals import post_bulk_save
 from .choices import LinkStatusChoices
-from .models import Cable, CablePath, Device, PathEndpoint, PowerPanel, Rack, Location, VirtualChassis
-from .utils import create_cablepath, rebuild_paths
+from .models import (
+    Cable, CablePath, Device, DeviceBay, DeviceRole, DeviceType, PathEndpoint, PowerPanel, Rack, RackReservation,
+    Location, VirtualChassis,
+)
+from .utils import create_cablepath, invalidate_rack_elevations, rebuild_paths
 
 
 #
@@ -23,7 +32,10 @@ def handle_location_site_change(instance, created, **kwargs):
         instance.get_descendants().update(site=instance.site)
         locations = instance.get_descendants(include_self=True).values_list('pk', flat=True)
         Rack.objects.filter(location__in=locations).update(site=instance.site)
-        Device.objects.filter(location__in=locations).update(site=instance.site)
+        devices = Device.objects.filter(location__in=locations)
+        enqueue_config_context_refresh(Device, devices.exclude(site=instance.site).values_list('pk', flat=True))
+        devices.update(site=instance.site)
+        transaction.on_commit(refresh_config_contexts)
         PowerPanel.objects.filter(location__in=locations).update(site=instance.site)
 
 
@@ -33,7 +45,97 @@ def handle_rack_site_change(instance, created, **kwargs):
     Update child Devices if Site or Location assignment has changed.
     """
     if not created:
-        Device.objects.filter(rack=instance).update(site=instance.site, location=instance.location)
+        devices = Device.objects.filter(rack=instance)
+        enqueue_config_context_refresh(Device, devices.exclude(site=instance.site).values_list('pk', flat=True))
+        devices.update(site=instance.site, location=instance.location)
+        transaction.on_commit(refresh_config_contexts)
+
+
+#
+# Rack elevations
+#
+
+def get_device_rack_ids(device):
+    """
+    Return the IDs of the racks to which a Device is and (per its stored rack or prechange snapshot, if any) was
+    assigned.
+    """
+    prechange_snapshot = getattr(device, '_prechange_snapshot', None) or {}
+    return {device.rack_id, getattr(device, '_prechange_rack_id', None), prechange_snapshot.get('rack')}
+
+
+def invalidate_device_rack_elevations(**filters):
+    """
+    Invalidate the elevations of all racks containing Devices matching the specified filters.
+    """
+    rack_ids = Device.objects.filter(rack__isnull=False, **filters).values_list('rack_id', flat=True).distinct()
+    transaction.on_commit(partial(invalidate_rack_elevations, *rack_ids))
+
+
+@receiver((post_save, post_delete), sender=Rack)
+def handle_rack_changed(instance, **kwargs):
+    transaction.on_commit(partial(invalidate_rack_elevations, instance.pk))
+
+
+@receiver(pre_save, sender=Device)
+def record_device_rack(instance, raw=False, **kwargs):
+    """
+    Record the rack to which an existing Device is currently assigned, so that its elevation can be invalidated if the
+    Device is moved to another rack.
+    """
+    if raw or not instance.pk or not get_config().RACK_ELEVATION_CACHE_TIMEOUT:
+        return
+    instance._prechange_rack_id = Device.objects.filter(pk=instance.pk).values_list('rack_id', flat=True).first()
+
+
+@receiver((post_save, post_delete), sender=Device)
+def handle_device_changed(instance, **kwargs):
+    transaction.on_commit(partial(invalidate_rack_elevations, *get_device_rack_ids(instance)))
+
+
+@receiver(post_save, sender=DeviceType)
+def handle_devicetype_changed(instance, created, **kwargs):
+    # The height and images of a device type are reflected in the elevations of all racks containing its instances
+    if not created and get_config().RACK_ELEVATION_CACHE_TIMEOUT:
+        invalidate_device_rack_elevations(device_type=instance)
+
+
+@receiver(post_save, sender=DeviceRole)
+def handle_devicerole_changed(instance, created, **kwargs):
+    # Devices are drawn in the color of their roles
+    if not created and get_config().RACK_ELEVATION_CACHE_TIMEOUT:
+        invalidate_device_rack_elevations(device_role=instance)
+
+
+@receiver(post_save, sender=DeviceBay)
+def handle_devicebay_changed(instance, **kwargs):
+    # The number of child devices installed in a parent device's bays is displayed on its elevation
+    transaction.on_commit(partial(invalidate_rack_elevations, instance.device.rack_id))
+
+
+@receiver(post_delete, sender=DeviceBay)
+def handle_devicebay_deleted(instance, **kwargs):
+    # The parent device may itself have been deleted, in which case its rack has already been invalidated
+    rack_id = Device.objects.filter(pk=instance.device_id).values_list('rack_id', flat=True).first()
+    transaction.on_commit(partial(invalidate_rack_elevations, rack_id))
+
+
+@receiver((post_save, post_delete), sender=RackReservation)
+def handle_rackreservation_changed(instance, **kwargs):
+    transaction.on_commit(partial(invalidate_rack_elevations, instance.rack_id))
+
+
+@receiver(post_bulk_save, sender=Device)
+def handle_devices_bulk_saved(instances, **kwargs):
+    rack_ids = set()
+    for instance in instances:
+        rack_ids.update(get_device_rack_ids(instance))
+    transaction.on_commit(partial(invalidate_rack_elevations, *rack_ids))
+
+
+@receiver(post_bulk_save, sender=RackReservation)
+def handle_rackreservations_bulk_saved(instances, **kwargs):
+    transaction.on_commit(partial(invalidate_rack_elevations, *{instance.rack_id for instance in instances}))
 
 
 #
@@ -108,6 +210,37 @@ def update_connected_endpoints(instance, created, raw=False, **kwargs):
             rebuild_paths(instance)
 
 
+def update_queued_cable_paths():
+    """
+    Update the CablePaths which traverse each queued Cable according to the Cable's status. This should be called only
+    once the changes which prompted the update have been committed.
+    """
+    queue = getattr(thread_locals, 'cable_path_queue', set())
+    pk_list = list(queue)
+    queue.clear()
+
+    for cable in Cable.objects.filter(pk__in=pk_list):
+        if cable.status != LinkStatusChoices.STATUS_CONNECTED:
+            CablePath.objects.filter(path__contains=cable).update(is_active=False)
+        else:
+            rebuild_paths(cable)
+
+
+@receiver(post_bulk_save, sender=Cable)
+def handle_cables_bulk_saved(instances, fields=None, **kwargs):
+    """
+    Update the CablePaths which traverse cables whose status has been modified in bulk once the changes have been
+    committed.
+    """
+    if fields is not None and 'status' in fields:
+        if not hasattr(thread_locals, 'cable_path_queue'):
+            thread_locals.cable_path_queue = set()
+        thread_locals.cable_path_queue.update(
+            instance.pk for instance in instances if instance.status != instance._orig_status
+        )
+        transaction.on_commit(update_queued_cable_paths)
+
+
 @receiver(post_delete, sender=Cable)
 def nullify_connected_endpoints(instance, **kwargs):
     """
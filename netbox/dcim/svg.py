@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import svgwrite
 from svgwrite.container import Group, Hyperlink
 from svgwrite.shapes import Line, Rect
@@ -27,6 +29,15 @@ def get_device_name(device):
         return str(device.device_type)
 
 
+@lru_cache()
+def get_rack_elevation_stylesheet():
+    """
+    Return the stylesheet embedded in rack elevations. This is read from disk only once per process.
+    """
+    with open('{}/rack_elevation.css'.format(settings.STATIC_ROOT)) as css_file:
+        return css_file.read()
+
+
 class RackElevationSVG:
     """
     Use this class to render a rack elevation as an SVG image.
@@ -48,7 +59,7 @@ class RackElevationSVG:
         permitted_devices = self.rack.devices
         if user is not None:
             permitted_devices = permitted_devices.restrict(user, 'view')
-        self.permitted_device_ids = permitted_devices.values_list('pk', flat=True)
+        self.permitted_device_ids = set(permitted_devices.values_list('pk', flat=True))
 
     @staticmethod
     def _get_device_description(device):
@@ -83,8 +94,7 @@ class RackElevationSVG:
         drawing = svgwrite.Drawing(size=(width, height))
 
         # add the stylesheet
-        with open('{}/rack_elevation.css'.format(settings.STATIC_ROOT)) as css_file:
-            drawing.defs.add(drawing.style(css_file.read()))
+        drawing.defs.add(drawing.style(get_rack_elevation_stylesheet()))
 
         # add gradients
         RackElevationSVG._add_gradient(drawing, 'reserved', '#c7c7ff')
@@ -337,6 +337,52 @@ class RackTest(APIViewTestCases.APIViewTestCase):
         response = self.client.get(f'{url}?q=U10', **self.header)
         self.assertEqual(response.data['count'], 1)
 
+    @override_settings(RACK_ELEVATION_CACHE_TIMEOUT=60)
+    def test_get_rack_elevation_cached(self):
+        """
+        GET a cached rack elevation, which is invalidated when a device is installed, moved, or resized.
+        """
+        racks = Rack.objects.filter(name__in=('Rack 1', 'Rack 2')).order_by('name')
+        self.add_permissions('dcim.view_rack', 'dcim.view_device')
+
+        def get_unit_device(rack, unit):
+            url = reverse('dcim-api:rack-elevation', kwargs={'pk': rack.pk})
+            response = self.client.get(url, **self.header)
+            device = response.data['results'][rack.u_height - unit]['device']
+            return device['id'] if device else None
+
+        self.assertIsNone(get_unit_device(racks[0], 1))
+        self.assertIsNone(get_unit_device(racks[1], 1))
+
+        # The cached elevation should be returned until the changes are committed
+        device = create_test_device('Device 1')
+        Device.objects.filter(pk=device.pk).update(rack=racks[0], position=1, face=DeviceFaceChoices.FACE_FRONT)
+        self.assertIsNone(get_unit_device(racks[0], 1))
+        with self.captureOnCommitCallbacks(execute=True):
+            Device.objects.get(pk=device.pk).save()
+        self.assertEqual(get_unit_device(racks[0], 1), device.pk)
+
+        # Moving the device should invalidate the elevations of both racks
+        device = Device.objects.get(pk=device.pk)
+        device.rack = racks[1]
+        with self.captureOnCommitCallbacks(execute=True):
+            device.save()
+        self.assertIsNone(get_unit_device(racks[0], 1))
+        self.assertEqual(get_unit_device(racks[1], 1), device.pk)
+
+        # Changing the height of the device's type should invalidate the elevation of its rack
+        self.assertIsNone(get_unit_device(racks[1], 2))
+        device_type = device.device_type
+        device_type.u_height = 2
+        with self.captureOnCommitCallbacks(execute=True):
+            device_type.save()
+        self.assertEqual(get_unit_device(racks[1], 2), device.pk)
+
+        # Deleting the device should invalidate the elevation of its rack
+        with self.captureOnCommitCallbacks(execute=True):
+            device.delete()
+        self.assertIsNone(get_unit_device(racks[1], 1))
+
     def test_get_rack_elevation_svg(self):
         """
         GET a single rack elevation in SVG format.
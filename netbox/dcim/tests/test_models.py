@@ -1,3 +1,4 @@
+from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
@@ -217,6 +218,53 @@ class RackTestCase(TestCase):
         )
         self.assertTrue(pdu)
 
+    def test_utilization(self):
+        rack2 = Rack.objects.create(name='TestRack2', site=self.site1, u_height=10)
+        Rack.objects.create(name='TestRack3', site=self.site1, u_height=42)
+        user = User.objects.create(username='User 1')
+        device_type_2u = DeviceType.objects.create(manufacturer=self.manufacturer, model='2U', slug='2u', u_height=2)
+        Device.objects.bulk_create((
+            Device(device_type=device_type_2u, device_role=self.role['Server'], site=self.site1, rack=self.rack,
+                   position=1, face=DeviceFaceChoices.FACE_FRONT),
+            Device(device_type=device_type_2u, device_role=self.role['Server'], site=self.site1, rack=self.rack,
+                   position=5, face=DeviceFaceChoices.FACE_REAR),
+            # Extends beyond the height of the rack
+            Device(device_type=device_type_2u, device_role=self.role['Server'], site=self.site1, rack=rack2,
+                   position=10, face=DeviceFaceChoices.FACE_FRONT),
+        ))
+        RackReservation.objects.bulk_create((
+            RackReservation(rack=self.rack, units=[2, 3, 4], user=user, description='Reservation 1'),
+            RackReservation(rack=rack2, units=[1, 10], user=user, description='Reservation 2'),
+        ))
+
+        # Create a power feed supplying a PDU, which in turn supplies a server
+        power_panel = PowerPanel.objects.create(site=self.site1, name='Power Panel 1')
+        power_feed = PowerFeed.objects.create(
+            power_panel=power_panel, rack=self.rack, name='Power Feed 1', voltage=120, amperage=20, max_utilization=80
+        )
+        pdu = Device.objects.create(
+            device_type=self.device_type['cc5000'], device_role=self.role['PDU'], site=self.site1, rack=self.rack
+        )
+        pdu_powerport = PowerPort.objects.create(device=pdu, name='Power Port 1')
+        pdu_poweroutlet = PowerOutlet.objects.create(device=pdu, name='Power Outlet 1', power_port=pdu_powerport)
+        server = Device.objects.get(rack=self.rack, position=1)
+        server_powerport = PowerPort.objects.create(device=server, name='Power Port 1', allocated_draw=500)
+        Cable(termination_a=power_feed, termination_b=pdu_powerport).save()
+        Cable(termination_a=pdu_poweroutlet, termination_b=server_powerport).save()
+
+        racks = Rack.objects.annotate_utilization().order_by('name')
+        self.assertEqual(
+            [(rack.utilization, rack.power_utilization) for rack in racks],
+            [(6 / 42 * 100, 500 * 100 // 1920), (2 / 10 * 100, 0), (0, 0)]
+        )
+
+        # The annotated utilization should match that determined for each rack individually
+        for rack in racks:
+            with self.subTest(rack=rack.name):
+                unannotated_rack = Rack.objects.get(pk=rack.pk)
+                self.assertEqual(unannotated_rack.get_utilization(), rack.utilization)
+                self.assertEqual(unannotated_rack.get_power_utilization(), rack.power_utilization)
+
     def test_change_rack_site(self):
         """
         Check that child Devices get updated when a Rack is moved to a new Site.
@@ -4,7 +4,9 @@ import pytz
 import yaml
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from netaddr import EUI
 
@@ -769,7 +771,7 @@ inventory-items:
         # Test default YAML export
         response = self.client.get(f'{url}?export')
         self.assertEqual(response.status_code, 200)
-        data = list(yaml.load_all(response.content, Loader=yaml.SafeLoader))
+        data = list(yaml.load_all(b''.join(response.streaming_content), Loader=yaml.SafeLoader))
         self.assertEqual(len(data), 3)
         self.assertEqual(data[0]['manufacturer'], 'Manufacturer 1')
         self.assertEqual(data[0]['model'], 'Device Type 1')
@@ -779,6 +781,32 @@ inventory-items:
         self.assertHttpStatus(response, 200)
         self.assertEqual(response.get('Content-Type'), 'text/csv; charset=utf-8')
 
+    def test_export_objects_queries(self):
+        url = reverse('dcim:devicetype_list')
+        self.add_permissions('dcim.view_devicetype')
+
+        for device_type in DeviceType.objects.all():
+            power_port = PowerPortTemplate.objects.create(device_type=device_type, name='Power Port 1')
+            PowerOutletTemplate.objects.create(device_type=device_type, name='Power Outlet 1', power_port=power_port)
+            rear_port = RearPortTemplate.objects.create(device_type=device_type, name='Rear Port 1', type='8p8c')
+            FrontPortTemplate.objects.create(
+                device_type=device_type, name='Front Port 1', type='8p8c', rear_port=rear_port
+            )
+            InterfaceTemplate.objects.create(device_type=device_type, name='Interface 1', type='1000base-t')
+
+        def export(query=''):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(f'{url}?export&{query}')
+                content = b''.join(response.streaming_content).decode()
+            return content, len(context)
+
+        # The number of queries should not depend on the number of device types exported
+        content, query_count = export()
+        self.assertEqual(export('model=Device Type 1')[1], query_count)
+
+        # The output should match that of each device type's to_yaml()
+        self.assertEqual(content, '---\n'.join(device_type.to_yaml() for device_type in DeviceType.objects.all()))
+
 
 # TODO: Change base class to PrimaryObjectViewTestCase
 # Blocked by absence of bulk import view for ModuleTypes
@@ -1063,7 +1091,7 @@ front-ports:
         # Test default YAML export
         response = self.client.get(f'{url}?export')
         self.assertEqual(response.status_code, 200)
-        data = list(yaml.load_all(response.content, Loader=yaml.SafeLoader))
+        data = list(yaml.load_all(b''.join(response.streaming_content), Loader=yaml.SafeLoader))
         self.assertEqual(len(data), 3)
         self.assertEqual(data[0]['manufacturer'], 'Manufacturer 1')
         self.assertEqual(data[0]['model'], 'Module Type 1')
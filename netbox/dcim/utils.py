@@ -1,6 +1,17 @@
+import hashlib
+import json
+import uuid
+
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.db import transaction
 
+from netbox.config import get_config
+from users.models import get_permissions_version
+
+# Cache key for the version of a rack's elevation, shared by all NetBox processes
+RACK_ELEVATION_VERSION_KEY = 'rack_elevation_version:{}'
+
 
 def compile_path_node(ct_id, object_id):
     return f'{ct_id}:{object_id}'
@@ -53,3 +64,55 @@ def rebuild_paths(obj):
             cp.delete()
             if cp.origin:
                 create_cablepath(cp.origin)
+
+
+def get_rack_elevation_version(rack_id):
+    """
+    Return an identifier which changes whenever the elevation of the specified rack may have changed (e.g. due to the
+    installation of a Device or the modification of a RackReservation).
+    """
+    cache_key = RACK_ELEVATION_VERSION_KEY.format(rack_id)
+    version = cache.get(cache_key)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(cache_key, version, None)
+
+    return version
+
+
+def invalidate_rack_elevations(*rack_ids):
+    """
+    Invalidate all cached elevations of the specified racks.
+    """
+    cache.delete_many([RACK_ELEVATION_VERSION_KEY.format(rack_id) for rack_id in rack_ids if rack_id is not None])
+
+
+def get_cached_rack_elevation(rack, user, func, **params):
+    """
+    Return the elevation of a rack produced by func(), caching it for RACK_ELEVATION_CACHE_TIMEOUT seconds. Elevations
+    are cached per rack, set of parameters, and user (reflecting the user's permissions), and are invalidated when the
+    rack, its devices, or its reservations are modified.
+
+    Args:
+        rack: The Rack being rendered
+        user: The User whose permissions determine which devices are displayed (or None to display all devices)
+        func: A callable which returns the elevation to be cached
+        params: The parameters of the elevation (e.g. face or unit width) which distinguish it from others
+    """
+    cache_timeout = get_config().RACK_ELEVATION_CACHE_TIMEOUT
+    if not cache_timeout:
+        return func()
+
+    permission_scope = (user.pk, get_permissions_version()) if user is not None else None
+    key = json.dumps(
+        [rack.pk, get_rack_elevation_version(rack.pk), params, permission_scope],
+        sort_keys=True,
+        default=str
+    )
+    cache_key = f'rack_elevation:{hashlib.sha256(key.encode("utf-8")).hexdigest()}'
+    elevation = cache.get(cache_key)
+    if elevation is None:
+        elevation = func()
+        cache.set(cache_key, elevation, cache_timeout)
+
+    return elevation
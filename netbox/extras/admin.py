@@ -13,7 +13,9 @@ from .models import ConfigRevision, JobResult
 class ConfigRevisionAdmin(admin.ModelAdmin):
     fieldsets = [
         ('Rack Elevations', {
-            'fields': ('RACK_ELEVATION_DEFAULT_UNIT_HEIGHT', 'RACK_ELEVATION_DEFAULT_UNIT_WIDTH'),
+            'fields': (
+                'RACK_ELEVATION_DEFAULT_UNIT_HEIGHT', 'RACK_ELEVATION_DEFAULT_UNIT_WIDTH', 'RACK_ELEVATION_CACHE_TIMEOUT',
+            ),
         }),
         ('Power', {
             'fields': ('POWERFEED_DEFAULT_VOLTAGE', 'POWERFEED_DEFAULT_AMPERAGE', 'POWERFEED_DEFAULT_MAX_UTILIZATION')
@@ -43,7 +45,11 @@ class ConfigRevisionAdmin(admin.ModelAdmin):
             'fields': ('DEFAULT_USER_PREFERENCES',),
         }),
         ('Miscellaneous', {
-            'fields': ('MAINTENANCE_MODE', 'GRAPHQL_ENABLED', 'CHANGELOG_RETENTION', 'JOBRESULT_RETENTION', 'MAPS_URL'),
+            'fields': (
+                'MAINTENANCE_MODE', 'GRAPHQL_ENABLED', 'GRAPHQL_DEFAULT_PAGE_SIZE', 'GRAPHQL_MAX_QUERY_COST',
+                'GRAPHQL_CACHE_TIMEOUT', 'CHANGELOG_RETENTION', 'JOBRESULT_RETENTION', 'HOME_STATS_CACHE_TIMEOUT',
+                'SEARCH_TIMEOUT', 'MAPS_URL',
+            ),
         }),
         ('Config Revision', {
             'fields': ('comment',),
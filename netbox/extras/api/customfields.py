@@ -1,4 +1,3 @@
-from django.contrib.contenttypes.models import ContentType
 from rest_framework.fields import Field
 
 from extras.choices import CustomFieldTypeChoices
@@ -20,8 +19,7 @@ class CustomFieldDefaultValues:
         self.model = serializer_field.parent.Meta.model
 
         # Retrieve the CustomFields for the parent model
-        content_type = ContentType.objects.get_for_model(self.model)
-        fields = CustomField.objects.filter(content_types=content_type)
+        fields = CustomField.objects.get_cached_for_model(self.model)
 
         # Populate the default value for each CustomField
         value = {}
@@ -41,16 +39,17 @@ class CustomFieldsDataField(Field):
         Cache CustomFields assigned to this model to avoid redundant database queries
         """
         if not hasattr(self, '_custom_fields'):
-            content_type = ContentType.objects.get_for_model(self.parent.Meta.model)
-            self._custom_fields = CustomField.objects.filter(content_types=content_type)
+            self._custom_fields = CustomField.objects.get_cached_for_model(self.parent.Meta.model)
         return self._custom_fields
 
     def to_representation(self, obj):
         # TODO: Fix circular import
         from utilities.api import get_serializer_for_model
         data = {}
+        # Use any objects already resolved by the parent serializer for a list of instances
+        related_objects = getattr(self.parent, 'custom_field_objects', None)
         for cf in self._get_custom_fields():
-            value = cf.deserialize(obj.get(cf.name))
+            value = cf.deserialize(obj.get(cf.name), related_objects)
             if value is not None and cf.type == CustomFieldTypeChoices.TYPE_OBJECT:
                 serializer = get_serializer_for_model(cf.object_type.model_class(), prefix=NESTED_SERIALIZER_PREFIX)
                 value = serializer(value, context=self.parent.context).data
@@ -11,6 +11,7 @@ from dcim.api.nested_serializers import (
 from dcim.models import DeviceRole, DeviceType, Platform, Region, Site, SiteGroup
 from extras.choices import *
 from extras.models import *
+from extras.reports import get_report_log
 from extras.utils import FeatureQuery
 from netbox.api import ChoiceField, ContentTypeField, SerializedPKRelatedField
 from netbox.api.exceptions import SerializerNotFound
@@ -375,8 +376,30 @@ class ReportSerializer(serializers.Serializer):
     result = NestedJobResultSerializer()
 
 
+class ReportResultSerializer(JobResultSerializer):
+    """
+    The JobResult of a report. Each logged message is represented as a list of its time, level, object, object URL, and
+    message.
+    """
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if instance.data:
+            log = get_report_log(instance.data)
+            data['data'] = {
+                test_name: {
+                    **results,
+                    'log': [
+                        [time, level, str(obj) if obj is not None else None, url, message]
+                        for time, level, obj, url, message in log[test_name]
+                    ]
+                }
+                for test_name, results in instance.data.items()
+            }
+        return data
+
+
 class ReportDetailSerializer(ReportSerializer):
-    result = JobResultSerializer()
+    result = ReportResultSerializer()
 
 
 #
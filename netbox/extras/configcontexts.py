@@ -0,0 +1,253 @@
+import copy
+import uuid
+from collections import OrderedDict, defaultdict
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
+
+from dcim.models import Region, Site, SiteGroup
+from extras.models import ConfigContext, ConfigContextModel, TaggedItem
+from extras.querysets import ConfigContextModelQuerySet
+from tenancy.models import Tenant
+from utilities.utils import deepmerge
+from virtualization.models import Cluster
+
+__all__ = (
+    'ConfigContextMatcher',
+    'get_config_context_models',
+    'get_queued_objects',
+    'refresh_config_context_data',
+)
+
+
+# Cache key for the version of ConfigContext assignments, shared by all NetBox processes
+CACHE_VERSION_KEY = 'config_contexts_version'
+
+# The ConfigContext fields by which assignments are made
+ASSIGNMENT_FIELDS = (
+    'regions',
+    'site_groups',
+    'sites',
+    'device_types',
+    'roles',
+    'platforms',
+    'cluster_types',
+    'cluster_groups',
+    'clusters',
+    'tenant_groups',
+    'tenants',
+    'tags',
+)
+
+
+class ConfigContextMatcher:
+    """
+    An in-memory index of all active ConfigContexts, mapping each assigned object to the ConfigContexts assigned to it.
+    Determining the ConfigContexts which apply to an object thus requires only set intersections, and the merged data
+    for each unique combination of ConfigContexts is compiled only once.
+    """
+    # Process-local cache of the matcher
+    _cache = None
+    _cache_version = None
+
+    def __init__(self):
+        self.data = {}
+        self.ordering = {}
+        for pk, weight, name, data in ConfigContext.objects.filter(is_active=True).values_list(
+            'pk', 'weight', 'name', 'data'
+        ):
+            self.data[pk] = data
+            self.ordering[pk] = (weight, name)
+
+        # Map the PK of each assigned object to its ConfigContexts, and record the ConfigContexts without any
+        # assignments, per field
+        self.assigned = {}
+        self.unassigned = {}
+        for field_name in ASSIGNMENT_FIELDS:
+            field = ConfigContext._meta.get_field(field_name)
+            assignments = field.remote_field.through.objects.filter(
+                **{f'{field.m2m_field_name()}__is_active': True}
+            ).values_list(f'{field.m2m_field_name()}_id', f'{field.m2m_reverse_field_name()}_id')
+            self.assigned[field_name] = defaultdict(set)
+            for context_id, object_id in assignments:
+                self.assigned[field_name][object_id].add(context_id)
+            self.unassigned[field_name] = set(self.data).difference(*self.assigned[field_name].values())
+
+        # Regions and site groups match all of their descendants
+        self.region_parents = dict(Region.objects.values_list('pk', 'parent_id'))
+        self.sitegroup_parents = dict(SiteGroup.objects.values_list('pk', 'parent_id'))
+
+        self._merged_data = {}
+
+    @classmethod
+    def get(cls):
+        """
+        Return a ConfigContextMatcher. The matcher is cached within the current process until ConfigContexts (or the
+        objects to which they are assigned) are modified by any NetBox process (see clear_cache()). Within a
+        transaction, a new matcher is built on each call, so it should be used to match objects in bulk.
+        """
+        # Bypass the cache within a transaction, as it may include uncommitted changes to ConfigContexts
+        if connection.in_atomic_block:
+            return cls()
+
+        version = cache.get(CACHE_VERSION_KEY)
+        if version is None:
+            version = uuid.uuid4().hex
+            cache.set(CACHE_VERSION_KEY, version, None)
+        if version != cls._cache_version or cls._cache is None:
+            ConfigContextMatcher._cache = cls()
+            ConfigContextMatcher._cache_version = version
+
+        return cls._cache
+
+    @staticmethod
+    def clear_cache():
+        """
+        Invalidate the cached matcher for all NetBox processes.
+        """
+        ConfigContextMatcher._cache = None
+        cache.set(CACHE_VERSION_KEY, uuid.uuid4().hex, None)
+
+    @staticmethod
+    def _get_ancestors(pk, parents):
+        ancestors = set()
+        while pk is not None:
+            ancestors.add(pk)
+            pk = parents.get(pk)
+        return ancestors
+
+    def match(self, **assignments):
+        """
+        Return the PKs of all ConfigContexts which apply to an object with the given assignments, ordered by weight
+        and name. Each assignment is specified as an iterable of PKs (e.g. `regions=[1, 2], tags=[]`).
+        """
+        matched = None
+        for field_name in ASSIGNMENT_FIELDS:
+            candidates = set(self.unassigned[field_name])
+            for pk in assignments.get(field_name, ()):
+                candidates.update(self.assigned[field_name].get(pk, ()))
+            matched = candidates if matched is None else matched & candidates
+            if not matched:
+                return ()
+
+        return tuple(sorted(matched, key=self.ordering.get))
+
+    def get_merged_data(self, context_ids):
+        """
+        Return the merged data of the given ConfigContexts, which must be ordered by weight and name. The data is
+        memoized, so a copy is returned which the caller may modify.
+        """
+        if context_ids not in self._merged_data:
+            data = OrderedDict()
+            for pk in context_ids:
+                data = deepmerge(data, self.data[pk])
+            self._merged_data[context_ids] = data
+
+        return copy.deepcopy(self._merged_data[context_ids])
+
+    def get_config_context_data(self, objects):
+        """
+        Return the merged data of the ConfigContexts which apply to each of the given devices or virtual machines (not
+        including any local context data), in the same order. Related sites, clusters, tenants, and tags are retrieved
+        in bulk.
+        """
+        objects = list(objects)
+        if not objects:
+            return []
+
+        clusters = {
+            pk: (type_id, group_id, site_id) for pk, type_id, group_id, site_id in Cluster.objects.filter(
+                pk__in={obj.cluster_id for obj in objects}
+            ).values_list('pk', 'type_id', 'group_id', 'site_id')
+        }
+
+        # The site of a virtual machine is determined by its cluster
+        site_ids = [
+            obj.site_id if hasattr(obj, 'site_id') else clusters.get(obj.cluster_id, (None, None, None))[2]
+            for obj in objects
+        ]
+        sites = {
+            pk: (region_id, group_id) for pk, region_id, group_id in Site.objects.filter(
+                pk__in=set(site_ids)
+            ).values_list('pk', 'region_id', 'group_id')
+        }
+        tenant_groups = dict(
+            Tenant.objects.filter(pk__in={obj.tenant_id for obj in objects}).values_list('pk', 'group_id')
+        )
+        tags = defaultdict(set)
+        tagged_items = TaggedItem.objects.filter(
+            content_type=ContentType.objects.get_for_model(objects[0]),
+            object_id__in=[obj.pk for obj in objects]
+        ).values_list('object_id', 'tag_id')
+        for object_id, tag_id in tagged_items:
+            tags[object_id].add(tag_id)
+
+        ret = []
+        for obj, site_id in zip(objects, site_ids):
+            region_id, sitegroup_id = sites.get(site_id, (None, None))
+            cluster_type_id, cluster_group_id, _ = clusters.get(obj.cluster_id, (None, None, None))
+            context_ids = self.match(
+                regions=self._get_ancestors(region_id, self.region_parents),
+                site_groups=self._get_ancestors(sitegroup_id, self.sitegroup_parents),
+                sites=[site_id],
+                # Device type assignment is relevant only for Devices
+                device_types=[getattr(obj, 'device_type_id', None)],
+                # `device_role` for Device; `role` for VirtualMachine
+                roles=[getattr(obj, 'device_role_id', None) or getattr(obj, 'role_id', None)],
+                platforms=[obj.platform_id],
+                cluster_types=[cluster_type_id],
+                cluster_groups=[cluster_group_id],
+                clusters=[obj.cluster_id],
+                tenant_groups=[tenant_groups.get(obj.tenant_id)],
+                tenants=[obj.tenant_id],
+                tags=tags[obj.pk]
+            )
+            ret.append(self.get_merged_data(context_ids))
+
+        return ret
+
+    def render(self, objects):
+        """
+        Return the rendered config context of each of the given devices or virtual machines, including any local
+        context data, in the same order.
+        """
+        objects = list(objects)
+        ret = []
+        for obj, data in zip(objects, self.get_config_context_data(objects)):
+            if obj.local_context_data:
+                data = deepmerge(data, obj.local_context_data)
+            ret.append(data)
+
+        return ret
+
+
+def get_config_context_models():
+    """
+    Return all models which support the precompilation of config context data.
+    """
+    return [
+        model for model in apps.get_models()
+        if issubclass(model, ConfigContextModel) and issubclass(model.objects._queryset_class, ConfigContextModelQuerySet)
+    ]
+
+
+def get_queued_objects(model, queue):
+    """
+    Return the objects of the given model affected by queued changes, given as a mapping of model labels to PKs.
+    Queued ConfigContexts are resolved to the objects to which they currently apply.
+    """
+    queryset = model.objects.filter(pk__in=queue.get(model._meta.label_lower, []))
+    if config_contexts := queue.get(ConfigContext._meta.label_lower):
+        queryset |= model.objects.filter_by_config_contexts(config_contexts)
+    return queryset
+
+
+def refresh_config_context_data(queue):
+    """
+    Recompile the config context data of all objects affected by queued changes (see get_queued_objects()). This is
+    run as a background job.
+    """
+    for model in get_config_context_models():
+        get_queued_objects(model, queue).refresh_config_contexts()
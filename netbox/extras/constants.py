@@ -1,6 +1,22 @@
 # Webhook content types
 HTTP_CONTENT_TYPE_JSON = 'application/json'
 
+# Approximate size (in characters) of each part of a streamed export template
+EXPORT_TEMPLATE_STREAM_BUFFER_SIZE = 65536
+
+# Maximum size (in bytes) of the rendered output of an export template held in memory before it is written to a
+# temporary file
+EXPORT_TEMPLATE_SPOOL_MAX_SIZE = 10485760
+
+# Name of the JobResults of background table exports
+TABLE_EXPORT_JOB_NAME = 'table_export'
+
+# Minimum interval (in seconds) between saves of the results of a running report
+REPORT_RESULTS_SAVE_INTERVAL = 5
+
+# Number of objects written at a time by the bulk operations of custom scripts
+SCRIPT_BULK_BATCH_SIZE = 1000
+
 # Registerable extras features
 EXTRAS_FEATURES = [
     'custom_fields',
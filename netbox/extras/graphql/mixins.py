@@ -1,8 +1,8 @@
 import graphene
-from django.contrib.contenttypes.models import ContentType
 from graphene.types.generic import GenericScalar
 
-from extras.models import ObjectChange
+from extras.models import ImageAttachment, JournalEntry, ObjectChange
+from netbox.graphql.loaders import ConfigContextLoader, GenericRelatedObjectsLoader, get_loader, load_related_objects
 
 __all__ = (
     'ChangelogMixin',
@@ -18,19 +18,22 @@ class ChangelogMixin:
     changelog = graphene.List('extras.graphql.types.ObjectChangeType')
 
     def resolve_changelog(self, info):
-        content_type = ContentType.objects.get_for_model(self)
-        object_changes = ObjectChange.objects.filter(
-            changed_object_type=content_type,
-            changed_object_id=self.pk
+        loader = get_loader(
+            info,
+            (type(self), 'changelog'),
+            GenericRelatedObjectsLoader,
+            ObjectChange.objects.restrict(info.context.user, 'view'),
+            ct_field='changed_object_type',
+            fk_field='changed_object_id'
         )
-        return object_changes.restrict(info.context.user, 'view')
+        return loader.load(self)
 
 
 class ConfigContextMixin:
     config_context = GenericScalar()
 
     def resolve_config_context(self, info):
-        return self.get_config_context()
+        return get_loader(info, (type(self), 'config_context'), ConfigContextLoader).load(self)
 
 
 class CustomFieldsMixin:
@@ -44,18 +47,20 @@ class ImageAttachmentsMixin:
     image_attachments = graphene.List('extras.graphql.types.ImageAttachmentType')
 
     def resolve_image_attachments(self, info):
-        return self.images.restrict(info.context.user, 'view')
+        return load_related_objects(self, info, 'images', ImageAttachment.objects.restrict(info.context.user, 'view'))
 
 
 class JournalEntriesMixin:
     journal_entries = graphene.List('extras.graphql.types.JournalEntryType')
 
     def resolve_journal_entries(self, info):
-        return self.journal_entries.restrict(info.context.user, 'view')
+        return load_related_objects(
+            self, info, 'journal_entries', JournalEntry.objects.restrict(info.context.user, 'view')
+        )
 
 
 class TagsMixin:
     tags = graphene.List('extras.graphql.types.TagType')
 
     def resolve_tags(self, info):
-        return self.tags.all()
+        return load_related_objects(self, info, 'tags')
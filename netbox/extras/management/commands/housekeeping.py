@@ -9,9 +9,11 @@ from django.db import DEFAULT_DB_ALIAS
 from django.utils import timezone
 from packaging import version
 
+from extras.constants import TABLE_EXPORT_JOB_NAME
 from extras.models import JobResult
 from extras.models import ObjectChange
 from netbox.config import Config
+from netbox.tables.export import get_export_file_name, get_export_storage
 
 
 class Command(BaseCommand):
@@ -81,6 +83,14 @@ class Command(BaseCommand):
                         ending=""
                     )
                     self.stdout.flush()
+                # Delete the files produced by expired table exports
+                export_storage = get_export_storage()
+                export_job_ids = JobResult.objects.filter(
+                    created__lt=cutoff,
+                    name=TABLE_EXPORT_JOB_NAME
+                ).values_list('job_id', flat=True)
+                for job_id in export_job_ids:
+                    export_storage.delete(get_export_file_name(job_id))
                 JobResult.objects.filter(created__lt=cutoff)._raw_delete(using=DEFAULT_DB_ALIAS)
                 if options['verbosity']:
                     self.stdout.write("Done.", self.style.SUCCESS)
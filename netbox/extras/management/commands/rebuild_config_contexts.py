@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from extras.configcontexts import get_config_context_models
+
+
+class Command(BaseCommand):
+    help = "Compile any missing config context data for devices and virtual machines"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force", action='store_true', dest='force',
+            help="Force recompilation of all existing config context data"
+        )
+
+    def handle(self, *model_names, **options):
+        for model in get_config_context_models():
+            queryset = model.objects.all()
+            if not options['force']:
+                queryset = queryset.filter(_config_context__isnull=True)
+            count = queryset.count()
+            if not count:
+                self.stdout.write(f'Found no missing {model._meta.verbose_name} config contexts; skipping')
+                continue
+            self.stdout.write(f'Compiling config contexts for {count} {model._meta.verbose_name_plural}...')
+            queryset.refresh_config_contexts()
+            self.stdout.write(self.style.SUCCESS(f'  Compiled {count} config contexts'))
+
+        self.stdout.write(self.style.SUCCESS('Finished.'))
@@ -0,0 +1,75 @@
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from extras.models import SearchIndexEntry
+from extras.models.search import create_trigram_indexes, get_search_index_models
+
+
+class Command(BaseCommand):
+    help = "Create any missing search index entries and trigram indexes, or rebuild the search index"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'args', metavar='app_label.ModelName', nargs='*',
+            help='One or more specific models (each prefixed with its app_label) to index',
+        )
+        parser.add_argument(
+            "--force", action='store_true', dest='force',
+            help="Rebuild all existing search index entries"
+        )
+
+    def _get_models(self, names):
+        """
+        Compile a list of models to be indexed. If no names are specified, all models included in the search index
+        will be returned.
+        """
+        if not names:
+            return get_search_index_models()
+
+        models = []
+        for name in names:
+            try:
+                model = apps.get_model(name)
+            except (LookupError, ValueError):
+                raise CommandError(f"Unknown model: {name}. Models must be specified in the form app_label.ModelName.")
+            if model not in get_search_index_models():
+                raise CommandError(f"Invalid model: {name} is not included in the search index")
+            models.append(model)
+
+        return models
+
+    def handle(self, *args, **options):
+        for model in self._get_models(args):
+            if options['force']:
+                self.stdout.write(f'Rebuilding the search index for {model._meta.verbose_name_plural}...')
+                with transaction.atomic():
+                    SearchIndexEntry.objects.filter(object_type=ContentType.objects.get_for_model(model)).delete()
+                    count = SearchIndexEntry.objects.update_index(model)
+                self.stdout.write(self.style.SUCCESS(f'  Indexed {count} {model._meta.verbose_name_plural}'))
+                continue
+
+            pk_list = list(model._base_manager.exclude(
+                pk__in=SearchIndexEntry.objects.filter(
+                    object_type=ContentType.objects.get_for_model(model)
+                ).values('object_id')
+            ).values_list('pk', flat=True))
+            count = len(pk_list)
+            if not count:
+                self.stdout.write(f'Found no missing {model._meta.verbose_name} search index entries; skipping')
+                continue
+            self.stdout.write(f'Indexing {count} {model._meta.verbose_name_plural}...')
+            SearchIndexEntry.objects.update_index(model, pk_list)
+            self.stdout.write(self.style.SUCCESS(f'  Indexed {count} {model._meta.verbose_name_plural}'))
+
+        # Create any missing trigram indexes (e.g. if the pg_trgm extension has been installed since migrating)
+        with connection.schema_editor() as schema_editor:
+            if create_trigram_indexes(apps, schema_editor):
+                self.stdout.write('Verified trigram indexes')
+            else:
+                self.stdout.write(self.style.WARNING(
+                    'The pg_trgm PostgreSQL extension is not available; substring searches will not be indexed.'
+                ))
+
+        self.stdout.write(self.style.SUCCESS('Finished.'))
@@ -0,0 +1,55 @@
+from django.db import migrations
+from django.db.backends.utils import truncate_name
+
+
+def get_indexed_tables(apps):
+    """
+    Return the tables of all models with at least one filterable custom field assigned.
+    """
+    CustomField = apps.get_model('extras', 'CustomField')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+
+    content_types = ContentType.objects.filter(
+        pk__in=CustomField.objects.exclude(filter_logic='disabled').values('content_types')
+    )
+    tables = []
+    for content_type in content_types:
+        try:
+            model = apps.get_model(content_type.app_label, content_type.model)
+        except LookupError:
+            continue
+        tables.append(model._meta.db_table)
+
+    return tables
+
+
+def create_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+    quote_name = connection.ops.quote_name
+    for table in get_indexed_tables(apps):
+        index_name = truncate_name(f'{table}_cf_data', connection.ops.max_name_length())
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {quote_name(index_name)} '
+            f'ON {quote_name(table)} USING gin (custom_field_data jsonb_path_ops)'
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    connection = schema_editor.connection
+    for table in get_indexed_tables(apps):
+        index_name = truncate_name(f'{table}_cf_data', connection.ops.max_name_length())
+        schema_editor.execute(f'DROP INDEX IF EXISTS {connection.ops.quote_name(index_name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('extras', '0073_journalentry_tags_custom_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=create_indexes,
+            reverse_code=drop_indexes
+        ),
+    ]
@@ -0,0 +1,134 @@
+from functools import reduce
+from operator import add
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models import F, Func, TextField, Value
+from django.db.models.functions import Cast, Lower
+import django.db.models.deletion
+
+# The search_fields of each indexed model at the time of this migration
+SEARCH_FIELDS = {
+    'circuits.circuit': {'cid': 'A', 'description': 'C', 'comments': 'D'},
+    'circuits.provider': {'name': 'A', 'account': 'B', 'noc_contact': 'D', 'admin_contact': 'D', 'comments': 'D'},
+    'circuits.providernetwork': {'name': 'A', 'service_id': 'B', 'description': 'C', 'comments': 'D'},
+    'dcim.cable': {'label': 'A'},
+    'dcim.consoleport': {'name': 'A', 'label': 'B', 'description': 'C'},
+    'dcim.consoleserverport': {'name': 'A', 'label': 'B', 'description': 'C'},
+    'dcim.device': {'name': 'A', 'serial': 'B', 'asset_tag': 'B', 'comments': 'D'},
+    'dcim.devicebay': {'name': 'A', 'label': 'B', 'description': 'C'},
+    'dcim.devicetype': {'model': 'A', 'part_number': 'B', 'comments': 'D'},
+    'dcim.frontport': {'name': 'A', 'label': 'B', 'description': 'C'},
+    'dcim.interface': {'name': 'A', 'label': 'B', 'description': 'C'},
+    'dcim.inventoryitem': {'name': 'A', 'part_id': 'B', 'serial': 'B', 'asset_tag': 'B', 'description': 'C'},
+    'dcim.location': {'name': 'A', 'description': 'C'},
+    'dcim.module': {'serial': 'B', 'asset_tag': 'B', 'comments': 'D'},
+    'dcim.modulebay': {'name': 'A', 'label': 'B', 'description': 'C'},
+    'dcim.moduletype': {'model': 'A', 'part_number': 'B', 'comments': 'D'},
+    'dcim.powerfeed': {'name': 'A', 'comments': 'D'},
+    'dcim.poweroutlet': {'name': 'A', 'label': 'B', 'description': 'C'},
+    'dcim.powerport': {'name': 'A', 'label': 'B', 'description': 'C'},
+    'dcim.rack': {'name': 'A', 'facility_id': 'B', 'serial': 'B', 'asset_tag': 'B', 'comments': 'D'},
+    'dcim.rearport': {'name': 'A', 'label': 'B', 'description': 'C'},
+    'dcim.site': {
+        'name': 'A', 'facility': 'B', 'description': 'C', 'physical_address': 'D', 'shipping_address': 'D',
+        'comments': 'D',
+    },
+    'dcim.virtualchassis': {'name': 'A', 'domain': 'B'},
+    'ipam.service': {'name': 'A', 'description': 'C'},
+    'ipam.vlan': {'name': 'A', 'description': 'C'},
+    'ipam.vrf': {'name': 'A', 'rd': 'A', 'description': 'C'},
+    'tenancy.contact': {
+        'name': 'A', 'title': 'B', 'phone': 'B', 'email': 'B', 'address': 'D', 'link': 'D', 'comments': 'D',
+    },
+    'tenancy.tenant': {'name': 'A', 'slug': 'A', 'description': 'C', 'comments': 'D'},
+    'virtualization.cluster': {'name': 'A', 'comments': 'D'},
+    'virtualization.virtualmachine': {'name': 'A', 'comments': 'D'},
+    'virtualization.vminterface': {'name': 'A', 'description': 'C'},
+    'wireless.wirelesslan': {'ssid': 'A', 'description': 'C'},
+    'wireless.wirelesslink': {'ssid': 'A', 'description': 'C'},
+}
+
+
+def populate_search_index(apps, schema_editor):
+    """
+    Index all existing objects, using a single query per model.
+    """
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    SearchIndexEntry = apps.get_model('extras', 'SearchIndexEntry')
+    db_alias = schema_editor.connection.alias
+    quote_name = schema_editor.connection.ops.quote_name
+    columns = ', '.join(
+        quote_name(SearchIndexEntry._meta.get_field(name).column)
+        for name in ('object_type', 'object_id', 'value', 'search_vector')
+    )
+
+    for label, fields in SEARCH_FIELDS.items():
+        model = apps.get_model(label)
+        queryset = model._base_manager.using(db_alias).order_by()
+        if not queryset.exists():
+            continue
+        object_type, _ = ContentType.objects.using(db_alias).get_or_create(
+            app_label=model._meta.app_label,
+            model=model._meta.model_name
+        )
+        queryset = queryset.annotate(
+            _object_type=Value(object_type.pk),
+            _object_id=F('pk'),
+            _value=Lower(Func(
+                Value('\n'),
+                *[Cast(field, output_field=TextField()) for field in fields],
+                function='CONCAT_WS',
+                output_field=TextField()
+            )),
+            _search_vector=reduce(add, [
+                SearchVector(field, weight=weight, config='simple') for field, weight in fields.items()
+            ])
+        ).values_list('_object_type', '_object_id', '_value', '_search_vector')
+        sql, params = queryset.query.sql_with_params()
+        schema_editor.execute(f'INSERT INTO {quote_name(SearchIndexEntry._meta.db_table)} ({columns}) {sql}', params)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('circuits', '0035_provider_asns'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('dcim', '0154_config_context_cache'),
+        ('extras', '0074_customfield_data_indexes'),
+        ('ipam', '0057_created_datetimefield'),
+        ('tenancy', '0007_contact_link'),
+        ('virtualization', '0030_config_context_cache'),
+        ('wireless', '0003_created_datetimefield'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndexEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('value', models.TextField()),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField()),
+                ('object_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name_plural': 'search index entries',
+                'ordering': ('object_type', 'object_id'),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='searchindexentry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='extras_sear_search__b95693_gin'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='searchindexentry',
+            unique_together={('object_type', 'object_id')},
+        ),
+        migrations.RunPython(
+            code=populate_search_index,
+            reverse_code=migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,94 @@
+from django.db import DatabaseError, migrations, transaction
+from django.db.backends.utils import truncate_name
+
+# Fields indexed using trigram indexes at the time of this migration (see TRIGRAM_INDEXED_FIELDS in
+# extras.models.search)
+TRIGRAM_INDEXED_FIELDS = (
+    # (model, field, case-insensitive)
+    ('extras.SearchIndexEntry', 'value', False),
+    ('dcim.InventoryItem', 'serial', True),
+    ('ipam.IPAddress', 'dns_name', True),
+    ('ipam.IPAddress', 'description', True),
+    ('ipam.IPRange', 'description', True),
+    ('ipam.Prefix', 'prefix', False),
+    ('ipam.Prefix', 'description', True),
+)
+
+
+def get_trigram_indexes(apps, connection):
+    """
+    Return the name, table, and indexed expression of each trigram index.
+    """
+    quote_name = connection.ops.quote_name
+    indexes = []
+    for model_name, field_name, case_insensitive in TRIGRAM_INDEXED_FIELDS:
+        model = apps.get_model(model_name)
+        column = model._meta.get_field(field_name).column
+        expression = f'{quote_name(column)}::text'
+        if case_insensitive:
+            expression = f'UPPER({expression})'
+        name = truncate_name(f'{model._meta.db_table}_{column}_trgm', connection.ops.max_name_length())
+        indexes.append((name, model._meta.db_table, expression))
+
+    return indexes
+
+
+def enable_trigram_extension(connection):
+    """
+    Enable the pg_trgm extension, if it is available and may be created by the database user. Returns True if the
+    extension is enabled.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT installed_version FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        row = cursor.fetchone()
+    if row is None:
+        return False
+    if row[0] is not None:
+        return True
+
+    try:
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    except DatabaseError:
+        return False
+    return True
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    Create the trigram indexes, if the pg_trgm extension is available.
+    """
+    connection = schema_editor.connection
+    if not enable_trigram_extension(connection):
+        return
+
+    quote_name = connection.ops.quote_name
+    for name, table, expression in get_trigram_indexes(apps, connection):
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {quote_name(name)} ON {quote_name(table)} USING gin ({expression} gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """
+    Drop all trigram indexes. (The pg_trgm extension is retained.)
+    """
+    connection = schema_editor.connection
+    for name, table, expression in get_trigram_indexes(apps, connection):
+        schema_editor.execute(f'DROP INDEX IF EXISTS {connection.ops.quote_name(name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dcim', '0154_config_context_cache'),
+        ('extras', '0075_searchindexentry'),
+        ('ipam', '0057_created_datetimefield'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            code=create_trigram_indexes,
+            reverse_code=drop_trigram_indexes
+        ),
+    ]
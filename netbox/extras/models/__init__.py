@@ -2,6 +2,7 @@ from .change_logging import ObjectChange
 from .configcontexts import ConfigContext, ConfigContextModel
 from .customfields import CustomField
 from .models import *
+from .search import SearchIndexEntry
 from .tags import Tag, TaggedItem
 
 __all__ = (
@@ -17,6 +18,7 @@ __all__ = (
     'ObjectChange',
     'Report',
     'Script',
+    'SearchIndexEntry',
     'Tag',
     'TaggedItem',
     'Webhook',
@@ -1,7 +1,7 @@
 from collections import OrderedDict
 
 from django.core.validators import ValidationError
-from django.db import models
+from django.db import connection, models
 from django.urls import reverse
 
 from extras.querysets import ConfigContextQuerySet
@@ -138,19 +138,34 @@ class ConfigContextModel(models.Model):
 
     def get_config_context(self):
         """
-        Return the rendered configuration context for a device or VM.
+        Return the rendered configuration context for a device or VM. If the precompiled context is not available (or
+        the model does not support precompilation), it will be compiled from all applicable ConfigContexts.
         """
+        if getattr(self, '_config_context', None) is not None:
+            return self._config_context
 
-        # Compile all config data, overwriting lower-weight values with higher-weight values where a collision occurs
-        data = OrderedDict()
+        return self.compile_config_context()
 
-        if not hasattr(self, 'config_context_data'):
-            # The annotation is not available, so we fall back to manually querying for the config context objects
-            config_context_data = ConfigContext.objects.get_for_object(self, aggregate_data=True)
-        else:
-            # The attribute may exist, but the annotated value could be None if there is no config context data
+    def compile_config_context(self):
+        """
+        Compile the configuration context for a device or VM from all applicable ConfigContexts and its local context
+        data.
+        """
+
+        if hasattr(self, 'config_context_data'):
+            # The annotated value could be None if there is no config context data
             config_context_data = self.config_context_data or []
+        elif connection.in_atomic_block:
+            # The cached matcher cannot be used within a transaction (see ConfigContextMatcher.get()), and building a
+            # new one for a single object is costly, so we fall back to querying for the config context objects
+            config_context_data = ConfigContext.objects.get_for_object(self, aggregate_data=True) or []
+        else:
+            # The annotation is not available, so we fall back to matching ConfigContexts in memory
+            from extras.configcontexts import ConfigContextMatcher
+            return ConfigContextMatcher.get().render([self])[0]
 
+        # Compile all config data, overwriting lower-weight values with higher-weight values where a collision occurs
+        data = OrderedDict()
         for context in config_context_data:
             data = deepmerge(data, context)
 
@@ -1,12 +1,18 @@
+import copy
 import re
+import time
+import uuid
+from collections import defaultdict
 from datetime import datetime, date
 
 import django_filters
 from django import forms
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import ArrayField
+from django.core.cache import cache
 from django.core.validators import RegexValidator, ValidationError
-from django.db import models
+from django.db import connection, models
+from django.db.backends.utils import truncate_name
 from django.urls import reverse
 from django.utils.html import escape
 from django.utils.safestring import mark_safe
@@ -27,12 +33,41 @@ from utilities.validators import validate_regex
 __all__ = (
     'CustomField',
     'CustomFieldManager',
+    'get_custom_field_data_index_name',
+    'sync_custom_field_indexes',
 )
 
 
+# Cache key for the version of CustomField definitions, shared by all NetBox processes
+CACHE_VERSION_KEY = 'custom_fields_version'
+
+# Minimum interval (in seconds) between checks of the shared version of cached CustomField definitions
+CUSTOM_FIELDS_VERSION_CHECK_INTERVAL = 1
+
+
+def get_custom_field_data_index_name(model):
+    """
+    Return the name of the GIN index on a model's custom field data.
+    """
+    return truncate_name(f'{model._meta.db_table}_cf_data', connection.ops.max_name_length())
+
+
+def sync_custom_field_indexes(content_type_ids):
+    """
+    Create or drop the custom field data indexes of the given content types (see CustomFieldManager.sync_indexes()).
+    This is run as a background job, as building an index on a large table may take some time.
+    """
+    CustomField.objects.sync_indexes(ContentType.objects.filter(pk__in=content_type_ids))
+
+
 class CustomFieldManager(models.Manager.from_queryset(RestrictedQuerySet)):
     use_in_migrations = True
 
+    # Process-local cache of CustomFields, keyed by ContentType ID
+    _cache = {}
+    _cache_version = None
+    _cache_version_checked = 0
+
     def get_for_model(self, model):
         """
         Return all CustomFields assigned to the given model.
@@ -40,6 +75,113 @@ class CustomFieldManager(models.Manager.from_queryset(RestrictedQuerySet)):
         content_type = ContentType.objects.get_for_model(model._meta.concrete_model)
         return self.get_queryset().filter(content_types=content_type)
 
+    def get_cached_for_model(self, model):
+        """
+        Return a list of all CustomFields assigned to the given model. Results are cached per content type within the
+        current process until CustomFields are modified by any NetBox process (see clear_cache()). The shared cache
+        version is checked at most once every CUSTOM_FIELDS_VERSION_CHECK_INTERVAL seconds.
+
+        Each call returns copies of the cached CustomField instances, so that changes to their attributes by one caller
+        are not seen by others.
+        """
+        content_type = ContentType.objects.get_for_model(model._meta.concrete_model)
+
+        # Bypass the cache within a transaction, as it may include uncommitted changes to CustomFields
+        if connection.in_atomic_block:
+            return list(self.get_for_model(model).select_related('object_type'))
+
+        now = time.monotonic()
+        if now - CustomFieldManager._cache_version_checked >= CUSTOM_FIELDS_VERSION_CHECK_INTERVAL:
+            version = cache.get(CACHE_VERSION_KEY)
+            if version is None:
+                version = uuid.uuid4().hex
+                cache.set(CACHE_VERSION_KEY, version, None)
+            if version != CustomFieldManager._cache_version:
+                CustomFieldManager._cache = {}
+                CustomFieldManager._cache_version = version
+            CustomFieldManager._cache_version_checked = now
+
+        custom_fields = self._cache.get(content_type.pk)
+        if custom_fields is None:
+            custom_fields = self._cache[content_type.pk] = list(
+                self.get_for_model(model).select_related('object_type')
+            )
+
+        return [copy.copy(cf) for cf in custom_fields]
+
+    def get_related_objects(self, model, data):
+        """
+        Retrieve all objects referenced by the object and multi-object custom fields assigned to a model, using a single
+        query per referenced model. Returns a dictionary mapping each referenced model to a dictionary of its instances
+        keyed by primary key, suitable for passing to CustomField.deserialize().
+
+        :param model: The model to which the custom field data belongs
+        :param data: An iterable of custom field data dictionaries (e.g. the `custom_field_data` of a list of objects)
+        """
+        custom_fields = [
+            cf for cf in self.get_cached_for_model(model)
+            if cf.type in (CustomFieldTypeChoices.TYPE_OBJECT, CustomFieldTypeChoices.TYPE_MULTIOBJECT)
+        ]
+        if not custom_fields:
+            return {}
+
+        # Collect the primary keys of all referenced objects, grouped by model
+        object_ids = defaultdict(set)
+        for custom_field_data in data:
+            for cf in custom_fields:
+                value = custom_field_data.get(cf.name)
+                if value is None:
+                    continue
+                if cf.type == CustomFieldTypeChoices.TYPE_OBJECT:
+                    object_ids[cf.object_type.model_class()].add(value)
+                else:
+                    object_ids[cf.object_type.model_class()].update(value)
+
+        return {
+            related_model: related_model.objects.in_bulk(list(pks))
+            for related_model, pks in object_ids.items() if related_model is not None
+        }
+
+    def sync_indexes(self, content_types):
+        """
+        Create or drop the GIN index on the custom field data of each given content type, depending on whether any
+        filterable CustomFields are assigned to it. Outside of a transaction, indexes are built and dropped
+        concurrently to avoid locking the table.
+        """
+        concurrently = '' if connection.in_atomic_block else ' CONCURRENTLY'
+        quote_name = connection.ops.quote_name
+
+        for content_type in content_types:
+            model = content_type.model_class()
+            if model is None:
+                continue
+            index_name = quote_name(get_custom_field_data_index_name(model))
+            filterable = self.filter(content_types=content_type).exclude(
+                filter_logic=CustomFieldFilterLogicChoices.FILTER_DISABLED
+            ).exists()
+
+            with connection.cursor() as cursor:
+                if filterable:
+                    # Drop any invalid index left by a failed concurrent build, which IF NOT EXISTS would otherwise skip
+                    cursor.execute('SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)', [index_name])
+                    row = cursor.fetchone()
+                    if row is not None and not row[0]:
+                        cursor.execute(f'DROP INDEX{concurrently} IF EXISTS {index_name}')
+                    cursor.execute(
+                        f'CREATE INDEX{concurrently} IF NOT EXISTS {index_name} '
+                        f'ON {quote_name(model._meta.db_table)} USING gin (custom_field_data jsonb_path_ops)'
+                    )
+                else:
+                    cursor.execute(f'DROP INDEX{concurrently} IF EXISTS {index_name}')
+
+    def clear_cache(self):
+        """
+        Invalidate the cached CustomFields within all NetBox processes.
+        """
+        CustomFieldManager._cache = {}
+        CustomFieldManager._cache_version = uuid.uuid4().hex
+        cache.set(CACHE_VERSION_KEY, CustomFieldManager._cache_version, None)
+
 
 class CustomField(ExportTemplatesMixin, WebhooksMixin, ChangeLoggedModel):
     content_types = models.ManyToManyField(
@@ -145,8 +287,9 @@ class CustomField(ExportTemplatesMixin, WebhooksMixin, ChangeLoggedModel):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        # Cache instance's original name so we can check later whether it has changed
+        # Cache instance's original name and filter logic so we can check later whether they have changed
         self._name = self.name
+        self._filter_logic = self.filter_logic
 
     def populate_initial_data(self, content_types):
         """
@@ -265,17 +408,26 @@ class CustomField(ExportTemplatesMixin, WebhooksMixin, ChangeLoggedModel):
             return [obj.pk for obj in value] or None
         return value
 
-    def deserialize(self, value):
+    def deserialize(self, value, related_objects=None):
         """
         Convert JSON data to a Python object suitable for the field type.
+
+        related_objects: A mapping of models to their instances by primary key, as returned by
+            CustomField.objects.get_related_objects(). If provided, object references will be resolved from this
+            mapping rather than from the database.
         """
         if value is None:
             return value
         if self.type == CustomFieldTypeChoices.TYPE_OBJECT:
             model = self.object_type.model_class()
+            if related_objects is not None:
+                return related_objects.get(model, {}).get(value)
             return model.objects.filter(pk=value).first()
         if self.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
             model = self.object_type.model_class()
+            if related_objects is not None:
+                objects = related_objects.get(model, {})
+                return [objects[pk] for pk in value if pk in objects]
             return model.objects.filter(pk__in=value)
         return value
 
@@ -384,7 +536,8 @@ class CustomField(ExportTemplatesMixin, WebhooksMixin, ChangeLoggedModel):
 
     def to_filter(self, lookup_expr=None):
         """
-        Return a django_filters Filter instance suitable for this field type.
+        Return a django_filters Filter instance suitable for this field type. Exact matches are expressed as JSON
+        containment queries, which can be served by the GIN index on the model's custom field data.
 
         :param lookup_expr: Custom lookup expression (optional)
         """
@@ -393,6 +546,7 @@ class CustomField(ExportTemplatesMixin, WebhooksMixin, ChangeLoggedModel):
         }
         if lookup_expr is not None:
             kwargs['lookup_expr'] = lookup_expr
+        exact = lookup_expr in (None, 'exact')
 
         # Text/URL
         if self.type in (
@@ -400,39 +554,45 @@ class CustomField(ExportTemplatesMixin, WebhooksMixin, ChangeLoggedModel):
                 CustomFieldTypeChoices.TYPE_LONGTEXT,
                 CustomFieldTypeChoices.TYPE_URL,
         ):
-            filter_class = filters.MultiValueCharFilter
             if self.filter_logic == CustomFieldFilterLogicChoices.FILTER_LOOSE:
+                filter_class = filters.MultiValueCharFilter
                 kwargs['lookup_expr'] = 'icontains'
+            elif exact:
+                filter_class = filters.JSONContainmentCharFilter
+            else:
+                filter_class = filters.MultiValueCharFilter
 
         # Integer
         elif self.type == CustomFieldTypeChoices.TYPE_INTEGER:
-            filter_class = filters.MultiValueNumberFilter
+            filter_class = filters.JSONContainmentNumberFilter if exact else filters.MultiValueNumberFilter
 
         # Boolean
         elif self.type == CustomFieldTypeChoices.TYPE_BOOLEAN:
-            filter_class = django_filters.BooleanFilter
+            filter_class = filters.JSONContainmentBooleanFilter if exact else django_filters.BooleanFilter
 
         # Date
         elif self.type == CustomFieldTypeChoices.TYPE_DATE:
-            filter_class = filters.MultiValueDateFilter
+            filter_class = filters.JSONContainmentDateFilter if exact else filters.MultiValueDateFilter
 
         # Select
         elif self.type == CustomFieldTypeChoices.TYPE_SELECT:
-            filter_class = filters.MultiValueCharFilter
+            filter_class = filters.JSONContainmentCharFilter if exact else filters.MultiValueCharFilter
 
         # Multiselect
         elif self.type == CustomFieldTypeChoices.TYPE_MULTISELECT:
-            filter_class = filters.MultiValueCharFilter
+            filter_class = filters.JSONContainmentCharFilter
             kwargs['lookup_expr'] = 'has_key'
+            kwargs['contains'] = True
 
         # Object
         elif self.type == CustomFieldTypeChoices.TYPE_OBJECT:
-            filter_class = filters.MultiValueNumberFilter
+            filter_class = filters.JSONContainmentNumberFilter if exact else filters.MultiValueNumberFilter
 
         # Multi-object
         elif self.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
-            filter_class = filters.MultiValueNumberFilter
+            filter_class = filters.JSONContainmentNumberFilter
             kwargs['lookup_expr'] = 'contains'
+            kwargs['contains'] = True
 
         # Unsupported custom field type
         else:
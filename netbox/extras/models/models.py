@@ -1,4 +1,5 @@
 import json
+import tempfile
 import uuid
 
 from django.contrib import admin
@@ -8,7 +9,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.validators import ValidationError
 from django.db import models
-from django.http import HttpResponse
+from django.http import FileResponse
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.formats import date_format
@@ -24,7 +25,7 @@ from netbox.models.features import (
     CustomFieldsMixin, CustomLinksMixin, ExportTemplatesMixin, JobResultsMixin, TagsMixin, WebhooksMixin,
 )
 from utilities.querysets import RestrictedQuerySet
-from utilities.utils import render_jinja2
+from utilities.utils import ChunkedQuerySet, compile_jinja2_template, render_jinja2
 
 __all__ = (
     'ConfigRevision',
@@ -327,15 +328,56 @@ class ExportTemplate(ExportTemplatesMixin, WebhooksMixin, ChangeLoggedModel):
 
         return output
 
+    def render_stream(self, queryset):
+        """
+        Render the contents of the template incrementally, yielding the output in parts. The queryset is retrieved in
+        chunks as the template iterates over it, so neither the complete result set nor the complete output is held
+        in memory.
+        """
+        context = {
+            'queryset': ChunkedQuerySet(queryset)
+        }
+        buffer = []
+        buffer_size = 0
+        for output in compile_jinja2_template(self.template_code).generate(**context):
+            buffer.append(output)
+            buffer_size += len(output)
+            if buffer_size < EXPORT_TEMPLATE_STREAM_BUFFER_SIZE:
+                continue
+
+            output = ''.join(buffer)
+            # Retain a trailing CR, which may begin a CRLF-style line terminator
+            if output.endswith('\r'):
+                output, buffer, buffer_size = output[:-1], ['\r'], 1
+            else:
+                buffer, buffer_size = [], 0
+            # Replace CRLF-style line terminators
+            if output:
+                yield output.replace('\r\n', '\n')
+
+        output = ''.join(buffer).replace('\r\n', '\n')
+        if output:
+            yield output
+
     def render_to_response(self, queryset):
         """
-        Render the template to an HTTP response, delivered as a named file attachment
+        Render the template to a streaming HTTP response, delivered as a named file attachment. The output is rendered
+        in full (to a temporary file, if large) before the response is returned, so that any rendering error is raised
+        here rather than truncating the response.
         """
-        output = self.render(queryset)
         mime_type = 'text/plain' if not self.mime_type else self.mime_type
 
+        output = tempfile.SpooledTemporaryFile(max_size=EXPORT_TEMPLATE_SPOOL_MAX_SIZE)
+        try:
+            for part in self.render_stream(queryset):
+                output.write(part.encode('utf-8'))
+        except Exception:
+            output.close()
+            raise
+        output.seek(0)
+
         # Build the response
-        response = HttpResponse(output, content_type=mime_type)
+        response = FileResponse(output, content_type=mime_type)
 
         if self.as_attachment:
             basename = queryset.model._meta.verbose_name_plural.replace(' ', '_')
@@ -0,0 +1,212 @@
+from functools import reduce
+from operator import add
+
+from django.apps import apps
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, SearchVectorField
+from django.db import DatabaseError, connection, models, transaction
+from django.db.backends.utils import truncate_name
+from django.db.models import F, Func, OuterRef, Q, Subquery, TextField, Value
+from django.db.models.functions import Cast, Lower
+
+__all__ = (
+    'SearchIndexEntry',
+    'create_trigram_indexes',
+    'get_search_index_models',
+)
+
+# The text search configuration used to compile search vectors and queries. Stemming and stop words are of little
+# use when searching names, serial numbers, and the like.
+SEARCH_CONFIG = 'simple'
+
+# Separates the values of individual fields, so that substrings spanning multiple fields do not match
+SEARCH_VALUE_SEPARATOR = '\n'
+
+# Fields which quick search filters match against substrings, indexed using trigram indexes where the pg_trgm extension
+# is available. Fields matched case-insensitively (i.e. using `icontains`) are indexed by their uppercase value, which
+# is what Django compares.
+TRIGRAM_INDEXED_FIELDS = (
+    # (model, field, case-insensitive)
+    ('extras.SearchIndexEntry', 'value', False),
+    ('dcim.InventoryItem', 'serial', True),
+    ('ipam.IPAddress', 'dns_name', True),
+    ('ipam.IPAddress', 'description', True),
+    ('ipam.IPRange', 'description', True),
+    ('ipam.Prefix', 'prefix', False),
+    ('ipam.Prefix', 'description', True),
+)
+
+
+def get_search_index_models():
+    """
+    Return all models which are included in the search index (i.e. which define `search_fields`).
+    """
+    return [model for model in apps.get_models() if getattr(model, 'search_fields', None)]
+
+
+def get_trigram_indexes(apps, connection):
+    """
+    Return the name, table, and indexed expression of each trigram index.
+    """
+    quote_name = connection.ops.quote_name
+    indexes = []
+    for model_name, field_name, case_insensitive in TRIGRAM_INDEXED_FIELDS:
+        model = apps.get_model(model_name)
+        column = model._meta.get_field(field_name).column
+        expression = f'{quote_name(column)}::text'
+        if case_insensitive:
+            expression = f'UPPER({expression})'
+        name = truncate_name(f'{model._meta.db_table}_{column}_trgm', connection.ops.max_name_length())
+        indexes.append((name, model._meta.db_table, expression))
+
+    return indexes
+
+
+def enable_trigram_extension(connection):
+    """
+    Enable the pg_trgm extension, if it is available and may be created by the database user. Returns True if the
+    extension is enabled.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT installed_version FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        row = cursor.fetchone()
+    if row is None:
+        return False
+    if row[0] is not None:
+        return True
+
+    try:
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    except DatabaseError:
+        return False
+    return True
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    Create any missing trigram indexes. Returns False (without creating any indexes) if the pg_trgm extension is not
+    available.
+    """
+    connection = schema_editor.connection
+    if not enable_trigram_extension(connection):
+        return False
+
+    quote_name = connection.ops.quote_name
+    for name, table, expression in get_trigram_indexes(apps, connection):
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {quote_name(name)} ON {quote_name(table)} USING gin ({expression} gin_trgm_ops)'
+        )
+    return True
+
+
+class SearchIndexQuerySet(models.QuerySet):
+
+    def search(self, value, model):
+        """
+        Return the IDs of all objects of the given model whose indexed fields contain the given value, or all of its
+        words.
+        """
+        return self.filter(
+            Q(object_type=ContentType.objects.get_for_model(model)),
+            Q(value__contains=value.lower()) | Q(search_vector=SearchQuery(value, config=SEARCH_CONFIG))
+        ).values('object_id')
+
+    def rank(self, queryset, value):
+        """
+        Order a QuerySet of indexed objects by the relevance of their search index entries to the given value, as
+        determined by the weights of the fields in which its words appear.
+        """
+        model = queryset.model
+        search_rank = self.filter(
+            object_type=ContentType.objects.get_for_model(model),
+            object_id=OuterRef('pk')
+        ).annotate(
+            rank=SearchRank(F('search_vector'), SearchQuery(value, config=SEARCH_CONFIG))
+        ).values('rank')[:1]
+
+        return queryset.annotate(
+            search_rank=Subquery(search_rank)
+        ).order_by(F('search_rank').desc(nulls_last=True), *model._meta.ordering)
+
+    def update_index(self, model, pk_list=None):
+        """
+        Create or update the search index entries for the specified objects (or all objects) of a model, using a
+        single query.
+        """
+        fields = model.search_fields
+        queryset = model._base_manager.order_by()
+        if pk_list is not None:
+            queryset = queryset.filter(pk__in=pk_list)
+        queryset = queryset.annotate(
+            _object_type=Value(ContentType.objects.get_for_model(model).pk),
+            _object_id=F('pk'),
+            _value=Lower(Func(
+                Value(SEARCH_VALUE_SEPARATOR),
+                *[Cast(field, output_field=TextField()) for field in fields],
+                function='CONCAT_WS',
+                output_field=TextField()
+            )),
+            _search_vector=reduce(add, [
+                SearchVector(field, weight=weight, config=SEARCH_CONFIG) for field, weight in fields.items()
+            ])
+        ).values_list('_object_type', '_object_id', '_value', '_search_vector')
+        sql, params = queryset.query.sql_with_params()
+
+        quote_name = connection.ops.quote_name
+        columns = [
+            quote_name(self.model._meta.get_field(name).column)
+            for name in ('object_type', 'object_id', 'value', 'search_vector')
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {quote_name(self.model._meta.db_table)} ({", ".join(columns)}) {sql} '
+                f'ON CONFLICT ({columns[0]}, {columns[1]}) DO UPDATE '
+                f'SET {columns[2]} = EXCLUDED.{columns[2]}, {columns[3]} = EXCLUDED.{columns[3]}',
+                params
+            )
+            return cursor.rowcount
+
+    def delete_index(self, model, pk_list):
+        """
+        Delete the search index entries for the specified objects of a model.
+        """
+        return self.filter(
+            object_type=ContentType.objects.get_for_model(model),
+            object_id__in=pk_list
+        ).delete()
+
+
+class SearchIndexEntry(models.Model):
+    """
+    The indexed text of an object included in the global search and quick search filters. Each entry stores the
+    values of the object's `search_fields` both as a single lowercase string, to match substrings, and as a weighted
+    search vector, to match words and rank the results.
+    """
+    object_type = models.ForeignKey(
+        to=ContentType,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    object_id = models.PositiveBigIntegerField()
+    object = GenericForeignKey(
+        ct_field='object_type',
+        fk_field='object_id'
+    )
+    value = models.TextField()
+    search_vector = SearchVectorField()
+
+    objects = SearchIndexQuerySet.as_manager()
+
+    class Meta:
+        ordering = ('object_type', 'object_id')
+        unique_together = ('object_type', 'object_id')
+        indexes = (
+            GinIndex(fields=('search_vector',)),
+        )
+        verbose_name_plural = 'search index entries'
+
+    def __str__(self):
+        return f'{self.object_type} {self.object_id}'
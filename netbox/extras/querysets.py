@@ -1,9 +1,10 @@
 from django.contrib.postgres.aggregates import JSONBAgg
-from django.db.models import OuterRef, Subquery, Q
+from django.db.models import Case, Exists, JSONField, OuterRef, Subquery, Q, When
 
 from extras.models.tags import TaggedItem
 from utilities.query_functions import EmptyGroupByJSONBAgg
 from utilities.querysets import RestrictedQuerySet
+from utilities.utils import chunked_queryset
 
 
 class ConfigContextQuerySet(RestrictedQuerySet):
@@ -73,19 +74,82 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
     """
     def annotate_config_context_data(self):
         """
-        Attach the subquery annotation to the base queryset
+        Attach the subquery annotation to the base queryset. The subquery is evaluated only for objects which have no
+        precompiled config context data.
         """
-        from extras.models import ConfigContext
         return self.annotate(
-            config_context_data=Subquery(
-                ConfigContext.objects.filter(
-                    self._get_config_context_filters()
-                ).annotate(
-                    _data=EmptyGroupByJSONBAgg('data', ordering=['weight', 'name'])
-                ).values("_data").order_by()
+            config_context_data=Case(
+                When(_config_context__isnull=True, then=self._get_config_context_subquery()),
+                output_field=JSONField()
             )
         ).distinct()
 
+    def filter_by_config_contexts(self, config_contexts):
+        """
+        Return only objects to which any of the given ConfigContexts (or their PKs) apply.
+        """
+        from extras.models import ConfigContext
+        return self.filter(
+            Exists(ConfigContext.objects.filter(self._get_config_context_filters(), pk__in=config_contexts))
+        )
+
+    def refresh_config_contexts(self, batch_size=1000):
+        """
+        Compile and store the rendered config context data for all objects in the queryset.
+        """
+        from extras.configcontexts import ConfigContextMatcher
+
+        # Build a new matcher, as the cached one may predate the changes which prompted the refresh
+        matcher = ConfigContextMatcher()
+
+        for instances in chunked_queryset(self.order_by('pk'), batch_size):
+            for instance, data in zip(instances, matcher.render(instances)):
+                instance._config_context = data
+            self.model.objects.bulk_update(instances, ['_config_context'])
+
+    def get_config_context_dependencies(self):
+        """
+        Return a mapping of related models (by label) to the lookup relating each to objects of this type. A change to
+        any of these objects may affect the config context data of its related objects.
+        """
+        dependencies = {
+            'dcim.platform': 'platform',
+            'extras.tag': 'tags',
+            'tenancy.tenant': 'tenant',
+            'tenancy.tenantgroup': 'tenant__group',
+            'virtualization.cluster': 'cluster',
+            'virtualization.clustergroup': 'cluster__group',
+            'virtualization.clustertype': 'cluster__type',
+        }
+
+        if self.model._meta.model_name == 'device':
+            dependencies.update({
+                'dcim.devicerole': 'device_role',
+                'dcim.region': 'site__region',
+                'dcim.site': 'site',
+                'dcim.sitegroup': 'site__group',
+            })
+
+        elif self.model._meta.model_name == 'virtualmachine':
+            dependencies.update({
+                'dcim.devicerole': 'role',
+                'dcim.region': 'cluster__site__region',
+                'dcim.site': 'cluster__site',
+                'dcim.sitegroup': 'cluster__site__group',
+            })
+
+        return dependencies
+
+    def _get_config_context_subquery(self):
+        from extras.models import ConfigContext
+        return Subquery(
+            ConfigContext.objects.filter(
+                self._get_config_context_filters()
+            ).annotate(
+                _data=EmptyGroupByJSONBAgg('data', ordering=['weight', 'name'])
+            ).values("_data").order_by()
+        )
+
     def _get_config_context_filters(self):
         # Construct the set of Q objects for the specific object types
         tag_query_filters = {
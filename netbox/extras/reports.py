@@ -1,16 +1,22 @@
-import importlib
 import inspect
 import logging
-import pkgutil
+import time
 import traceback
-from collections import OrderedDict
+from collections import Counter, OrderedDict, defaultdict
 
+import django_rq
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Model
 from django.utils import timezone
 from django_rq import job
+from rq.job import Dependency
 
 from .choices import JobResultStatusChoices, LogLevelChoices
+from .constants import REPORT_RESULTS_SAVE_INTERVAL
 from .models import JobResult
+from .utils import get_module, get_modules
 
 
 logger = logging.getLogger(__name__)
@@ -27,13 +33,8 @@ def get_report(module_name, report_name):
     """
     Return a specific report from within a module.
     """
-    file_path = '{}/{}.py'.format(settings.REPORTS_ROOT, module_name)
-
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    try:
-        spec.loader.exec_module(module)
-    except FileNotFoundError:
+    module = get_module(settings.REPORTS_ROOT, module_name)
+    if module is None:
         return None
 
     report = getattr(module, report_name, None)
@@ -56,9 +57,8 @@ def get_reports():
     module_list = []
 
     # Iterate through all modules within the reports path. These are the user-created files in which reports are
-    # defined.
-    for importer, module_name, _ in pkgutil.iter_modules([settings.REPORTS_ROOT]):
-        module = importer.find_module(module_name).load_module(module_name)
+    # defined. Modules are re-imported only when their files have changed.
+    for module_name, module in get_modules(settings.REPORTS_ROOT):
         report_order = getattr(module, "report_order", ())
         ordered_reports = [cls() for cls in report_order if is_report(cls)]
         unordered_reports = [cls() for _, cls in inspect.getmembers(module, is_report) if cls not in report_order]
@@ -67,6 +67,46 @@ def get_reports():
     return module_list
 
 
+def get_report_log(data):
+    """
+    Return the log messages of a report's results for display, mapped by test method to lists of (time, level, object,
+    URL, message) tuples. Logged objects are retrieved in bulk (one query per object type); objects which no longer
+    exist are represented by their type and ID. Messages logged in the legacy format (which stored each object's
+    representation and URL) are returned as they are.
+    """
+    # Retrieve all logged objects
+    object_ids = defaultdict(set)
+    for results in data.values():
+        for entry in results['log']:
+            if len(entry) == 6 and entry[2] is not None:
+                object_ids[entry[2]].add(entry[3])
+    objects = {}
+    for object_type_id, pk_list in object_ids.items():
+        model = ContentType.objects.get_for_id(object_type_id).model_class()
+        if model is not None:
+            for pk, obj in model.objects.in_bulk(pk_list).items():
+                objects[(object_type_id, pk)] = obj
+
+    log = {}
+    for test_name, results in data.items():
+        log[test_name] = []
+        for entry in results['log']:
+            if len(entry) != 6:
+                log[test_name].append(tuple(entry))
+                continue
+            time, level, object_type_id, object_id, obj, message = entry
+            url = None
+            if object_type_id is not None:
+                obj = objects.get((object_type_id, object_id))
+                if obj is None:
+                    obj = f'{ContentType.objects.get_for_id(object_type_id).name} {object_id} (deleted)'
+                elif hasattr(obj, 'get_absolute_url'):
+                    url = obj.get_absolute_url()
+            log[test_name].append((time, level, obj, url, message))
+
+    return log
+
+
 @job('default')
 def run_report(job_result, *args, **kwargs):
     """
@@ -85,6 +125,24 @@ def run_report(job_result, *args, **kwargs):
         logging.error(f"Error during execution of report {job_result.name}")
 
 
+def run_report_test(job_result, test_name, *args, **kwargs):
+    """
+    Run a single test method of a report whose tests are run in parallel (see Report.parallel).
+    """
+    module_name, report_name = job_result.name.split('.', 1)
+    report = get_report(module_name, report_name)
+    report.run_test(job_result, test_name)
+
+
+def finish_report(job_result, test_jobs=None, *args, **kwargs):
+    """
+    Record the final status of a report whose tests were run in parallel, once all of its tests have been run.
+    """
+    module_name, report_name = job_result.name.split('.', 1)
+    report = get_report(module_name, report_name)
+    report.finish(job_result, test_jobs)
+
+
 class Report(object):
     """
     NetBox users can extend this object to write custom reports to be used for validating data within NetBox. Each
@@ -103,18 +161,33 @@ class Report(object):
         'test_foo': {
             'failures': 0,
             'log': [
-                (<datetime>, <level>, <object>, <message>),
+                (<datetime>, <level>, <object type ID>, <object ID>, <object>, <message>),
                 ...
             ]
         }
     }
+
+    Objects which are NetBox models are logged by their content type and primary key, and are resolved for display by
+    get_report_log(). The string representations of any other objects are logged instead.
     """
     description = None
     job_timeout = None
+    parallel = False
+
+    # The maximum number of messages recorded by each test method (None for no limit)
+    log_limit = None
+
+    # The maximum number of success messages recorded by each test method (None for no limit), and the interval at
+    # which success messages are sampled (e.g. 10 to record every tenth success message)
+    log_success_limit = None
+    log_success_interval = 1
 
     def __init__(self):
 
         self._results = OrderedDict()
+        self._success_messages = Counter()
+        self._job_result = None
+        self._results_saved = None
         self.active_test = None
         self.failed = False
 
@@ -155,35 +228,78 @@ class Report(object):
     def full_name(self):
         return f'{self.module}.{self.class_name}'
 
-    def _log(self, obj, message, level=LogLevelChoices.LOG_DEFAULT):
+    def _log(self, obj, message, level=LogLevelChoices.LOG_DEFAULT, limit=True):
         """
         Log a message from a test method. Do not call this method directly; use one of the log_* wrappers below.
         """
         if level not in LogLevelChoices.values():
             raise Exception(f"Unknown logging level: {level}")
-        self._results[self.active_test]['log'].append((
-            timezone.now().isoformat(),
-            level,
-            str(obj) if obj else None,
-            obj.get_absolute_url() if hasattr(obj, 'get_absolute_url') else None,
-            message,
-        ))
+
+        log = self._results[self.active_test]['log']
+        if limit and self.log_limit is not None and len(log) >= self.log_limit:
+            return
+
+        if isinstance(obj, Model) and obj.pk is not None:
+            object_type_id, object_id, obj = ContentType.objects.get_for_model(obj).pk, obj.pk, None
+        else:
+            object_type_id = object_id = None
+            obj = str(obj) if obj else None
+        log.append((timezone.now().isoformat(), level, object_type_id, object_id, obj, message))
+
+    def _save_results(self, *test_names):
+        """
+        Save the current results of the specified test methods to the JobResult, retaining the results of any other
+        test methods saved by other workers.
+        """
+        with transaction.atomic():
+            data = JobResult.objects.select_for_update().values_list('data', flat=True).get(pk=self._job_result.pk)
+            data = data or {}
+            for test_name in test_names:
+                data[test_name] = self._results[test_name]
+            JobResult.objects.filter(pk=self._job_result.pk).update(data=data)
+
+        self._job_result.data = data
+        self._results_saved = time.monotonic()
+
+    def _save_progress(self):
+        """
+        Periodically save the results of the active test method while it runs, so that the report's progress is visible
+        before it completes.
+        """
+        if self._job_result is not None and time.monotonic() - self._results_saved >= REPORT_RESULTS_SAVE_INTERVAL:
+            self._save_results(self.active_test)
+
+    def _run_test(self, method_name):
+        """
+        Run a single test method and save its results.
+        """
+        self.active_test = method_name
+        self._results_saved = time.monotonic()
+        test_method = getattr(self, method_name)
+        test_method()
+        self._save_results(method_name)
 
     def log(self, message):
         """
         Log a message which is not associated with a particular object.
         """
         self._log(None, message, level=LogLevelChoices.LOG_DEFAULT)
-        self.logger.info(message)
+        self.logger.info("%s", message)
+        self._save_progress()
 
     def log_success(self, obj, message=None):
         """
         Record a successful test against an object. Logging a message is optional.
         """
         if message:
-            self._log(obj, message, level=LogLevelChoices.LOG_SUCCESS)
+            # Record only a sample of success messages, if configured
+            self._success_messages[self.active_test] += 1
+            sampled, remainder = divmod(self._success_messages[self.active_test] - 1, self.log_success_interval)
+            if not remainder and (self.log_success_limit is None or sampled < self.log_success_limit):
+                self._log(obj, message, level=LogLevelChoices.LOG_SUCCESS)
         self._results[self.active_test]['success'] += 1
-        self.logger.info(f"Success | {obj}: {message}")
+        self.logger.info("Success | %s: %s", obj, message)
+        self._save_progress()
 
     def log_info(self, obj, message):
         """
@@ -191,7 +307,8 @@ class Report(object):
         """
         self._log(obj, message, level=LogLevelChoices.LOG_INFO)
         self._results[self.active_test]['info'] += 1
-        self.logger.info(f"Info | {obj}: {message}")
+        self.logger.info("Info | %s: %s", obj, message)
+        self._save_progress()
 
     def log_warning(self, obj, message):
         """
@@ -199,7 +316,8 @@ class Report(object):
         """
         self._log(obj, message, level=LogLevelChoices.LOG_WARNING)
         self._results[self.active_test]['warning'] += 1
-        self.logger.info(f"Warning | {obj}: {message}")
+        self.logger.info("Warning | %s: %s", obj, message)
+        self._save_progress()
 
     def log_failure(self, obj, message):
         """
@@ -207,26 +325,41 @@ class Report(object):
         """
         self._log(obj, message, level=LogLevelChoices.LOG_FAILURE)
         self._results[self.active_test]['failure'] += 1
-        self.logger.info(f"Failure | {obj}: {message}")
+        self.logger.info("Failure | %s: %s", obj, message)
+        self.failed = True
+        self._save_progress()
+
+    def _log_error(self, message):
+        """
+        Log a failure recording an error which prevented the active test method from completing. Unlike other messages,
+        this is recorded regardless of the log limit.
+        """
+        self._log(None, message, level=LogLevelChoices.LOG_FAILURE, limit=False)
+        self._results[self.active_test]['failure'] += 1
         self.failed = True
 
     def run(self, job_result):
         """
-        Run the report and save its results. Each test method will be executed in order.
+        Run the report and save its results. Each test method will be executed in order, unless the report's tests are
+        run in parallel, in which case a background job is enqueued to run each test method.
         """
         self.logger.info(f"Running report")
+        self._job_result = job_result
         job_result.status = JobResultStatusChoices.STATUS_RUNNING
+        job_result.data = self._results
         job_result.save()
 
-        # Perform any post-run tasks
+        if self.parallel:
+            self._enqueue_tests(job_result)
+            return
+
+        # Perform any pre-run tasks
         self.pre_run()
 
         try:
 
             for method_name in self.test_methods:
-                self.active_test = method_name
-                test_method = getattr(self, method_name)
-                test_method()
+                self._run_test(method_name)
 
             if self.failed:
                 self.logger.warning("Report failed")
@@ -237,7 +370,7 @@ class Report(object):
 
         except Exception as e:
             stacktrace = traceback.format_exc()
-            self.log_failure(None, f"An exception occurred: {type(e).__name__}: {e} <pre>{stacktrace}</pre>")
+            self._log_error(f"An exception occurred: {type(e).__name__}: {e} <pre>{stacktrace}</pre>")
             logger.error(f"Exception raised during report execution: {e}")
             job_result.set_status(JobResultStatusChoices.STATUS_ERRORED)
 
@@ -248,6 +381,78 @@ class Report(object):
         # Perform any post-run tasks
         self.post_run()
 
+    def _enqueue_tests(self, job_result):
+        """
+        Enqueue a background job to run each test method, followed by a job to finish the report once all of the
+        test methods have been run (or their jobs have failed).
+        """
+        queue = django_rq.get_queue('default')
+        jobs = [
+            queue.enqueue(run_report_test, job_result=job_result, test_name=method_name, job_timeout=self.job_timeout)
+            for method_name in self.test_methods
+        ]
+        queue.enqueue(
+            finish_report,
+            job_result=job_result,
+            test_jobs={job.id: method_name for job, method_name in zip(jobs, self.test_methods)},
+            depends_on=Dependency(jobs=jobs, allow_failure=True)
+        )
+
+    def run_test(self, job_result, method_name):
+        """
+        Run a single test method of a report whose tests are run in parallel, and save its results. The report's
+        pre_run() method is called first, as each test method is run by a separate instance of the report. An
+        exception raised by either marks the report as errored.
+        """
+        self._job_result = job_result
+        self.active_test = method_name
+
+        try:
+            self.pre_run()
+            self._run_test(method_name)
+        except Exception as e:
+            stacktrace = traceback.format_exc()
+            self._log_error(f"An exception occurred: {type(e).__name__}: {e} <pre>{stacktrace}</pre>")
+            logger.error(f"Exception raised during report execution: {e}")
+            self._save_results(method_name)
+            JobResult.objects.filter(pk=job_result.pk).update(status=JobResultStatusChoices.STATUS_ERRORED)
+
+    def finish(self, job_result, test_jobs=None):
+        """
+        Record the final status of a report whose tests were run in parallel, once all of its test methods have been
+        run. `test_jobs` maps the ID of each test method's background job to the name of the method.
+        """
+        job_result.refresh_from_db()
+        self._results.update(job_result.data)
+
+        # A test method whose job failed (e.g. because it timed out or its worker was terminated) could not record
+        # its own error
+        errored = job_result.status == JobResultStatusChoices.STATUS_ERRORED
+        queue = django_rq.get_queue('default')
+        for job_id, method_name in (test_jobs or {}).items():
+            test_job = queue.fetch_job(job_id)
+            if test_job is not None and test_job.is_failed:
+                self.active_test = method_name
+                self._log_error("The test did not complete: its background job failed.")
+                logger.error(f"Background job for report test {self.full_name}.{method_name} failed")
+                errored = True
+        job_result.data = self._results
+        self.failed = any(results['failure'] for results in self._results.values())
+
+        if errored:
+            status = JobResultStatusChoices.STATUS_ERRORED
+        elif self.failed:
+            self.logger.warning("Report failed")
+            status = JobResultStatusChoices.STATUS_FAILED
+        else:
+            self.logger.info("Report completed successfully")
+            status = JobResultStatusChoices.STATUS_COMPLETED
+        job_result.set_status(status)
+        job_result.save()
+
+        # Perform any post-run tasks
+        self.post_run()
+
     def pre_run(self):
         """
         Extend this method to include any tasks which should execute *before* the report is run.
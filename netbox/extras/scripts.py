@@ -2,10 +2,7 @@ import inspect
 import json
 import logging
 import os
-import pkgutil
-import sys
 import traceback
-import threading
 from collections import OrderedDict
 
 import yaml
@@ -14,14 +11,21 @@ from django.conf import settings
 from django.core.validators import RegexValidator
 from django.db import transaction
 from django.utils.functional import classproperty
+from mptt.models import MPTTModel
 
+from dcim.models import Cable, Device, Module
 from extras.api.serializers import ScriptOutputSerializer
-from extras.choices import JobResultStatusChoices, LogLevelChoices
-from extras.signals import clear_webhooks
+from extras.choices import JobResultStatusChoices, LogLevelChoices, ObjectChangeActionChoices
+from extras.constants import SCRIPT_BULK_BATCH_SIZE
+from extras.signals import clear_webhooks, handle_bulk_changed_objects
+from extras.utils import get_modules, is_taggable
 from ipam.formfields import IPAddressFormField, IPNetworkFormField
 from ipam.validators import MaxPrefixLengthValidator, MinPrefixLengthValidator, prefix_validator
+from netbox.request_context import get_request
 from utilities.exceptions import AbortTransaction
+from utilities.fields import NaturalOrderingField
 from utilities.forms import add_blank_choice, DynamicModelChoiceField, DynamicModelMultipleChoiceField
+from utilities.utils import serialize_object
 from .context_managers import change_logging
 from .forms import ScriptForm
 
@@ -42,8 +46,6 @@ __all__ = [
     'TextVar',
 ]
 
-lock = threading.Lock()
-
 
 #
 # Script variables
@@ -371,6 +373,76 @@ class BaseScript:
         self.logger.log(logging.ERROR, message)
         self.log.append((LogLevelChoices.LOG_FAILURE, message))
 
+    # Bulk operations
+
+    def bulk_create(self, objs, batch_size=SCRIPT_BULK_BATCH_SIZE):
+        """
+        Create many objects of the same type, inserting them in batches. This is much faster than saving each object
+        individually, however the objects' save() methods are not called and the pre_save and post_save signals are not
+        sent. Changes are logged in bulk, and derived data (such as the prefix hierarchy) is updated once all changes
+        have been committed. Returns the created objects.
+
+        Objects whose save() methods create related objects (cables, devices, and modules) or maintain a tree
+        structure cannot be created in bulk.
+        """
+        objs = list(objs)
+        if not objs:
+            return objs
+
+        model = type(objs[0])
+        if issubclass(model, MPTTModel) or model in (Cable, Device, Module):
+            raise ValueError(f"{model._meta.verbose_name_plural.capitalize()} cannot be created in bulk")
+
+        for i in range(0, len(objs), batch_size):
+            batch = objs[i:i + batch_size]
+            model.objects.bulk_create(batch)
+            handle_bulk_changed_objects(batch, ObjectChangeActionChoices.ACTION_CREATE)
+
+        return objs
+
+    def bulk_update(self, objs, fields, batch_size=SCRIPT_BULK_BATCH_SIZE):
+        """
+        Save the specified fields of many objects of the same type, updating them in batches. As with bulk_create(),
+        the objects' save() methods are not called and the pre_save and post_save signals are not sent. Fields which are
+        otherwise computed on save (such as the naturalized form of a name, or the time of the last update) are updated
+        along with the fields on which they depend. Returns the number of objects updated.
+        """
+        objs = list(objs)
+        if not objs:
+            return 0
+
+        model = type(objs[0])
+        fields = list(fields)
+        computed_fields = [
+            field for field in model._meta.concrete_fields
+            if field.name not in fields and (
+                (isinstance(field, NaturalOrderingField) and field.target_field in fields) or
+                getattr(field, 'auto_now', False)
+            )
+        ]
+        fields.extend(field.name for field in computed_fields)
+
+        count = 0
+        for i in range(0, len(objs), batch_size):
+            batch = objs[i:i + batch_size]
+            for obj in batch:
+                for field in computed_fields:
+                    field.pre_save(obj, False)
+
+            # Record the current state of each object for change logging
+            if get_request() is not None:
+                queryset = model.objects.filter(pk__in=[obj.pk for obj in batch])
+                if is_taggable(batch[0]):
+                    queryset = queryset.prefetch_related('tags')
+                snapshots = {obj.pk: serialize_object(obj) for obj in queryset}
+                for obj in batch:
+                    obj._prechange_snapshot = snapshots.get(obj.pk)
+
+            count += model.objects.bulk_update(batch, fields)
+            handle_bulk_changed_objects(batch, ObjectChangeActionChoices.ACTION_UPDATE)
+
+        return count
+
     # Convenience functions
 
     def load_yaml(self, filename):
@@ -498,16 +570,8 @@ def get_scripts(use_names=False):
     """
     scripts = OrderedDict()
     # Iterate through all modules within the scripts path. These are the user-created files in which reports are
-    # defined.
-    for importer, module_name, _ in pkgutil.iter_modules([settings.SCRIPTS_ROOT]):
-        # Use a lock as removing and loading modules is not thread safe
-        with lock:
-            # Remove cached module to ensure consistency with filesystem
-            if module_name in sys.modules:
-                del sys.modules[module_name]
-
-            module = importer.find_module(module_name).load_module(module_name)
-
+    # defined. Modules are re-imported only when their files have changed.
+    for module_name, module in get_modules(settings.SCRIPTS_ROOT):
         if use_names and hasattr(module, 'name'):
             module_name = module.name
         module_scripts = OrderedDict()
@@ -1,19 +1,36 @@
 import importlib
 import logging
+from collections import defaultdict
 
+from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver, Signal
 from django_prometheus.models import model_deletes, model_inserts, model_updates
+from django_rq import get_queue
+from mptt.models import MPTTModel
 
 from extras.validators import CustomValidator
 from netbox import thread_locals
 from netbox.config import get_config
 from netbox.request_context import get_request
-from netbox.signals import post_clean
+from netbox.signals import post_bulk_save, post_clean
+from netbox.tables.export import get_export_file_name, get_export_storage
 from .choices import ObjectChangeActionChoices
-from .models import ConfigRevision, CustomField, ObjectChange
-from .webhooks import enqueue_object, get_snapshots, serialize_for_webhook
+from .constants import TABLE_EXPORT_JOB_NAME
+from .configcontexts import (
+    ConfigContextMatcher, get_config_context_models, get_queued_objects, refresh_config_context_data,
+)
+from .models import (
+    ConfigContext, ConfigRevision, CustomField, JobResult, ObjectChange, SearchIndexEntry,
+    TaggedItem,
+)
+from .models.customfields import sync_custom_field_indexes
+from .models.search import get_search_index_models
+from .utils import is_taggable
+from .webhooks import enqueue_object, enqueue_objects, get_snapshots, serialize_for_webhook
 
 #
 # Change logging/webhooks
@@ -108,6 +125,41 @@ def handle_deleted_object(sender, instance, **kwargs):
     model_deletes.labels(instance._meta.model_name).inc()
 
 
+def handle_bulk_changed_objects(instances, action):
+    """
+    Record ObjectChanges and enqueue webhooks for objects of the same type which have been created or updated in bulk
+    (i.e. without calling their save() methods). This has no effect unless change logging is enabled.
+    """
+    request = get_request()
+    instances = [instance for instance in instances if hasattr(instance, 'to_objectchange')]
+    if request is None or not instances:
+        return
+
+    # Retrieve the tags of all objects at once for their serialization
+    if is_taggable(instances[0]):
+        prefetch_related_objects(instances, 'tags')
+
+    # Record ObjectChanges
+    objectchanges = []
+    for instance in instances:
+        objectchange = instance.to_objectchange(action)
+        objectchange.user = request.user
+        objectchange.user_name = request.user.username
+        objectchange.request_id = request.id
+        objectchanges.append(objectchange)
+    ObjectChange.objects.bulk_create(objectchanges)
+
+    # Enqueue webhooks
+    enqueue_objects(thread_locals.webhook_queue, instances, request.user, request.id, action)
+
+    # Increment metric counters
+    model_name = instances[0]._meta.model_name
+    if action == ObjectChangeActionChoices.ACTION_CREATE:
+        model_inserts.labels(model_name).inc(len(instances))
+    elif action == ObjectChangeActionChoices.ACTION_UPDATE:
+        model_updates.labels(model_name).inc(len(instances))
+
+
 def clear_webhook_queue(sender, **kwargs):
     """
     Delete any queued webhooks (e.g. because of an aborted bulk transaction)
@@ -154,10 +206,309 @@ def handle_cf_deleted(instance, **kwargs):
     instance.remove_stale_data(instance.content_types.all())
 
 
+def enqueue_custom_field_index_sync(content_types):
+    """
+    Enqueue a background job to create or drop the custom field data indexes of the given ContentTypes once the
+    current transaction has been committed.
+    """
+    content_type_ids = [content_type.pk for content_type in content_types]
+    transaction.on_commit(lambda: get_queue('default').enqueue(sync_custom_field_indexes, content_type_ids))
+
+
+def handle_cf_obj_types_changed(instance, action, reverse, pk_set, **kwargs):
+    """
+    Create or drop custom field data indexes once a CustomField has been added to or removed from ContentTypes.
+    """
+    if action == 'pre_clear':
+        # Record the affected ContentTypes, as these are not provided upon post_clear
+        instance._cleared_content_types = [instance] if reverse else list(instance.content_types.all())
+    elif action == 'post_clear':
+        enqueue_custom_field_index_sync(instance._cleared_content_types)
+    elif action in ('post_add', 'post_remove'):
+        enqueue_custom_field_index_sync([instance] if reverse else ContentType.objects.filter(pk__in=pk_set))
+
+
+def handle_cf_filter_logic_changed(instance, created, **kwargs):
+    """
+    Create or drop custom field data indexes once the filter logic of a CustomField has changed.
+    """
+    if not created and instance.filter_logic != instance._filter_logic:
+        enqueue_custom_field_index_sync(instance.content_types.all())
+
+
+def handle_cf_index_deleted(instance, **kwargs):
+    """
+    Drop custom field data indexes which are no longer needed once a CustomField has been deleted.
+    """
+    enqueue_custom_field_index_sync(instance.content_types.all())
+
+
+def handle_cf_changed(action=None, **kwargs):
+    """
+    Invalidate cached CustomField definitions once a change to any CustomField has been committed.
+    """
+    # Ignore the pre_* signals sent for changes to a CustomField's content types
+    if action is not None and not action.startswith('post_'):
+        return
+
+    transaction.on_commit(CustomField.objects.clear_cache)
+
+
 post_save.connect(handle_cf_renamed, sender=CustomField)
 pre_delete.connect(handle_cf_deleted, sender=CustomField)
 m2m_changed.connect(handle_cf_added_obj_types, sender=CustomField.content_types.through)
 m2m_changed.connect(handle_cf_removed_obj_types, sender=CustomField.content_types.through)
+post_save.connect(handle_cf_filter_logic_changed, sender=CustomField)
+pre_delete.connect(handle_cf_index_deleted, sender=CustomField)
+m2m_changed.connect(handle_cf_obj_types_changed, sender=CustomField.content_types.through)
+post_save.connect(handle_cf_changed, sender=CustomField)
+post_delete.connect(handle_cf_changed, sender=CustomField)
+m2m_changed.connect(handle_cf_changed, sender=CustomField.content_types.through)
+
+
+#
+# Config contexts
+#
+
+# Fields of related objects which determine the ConfigContexts applicable to devices and virtual machines
+CONFIG_CONTEXT_DEPENDENCY_FIELDS = {
+    'dcim.region': ('parent',),
+    'dcim.site': ('region', 'group'),
+    'dcim.sitegroup': ('parent',),
+    'tenancy.tenant': ('group',),
+    'virtualization.cluster': ('type', 'group', 'site'),
+}
+
+
+def enqueue_config_context_refresh(model, pks):
+    """
+    Queue objects for the recompilation of their config context data. (Queuing a ConfigContext will recompile the
+    data of all objects to which it applies.)
+    """
+    if not hasattr(thread_locals, 'config_context_queue'):
+        thread_locals.config_context_queue = defaultdict(set)
+    thread_locals.config_context_queue[model].update(pks)
+
+
+def refresh_config_contexts():
+    """
+    Invalidate the precompiled config context data of all queued objects and enqueue a background job to recompile it.
+    (Until the job has run, the data of these objects is compiled on demand.) This should be called only once the
+    changes which prompted the refresh have been committed.
+    """
+    if not getattr(thread_locals, 'config_context_queue', None):
+        return
+    queue = {model._meta.label_lower: list(pks) for model, pks in thread_locals.config_context_queue.items()}
+    thread_locals.config_context_queue.clear()
+
+    for model in get_config_context_models():
+        get_queued_objects(model, queue).exclude(_config_context__isnull=True).update(_config_context=None)
+    get_queue('default').enqueue(refresh_config_context_data, queue)
+
+
+def enqueue_config_context_dependents(instance):
+    """
+    Queue all objects whose config context data depends on the given object.
+    """
+    label = instance._meta.label_lower
+    for model in get_config_context_models():
+        if lookup := model.objects.get_config_context_dependencies().get(label):
+            if isinstance(instance, MPTTModel):
+                queryset = model.objects.filter(**{f'{lookup}__in': instance.get_descendants(include_self=True)})
+            else:
+                queryset = model.objects.filter(**{lookup: instance})
+            enqueue_config_context_refresh(model, queryset.values_list('pk', flat=True))
+
+
+def handle_config_context_pre_change(instance, **kwargs):
+    """
+    Queue the objects to which a ConfigContext applies before it is modified or deleted.
+    """
+    if instance.pk and not getattr(instance, '_dependents_queued', False):
+        for model in get_config_context_models():
+            pks = model.objects.filter_by_config_contexts([instance.pk]).values_list('pk', flat=True)
+            enqueue_config_context_refresh(model, pks)
+        instance._dependents_queued = True
+
+
+def handle_config_context_changed(instance, **kwargs):
+    """
+    Recompile the config context data of all affected objects once a change to a ConfigContext has been committed.
+    """
+    def refresh():
+        instance._dependents_queued = False
+        refresh_config_contexts()
+
+    enqueue_config_context_refresh(ConfigContext, [instance.pk])
+    transaction.on_commit(refresh)
+
+
+def handle_config_context_assignments_changed(instance, action, **kwargs):
+    """
+    Queue the objects affected by a change to the assignments of a ConfigContext.
+    """
+    if action.startswith('pre_'):
+        handle_config_context_pre_change(instance)
+    else:
+        handle_config_context_changed(instance)
+
+
+def handle_config_context_model_pre_save(instance, raw=False, **kwargs):
+    """
+    Invalidate the precompiled config context data of a device or VM which is being saved.
+    """
+    if not raw:
+        instance._config_context = None
+
+
+def handle_config_context_model_changed(instance, raw=False, **kwargs):
+    """
+    Recompile the config context data of a device or VM once a change to it has been committed.
+    """
+    if not raw:
+        enqueue_config_context_refresh(type(instance), [instance.pk])
+        transaction.on_commit(refresh_config_contexts)
+
+
+def handle_config_context_model_tags_changed(instance, action, **kwargs):
+    """
+    Recompile the config context data of a device or VM once a change to its assigned tags has been committed.
+    """
+    if isinstance(instance, tuple(get_config_context_models())) and action in ('post_add', 'post_remove', 'post_clear'):
+        type(instance).objects.filter(pk=instance.pk).update(_config_context=None)
+        instance._config_context = None
+        enqueue_config_context_refresh(type(instance), [instance.pk])
+        transaction.on_commit(refresh_config_contexts)
+
+
+def handle_config_context_models_bulk_saved(sender, instances, fields=None, **kwargs):
+    """
+    Recompile the config context data of devices or VMs which have been created or modified in bulk once the changes
+    have been committed.
+    """
+    if fields is not None and not set(fields) - {'_config_context', 'custom_field_data'}:
+        return
+
+    pk_list = [instance.pk for instance in instances]
+    if fields is not None:
+        sender.objects.filter(pk__in=pk_list).update(_config_context=None)
+        for instance in instances:
+            instance._config_context = None
+    enqueue_config_context_refresh(sender, pk_list)
+    transaction.on_commit(refresh_config_contexts)
+
+
+def handle_config_context_dependency_pre_save(sender, instance, raw=False, **kwargs):
+    """
+    Determine whether a related object is being reassigned in a way which affects the applicable ConfigContexts.
+    """
+    if instance.pk and not raw:
+        fields = [
+            sender._meta.get_field(name).attname for name in CONFIG_CONTEXT_DEPENDENCY_FIELDS[sender._meta.label_lower]
+        ]
+        prev = sender.objects.filter(pk=instance.pk).values(*fields).first()
+        instance._config_context_changed = prev is not None and any(
+            prev[field] != getattr(instance, field) for field in fields
+        )
+
+
+def handle_config_context_dependency_changed(instance, **kwargs):
+    """
+    Recompile the config context data of all objects related to a reassigned object.
+    """
+    if getattr(instance, '_config_context_changed', False):
+        enqueue_config_context_dependents(instance)
+        transaction.on_commit(refresh_config_contexts)
+
+
+def handle_config_context_dependency_deleted(instance, **kwargs):
+    """
+    Recompile the config context data of all objects related to a deleted object.
+    """
+    enqueue_config_context_dependents(instance)
+    transaction.on_commit(refresh_config_contexts)
+
+
+def handle_config_context_matcher_changed(**kwargs):
+    """
+    Invalidate the cached ConfigContextMatcher once a change to any ConfigContext, its assignments, or the region and
+    site group hierarchies has been committed.
+    """
+    transaction.on_commit(ConfigContextMatcher.clear_cache)
+
+
+post_save.connect(handle_config_context_matcher_changed, sender=ConfigContext)
+post_delete.connect(handle_config_context_matcher_changed, sender=ConfigContext)
+for field in ConfigContext._meta.many_to_many:
+    m2m_changed.connect(handle_config_context_matcher_changed, sender=field.remote_field.through)
+    # Deleting an assigned object implicitly removes its assignments
+    post_delete.connect(handle_config_context_matcher_changed, sender=field.related_model)
+post_save.connect(handle_config_context_matcher_changed, sender=apps.get_model('dcim.Region'))
+post_save.connect(handle_config_context_matcher_changed, sender=apps.get_model('dcim.SiteGroup'))
+pre_save.connect(handle_config_context_pre_change, sender=ConfigContext)
+post_save.connect(handle_config_context_changed, sender=ConfigContext)
+pre_delete.connect(handle_config_context_pre_change, sender=ConfigContext)
+post_delete.connect(handle_config_context_changed, sender=ConfigContext)
+for field in ConfigContext._meta.many_to_many:
+    m2m_changed.connect(handle_config_context_assignments_changed, sender=field.remote_field.through)
+for model in get_config_context_models():
+    pre_save.connect(handle_config_context_model_pre_save, sender=model)
+    post_save.connect(handle_config_context_model_changed, sender=model)
+    post_bulk_save.connect(handle_config_context_models_bulk_saved, sender=model)
+m2m_changed.connect(handle_config_context_model_tags_changed, sender=TaggedItem)
+for label in CONFIG_CONTEXT_DEPENDENCY_FIELDS:
+    pre_save.connect(handle_config_context_dependency_pre_save, sender=apps.get_model(label))
+    post_save.connect(handle_config_context_dependency_changed, sender=apps.get_model(label))
+for label in set().union(*(model.objects.get_config_context_dependencies() for model in get_config_context_models())):
+    pre_delete.connect(handle_config_context_dependency_deleted, sender=apps.get_model(label))
+
+
+#
+# Search index
+#
+
+def handle_search_indexed_object_saved(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Update the search index entry of an object which has been created or modified.
+    """
+    if not raw and (update_fields is None or set(update_fields) & set(sender.search_fields)):
+        SearchIndexEntry.objects.update_index(sender, [instance.pk])
+
+
+def handle_search_indexed_objects_bulk_saved(sender, instances, fields=None, **kwargs):
+    """
+    Update the search index entries of objects which have been created or modified in bulk.
+    """
+    if fields is None or set(fields) & set(sender.search_fields):
+        if pk_list := [instance.pk for instance in instances if instance.pk is not None]:
+            SearchIndexEntry.objects.update_index(sender, pk_list)
+
+
+def handle_search_indexed_object_deleted(sender, instance, **kwargs):
+    """
+    Delete the search index entry of a deleted object.
+    """
+    SearchIndexEntry.objects.delete_index(sender, [instance.pk])
+
+
+for model in get_search_index_models():
+    post_save.connect(handle_search_indexed_object_saved, sender=model)
+    post_bulk_save.connect(handle_search_indexed_objects_bulk_saved, sender=model)
+    post_delete.connect(handle_search_indexed_object_deleted, sender=model)
+
+
+#
+# Table exports
+#
+
+@receiver(post_delete, sender=JobResult)
+def delete_export_file(instance, **kwargs):
+    """
+    Delete the file produced by a background table export when its JobResult is deleted.
+    """
+    if instance.name == TABLE_EXPORT_JOB_NAME:
+        name = get_export_file_name(instance.job_id)
+        transaction.on_commit(lambda: get_export_storage().delete(name))
 
 
 #
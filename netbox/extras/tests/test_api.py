@@ -1,4 +1,5 @@
 import datetime
+import uuid
 from unittest import skipIf
 
 from django.contrib.auth.models import User
@@ -12,6 +13,7 @@ from rq import Worker
 
 from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Rack, Location, RackRole, Site
 from extras.api.views import ReportViewSet, ScriptViewSet
+from extras.choices import JobResultStatusChoices
 from extras.models import *
 from extras.reports import Report
 from extras.scripts import BooleanVar, IntegerVar, Script, StringVar
@@ -240,6 +242,21 @@ class ExportTemplateTest(APIViewTestCases.APIViewTestCase):
         )
         ExportTemplate.objects.bulk_create(export_templates)
 
+    def test_render_export_template(self):
+        ExportTemplate.objects.create(
+            content_type=ContentType.objects.get_for_model(Site),
+            name='Site Export Template',
+            template_code='{% for obj in queryset %}{{ obj.name }}\n{% endfor %}'
+        )
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)])
+        self.add_permissions('dcim.view_site')
+
+        url = reverse('dcim-api:site-list')
+        response = self.client.get(f'{url}?export=Site Export Template', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(b''.join(response.streaming_content).decode(), 'Site 1\nSite 2\nSite 3\n')
+
 
 class TagTest(APIViewTestCases.APIViewTestCase):
     model = Tag
@@ -471,6 +488,26 @@ class ReportTest(APITestCase):
 
         self.assertEqual(response.data['name'], self.TestReport.__name__)
 
+    def test_get_report_result(self):
+        site = Site.objects.create(name='Site 1', slug='site-1')
+        report = self.TestReport()
+        report.active_test = 'test_foo'
+        report.log_failure(site, "Test failure")
+        JobResult.objects.create(
+            name=report.full_name,
+            obj_type=ContentType.objects.get(app_label='extras', model='report'),
+            status=JobResultStatusChoices.STATUS_FAILED,
+            data=report._results,
+            job_id=uuid.uuid4()
+        )
+
+        url = reverse('extras-api:report-detail', kwargs={'pk': None})
+        response = self.client.get(url, **self.header)
+
+        # Logged objects should be represented by their string representations and URLs
+        log = response.data['result']['data']['test_foo']['log']
+        self.assertEqual(log[0][1:], ['failure', 'Site 1', site.get_absolute_url(), "Test failure"])
+
     @skipIf(not rq_worker_running, "RQ worker not running")
     def test_run_report(self):
         self.add_permissions('extras.run_script')
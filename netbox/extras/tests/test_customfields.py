@@ -1,5 +1,8 @@
+from unittest.mock import patch
+
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.urls import reverse
 from rest_framework import status
 
@@ -8,6 +11,7 @@ from dcim.forms import SiteCSVForm
 from dcim.models import Manufacturer, Rack, Site
 from extras.choices import *
 from extras.models import CustomField
+from extras.models.customfields import get_custom_field_data_index_name
 from ipam.models import VLAN
 from utilities.testing import APITestCase, TestCase
 from virtualization.models import VirtualMachine
@@ -353,6 +357,189 @@ class CustomFieldManagerTest(TestCase):
         self.assertEqual(CustomField.objects.get_for_model(Site).count(), 1)
         self.assertEqual(CustomField.objects.get_for_model(VirtualMachine).count(), 0)
 
+    def test_get_cached_for_model(self):
+        # Simulate operation outside of a transaction to enable caching
+        with patch.object(connection, 'in_atomic_block', False):
+            CustomField.objects.clear_cache()
+            self.assertEqual(len(CustomField.objects.get_cached_for_model(Site)), 1)
+            with self.assertNumQueries(0):
+                self.assertEqual(len(CustomField.objects.get_cached_for_model(Site)), 1)
+
+            # Invalidating the cache should force the CustomFields to be retrieved again
+            CustomField.objects.clear_cache()
+            with self.assertNumQueries(1):
+                self.assertEqual(len(CustomField.objects.get_cached_for_model(Site)), 1)
+            self.assertEqual(len(CustomField.objects.get_cached_for_model(VirtualMachine)), 0)
+
+    def test_get_cached_for_model_copies(self):
+        with patch.object(connection, 'in_atomic_block', False):
+            CustomField.objects.clear_cache()
+            custom_field = CustomField.objects.get_cached_for_model(Site)[0]
+            custom_field.default = 'bar'
+            self.assertEqual(CustomField.objects.get_cached_for_model(Site)[0].default, 'foo')
+
+    def test_cache_version_check_interval(self):
+        with patch.object(connection, 'in_atomic_block', False):
+            CustomField.objects.clear_cache()
+            CustomField.objects.get_cached_for_model(Site)
+            with patch('extras.models.customfields.cache') as cache:
+                CustomField.objects.get_cached_for_model(Site)
+                cache.get.assert_not_called()
+                with patch('extras.models.customfields.CUSTOM_FIELDS_VERSION_CHECK_INTERVAL', 0):
+                    CustomField.objects.get_cached_for_model(Site)
+                cache.get.assert_called_once()
+
+    def test_content_types_changed(self):
+        custom_field = CustomField.objects.get(name='text_field')
+        with self.captureOnCommitCallbacks() as callbacks:
+            custom_field.content_types.add(ContentType.objects.get_for_model(VirtualMachine))
+        # The cache should be invalidated once (and the index synced once) per change
+        self.assertEqual(len(callbacks), 2)
+
+    def test_cache_invalidated_on_change(self):
+        with patch.object(connection, 'in_atomic_block', False):
+            CustomField.objects.clear_cache()
+            self.assertEqual(len(CustomField.objects.get_cached_for_model(VirtualMachine)), 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            custom_field = CustomField(type=CustomFieldTypeChoices.TYPE_TEXT, name='text_field2')
+            custom_field.save()
+            custom_field.content_types.set([ContentType.objects.get_for_model(VirtualMachine)])
+        with patch.object(connection, 'in_atomic_block', False):
+            self.assertEqual(len(CustomField.objects.get_cached_for_model(VirtualMachine)), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            custom_field.delete()
+        with patch.object(connection, 'in_atomic_block', False):
+            self.assertEqual(len(CustomField.objects.get_cached_for_model(VirtualMachine)), 0)
+
+    def test_get_related_objects(self):
+        vlans = (
+            VLAN(name='VLAN 1', vid=1),
+            VLAN(name='VLAN 2', vid=2),
+            VLAN(name='VLAN 3', vid=3),
+        )
+        VLAN.objects.bulk_create(vlans)
+        vlan_type = ContentType.objects.get_for_model(VLAN)
+        site_type = ContentType.objects.get_for_model(Site)
+        custom_fields = (
+            CustomField(type=CustomFieldTypeChoices.TYPE_OBJECT, name='object_field', object_type=vlan_type),
+            CustomField(type=CustomFieldTypeChoices.TYPE_MULTIOBJECT, name='multiobject_field', object_type=vlan_type),
+        )
+        for cf in custom_fields:
+            cf.save()
+            cf.content_types.set([site_type])
+        data = (
+            {'object_field': vlans[0].pk, 'multiobject_field': [vlans[1].pk, vlans[2].pk]},
+            {'object_field': vlans[1].pk, 'multiobject_field': None},
+            {'object_field': None, 'multiobject_field': [vlans[0].pk]},
+        )
+
+        # All referenced VLANs should be retrieved with a single query
+        with self.assertNumQueries(2):
+            related_objects = CustomField.objects.get_related_objects(Site, data)
+        self.assertEqual(related_objects, {VLAN: {vlan.pk: vlan for vlan in vlans}})
+
+        with self.assertNumQueries(0):
+            self.assertEqual(custom_fields[0].deserialize(data[1]['object_field'], related_objects), vlans[1])
+            self.assertEqual(
+                custom_fields[1].deserialize(data[0]['multiobject_field'], related_objects),
+                [vlans[1], vlans[2]]
+            )
+            self.assertIsNone(custom_fields[1].deserialize(data[1]['multiobject_field'], related_objects))
+
+        # Models without object custom fields require no queries
+        with self.assertNumQueries(1):
+            self.assertEqual(CustomField.objects.get_related_objects(VirtualMachine, data), {})
+
+
+class CustomFieldIndexTest(TestCase):
+
+    def setUp(self):
+        # Run the background jobs which sync indexes immediately
+        patcher = patch('extras.signals.get_queue')
+        get_queue = patcher.start()
+        get_queue.return_value.enqueue.side_effect = lambda func, *args, **kwargs: func(*args, **kwargs)
+        self.addCleanup(patcher.stop)
+
+    def assertIndexExists(self, model, exists=True):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+        index_name = get_custom_field_data_index_name(model)
+        if exists:
+            self.assertIn(index_name, constraints)
+            self.assertEqual(constraints[index_name]['type'], 'gin')
+        else:
+            self.assertNotIn(index_name, constraints)
+
+    def test_sync_indexes(self):
+        site_type = ContentType.objects.get_for_model(Site)
+        vm_type = ContentType.objects.get_for_model(VirtualMachine)
+
+        # Assigning a filterable CustomField should create the index
+        with self.captureOnCommitCallbacks(execute=True):
+            custom_field = CustomField(type=CustomFieldTypeChoices.TYPE_TEXT, name='text_field')
+            custom_field.save()
+            custom_field.content_types.set([site_type, vm_type])
+        self.assertIndexExists(Site)
+        self.assertIndexExists(VirtualMachine)
+
+        # Removing the CustomField from a model should drop its index
+        with self.captureOnCommitCallbacks(execute=True):
+            custom_field.content_types.remove(vm_type)
+        self.assertIndexExists(Site)
+        self.assertIndexExists(VirtualMachine, exists=False)
+
+        # Disabling filtering should drop the index
+        with self.captureOnCommitCallbacks(execute=True):
+            custom_field.filter_logic = CustomFieldFilterLogicChoices.FILTER_DISABLED
+            custom_field.save()
+        self.assertIndexExists(Site, exists=False)
+
+        # Re-enabling filtering should restore the index
+        custom_field = CustomField.objects.get(pk=custom_field.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            custom_field.filter_logic = CustomFieldFilterLogicChoices.FILTER_EXACT
+            custom_field.save()
+        self.assertIndexExists(Site)
+
+        # Clearing the CustomField's content types should drop the index
+        with self.captureOnCommitCallbacks(execute=True):
+            custom_field.content_types.clear()
+        self.assertIndexExists(Site, exists=False)
+
+        # Deleting the CustomField should drop the index
+        with self.captureOnCommitCallbacks(execute=True):
+            custom_field.content_types.set([site_type])
+        self.assertIndexExists(Site)
+        with self.captureOnCommitCallbacks(execute=True):
+            custom_field.delete()
+        self.assertIndexExists(Site, exists=False)
+
+    def test_sync_invalid_index(self):
+        site_type = ContentType.objects.get_for_model(Site)
+        with self.captureOnCommitCallbacks(execute=True):
+            custom_field = CustomField(type=CustomFieldTypeChoices.TYPE_TEXT, name='text_field')
+            custom_field.save()
+            custom_field.content_types.set([site_type])
+
+        # Simulate an invalid index left by a failed concurrent build
+        index_name = get_custom_field_data_index_name(Site)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'UPDATE pg_index SET indisvalid = false WHERE indexrelid = to_regclass(%s)',
+                [connection.ops.quote_name(index_name)]
+            )
+
+        # The invalid index should be rebuilt
+        CustomField.objects.sync_indexes([site_type])
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(%s)',
+                [connection.ops.quote_name(index_name)]
+            )
+            self.assertTrue(cursor.fetchone()[0])
+
 
 class CustomFieldAPITest(APITestCase):
 
@@ -510,6 +697,25 @@ class CustomFieldAPITest(APITestCase):
             site2_cfvs['multiobject_field']
         )
 
+    def test_get_multiple_objects_with_custom_field_data(self):
+        """
+        Validate that object custom field values are resolved correctly for a list of objects.
+        """
+        site2_cfvs = Site.objects.get(name='Site 2').custom_field_data
+        url = reverse('dcim-api:site-list')
+        self.add_permissions('dcim.view_site')
+
+        response = self.client.get(url, **self.header)
+        self.assertEqual(response.data['count'], 2)
+        site1_data, site2_data = sorted(response.data['results'], key=lambda site: site['name'])
+        self.assertIsNone(site1_data['custom_fields']['object_field'])
+        self.assertIsNone(site1_data['custom_fields']['multiobject_field'])
+        self.assertEqual(site2_data['custom_fields']['object_field']['id'], site2_cfvs['object_field'])
+        self.assertEqual(
+            [obj['id'] for obj in site2_data['custom_fields']['multiobject_field']],
+            site2_cfvs['multiobject_field']
+        )
+
     def test_create_single_object_with_defaults(self):
         """
         Create a new site with no specified custom field values and check that it received the default values.
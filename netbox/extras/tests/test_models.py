@@ -1,8 +1,14 @@
+from unittest.mock import patch
+
+from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
+from jinja2.exceptions import UndefinedError
 
 from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Platform, Region, Site, SiteGroup
-from extras.models import ConfigContext, Tag
+from extras.configcontexts import ConfigContextMatcher
+from extras.models import ConfigContext, ExportTemplate, Tag
 from tenancy.models import Tenant, TenantGroup
+from utilities.testing import outside_transaction
 from virtualization.models import Cluster, ClusterGroup, ClusterType, VirtualMachine
 
 
@@ -15,6 +21,69 @@ class TagTest(TestCase):
         self.assertEqual(tag.slug, 'testing-unicode-台灣')
 
 
+class ExportTemplateTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 6)])
+
+    def get_export_template(self, template_code):
+        return ExportTemplate(
+            name='Export Template 1',
+            content_type=ContentType.objects.get_for_model(Site),
+            template_code=template_code
+        )
+
+    def render(self, export_template, queryset):
+        response = export_template.render_to_response(queryset)
+        return b''.join(response.streaming_content).decode()
+
+    def test_render_to_response(self):
+        Site.objects.filter(name='Site 1').update(comments='Line 1\r\nLine 2')
+        export_template = self.get_export_template(
+            '{{ queryset|length }} sites\n{% for site in queryset %}{{ site.name }} {{ site.comments }}\n{% endfor %}'
+        )
+        response = export_template.render_to_response(Site.objects.all())
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/plain')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="netbox_sites"')
+        self.assertEqual(
+            b''.join(response.streaming_content).decode(),
+            '5 sites\nSite 1 Line 1\nLine 2\nSite 2 \nSite 3 \nSite 4 \nSite 5 \n'
+        )
+
+    @patch('extras.models.models.EXPORT_TEMPLATE_STREAM_BUFFER_SIZE', 1)
+    def test_render_to_response_buffered(self):
+        # CRLF-style line terminators should be replaced even if they span the parts of the streamed output
+        Site.objects.filter(name='Site 1').update(description='Line 1\r', comments='\nLine 2')
+        export_template = self.get_export_template('{% for site in queryset %}{{ site.description }}{{ site.comments }}{% endfor %}')
+        self.assertEqual(self.render(export_template, Site.objects.filter(name='Site 1')), 'Line 1\nLine 2')
+
+    def test_render_to_response_chunked(self):
+        export_template = self.get_export_template('{% for site in queryset %}{{ site.name }},{% endfor %}')
+        queryset = Site.objects.prefetch_related('tags')
+
+        # Objects should be retrieved in chunks (from a single cursor), with prefetches applied to each chunk
+        with patch('utilities.utils.ChunkedQuerySet.__init__.__defaults__', (2,)):
+            with self.assertNumQueries(4):
+                output = self.render(export_template, queryset)
+        self.assertEqual(output, 'Site 1,Site 2,Site 3,Site 4,Site 5,')
+
+    def test_render_to_response_error(self):
+        export_template = self.get_export_template('{% for site in queryset %}{{ site.foo.bar }}{% endfor %}')
+        with self.assertRaises(UndefinedError):
+            export_template.render_to_response(Site.objects.all())
+
+    @patch('extras.models.models.EXPORT_TEMPLATE_STREAM_BUFFER_SIZE', 1)
+    def test_render_to_response_error_after_first_part(self):
+        # Errors raised after the first part of the output has been rendered should not truncate the response
+        export_template = self.get_export_template(
+            '{% for site in queryset %}{{ site.name }}{% if loop.last %}{{ site.foo.bar }}{% endif %}{% endfor %}'
+        )
+        with self.assertRaises(UndefinedError):
+            export_template.render_to_response(Site.objects.all())
+
+
 class ConfigContextTest(TestCase):
     """
     These test cases deal with the weighting, ordering, and deep merge logic of config context data.
@@ -378,3 +447,231 @@ class ConfigContextTest(TestCase):
         annotated_queryset = Device.objects.filter(name=device.name).annotate_config_context_data()
         self.assertEqual(ConfigContext.objects.get_for_object(device).count(), 2)
         self.assertEqual(device.get_config_context(), annotated_queryset[0].get_config_context())
+
+
+class ConfigContextCacheTest(TestCase):
+    """
+    Test the precompilation of config context data for devices and virtual machines.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        manufacturer = Manufacturer.objects.create(name='Manufacturer 1', slug='manufacturer-1')
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Device Type 1', slug='device-type-1')
+        device_role = DeviceRole.objects.create(name='Device Role 1', slug='device-role-1')
+        cls.regions = (
+            Region.objects.create(name='Region 1', slug='region-1'),
+            Region.objects.create(name='Region 2', slug='region-2'),
+        )
+        cls.site = Site.objects.create(name='Site 1', slug='site-1', region=cls.regions[0])
+        cls.tag = Tag.objects.create(name='Tag 1', slug='tag-1')
+        cls.device = Device.objects.create(
+            name='Device 1', device_type=device_type, device_role=device_role, site=cls.site
+        )
+        cluster_type = ClusterType.objects.create(name='Cluster Type 1', slug='cluster-type-1')
+        cluster = Cluster.objects.create(name='Cluster 1', type=cluster_type, site=cls.site)
+        cls.virtual_machine = VirtualMachine.objects.create(name='Virtual Machine 1', cluster=cluster)
+
+    def setUp(self):
+        # Run background jobs immediately
+        patcher = patch('extras.signals.get_queue')
+        self.get_queue = patcher.start()
+        self.get_queue.return_value.enqueue.side_effect = lambda func, *args, **kwargs: func(*args, **kwargs)
+        self.addCleanup(patcher.stop)
+
+    def assertConfigContext(self, instance, data):
+        instance.refresh_from_db()
+        self.assertEqual(instance._config_context, data)
+        self.assertEqual(instance.get_config_context(), data)
+
+    def test_config_context_changed(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context = ConfigContext.objects.create(name='Config Context 1', data={'a': 1})
+            config_context.regions.set([self.regions[0]])
+        self.assertConfigContext(self.device, {'a': 1})
+        self.assertConfigContext(self.virtual_machine, {'a': 1})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.data = {'a': 2}
+            config_context.save()
+        self.assertConfigContext(self.device, {'a': 2})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.regions.set([self.regions[1]])
+        self.assertConfigContext(self.device, {})
+        self.assertConfigContext(self.virtual_machine, {})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.regions.clear()
+        self.assertConfigContext(self.device, {'a': 2})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.delete()
+        self.assertConfigContext(self.device, {})
+
+    def test_local_context_data_changed(self):
+        ConfigContext.objects.create(name='Config Context 1', data={'a': 1, 'b': 1})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.device.local_context_data = {'b': 2}
+            self.device.save()
+        self.assertConfigContext(self.device, {'a': 1, 'b': 2})
+
+    def test_tags_changed(self):
+        config_context = ConfigContext.objects.create(name='Config Context 1', data={'a': 1})
+        config_context.tags.set([self.tag])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.device.tags.add(self.tag)
+        self.assertConfigContext(self.device, {'a': 1})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.device.tags.remove(self.tag)
+        self.assertConfigContext(self.device, {})
+
+    def test_dependency_changed(self):
+        config_context = ConfigContext.objects.create(name='Config Context 1', data={'a': 1})
+        config_context.regions.set([self.regions[1]])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.site.region = self.regions[1]
+            self.site.save()
+        self.assertConfigContext(self.device, {'a': 1})
+        self.assertConfigContext(self.virtual_machine, {'a': 1})
+
+        # Deleting the Site's Region nullifies the assignment
+        config_context.regions.add(self.regions[0])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.regions[1].delete()
+        self.assertConfigContext(self.device, {})
+
+    def test_invalidated_until_recompiled(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context = ConfigContext.objects.create(name='Config Context 1', data={'a': 1})
+        self.assertConfigContext(self.device, {'a': 1})
+
+        # The stale data is discarded once the change is committed, before the background job has run
+        self.get_queue.return_value.enqueue.reset_mock(side_effect=True)
+        with self.captureOnCommitCallbacks(execute=True):
+            config_context.data = {'a': 2}
+            config_context.save()
+        self.get_queue.return_value.enqueue.assert_called_once()
+        self.device.refresh_from_db()
+        self.assertIsNone(self.device._config_context)
+        self.assertEqual(self.device.get_config_context(), {'a': 2})
+
+    def test_annotation_uses_precompiled_data(self):
+        ConfigContext.objects.create(name='Config Context 1', data={'a': 1})
+        Device.objects.filter(pk=self.device.pk).update(_config_context={'a': 2})
+
+        device = Device.objects.annotate_config_context_data().get(pk=self.device.pk)
+        self.assertIsNone(device.config_context_data)
+        self.assertEqual(device.get_config_context(), {'a': 2})
+
+
+class ConfigContextMatcherTest(TestCase):
+    """
+    Test the in-memory matching of ConfigContexts against that performed by ConfigContextQuerySet.get_for_object().
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        manufacturer = Manufacturer.objects.create(name='Manufacturer 1', slug='manufacturer-1')
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Device Type 1', slug='device-type-1')
+        device_role = DeviceRole.objects.create(name='Device Role 1', slug='device-role-1')
+        parent_region = Region.objects.create(name='Region 1', slug='region-1')
+        region = Region.objects.create(name='Region 2', slug='region-2', parent=parent_region)
+        other_region = Region.objects.create(name='Region 3', slug='region-3')
+        site_group = SiteGroup.objects.create(name='Site Group 1', slug='site-group-1')
+        site = Site.objects.create(name='Site 1', slug='site-1', region=region, group=site_group)
+        platform = Platform.objects.create(name='Platform 1', slug='platform-1')
+        tenant_group = TenantGroup.objects.create(name='Tenant Group 1', slug='tenant-group-1')
+        tenant = Tenant.objects.create(name='Tenant 1', slug='tenant-1', group=tenant_group)
+        tag = Tag.objects.create(name='Tag 1', slug='tag-1')
+        cluster_type = ClusterType.objects.create(name='Cluster Type 1', slug='cluster-type-1')
+        cluster_group = ClusterGroup.objects.create(name='Cluster Group 1', slug='cluster-group-1')
+        cluster = Cluster.objects.create(name='Cluster 1', type=cluster_type, group=cluster_group, site=site)
+
+        assignments = (
+            ('global', {}),
+            ('parent_region', {'regions': [parent_region]}),
+            ('other_region', {'regions': [other_region]}),
+            ('site_group', {'site_groups': [site_group]}),
+            ('site', {'sites': [site]}),
+            ('device_type', {'device_types': [device_type]}),
+            ('role', {'roles': [device_role]}),
+            ('platform', {'platforms': [platform]}),
+            ('cluster_type', {'cluster_types': [cluster_type]}),
+            ('cluster_group', {'cluster_groups': [cluster_group]}),
+            ('cluster', {'clusters': [cluster]}),
+            ('tenant_group', {'tenant_groups': [tenant_group]}),
+            ('tenant', {'tenants': [tenant]}),
+            ('tag', {'tags': [tag]}),
+            ('platform_and_other_region', {'platforms': [platform], 'regions': [other_region]}),
+        )
+        for i, (name, fields) in enumerate(assignments):
+            config_context = ConfigContext.objects.create(name=name, weight=1000 - i, data={'name': name, name: i})
+            for field_name, objects in fields.items():
+                getattr(config_context, field_name).set(objects)
+        ConfigContext.objects.create(name='inactive', is_active=False, data={'inactive': True})
+
+        devices = (
+            Device(name='Device 1', device_type=device_type, device_role=device_role, site=site),
+            Device(
+                name='Device 2', device_type=device_type, device_role=device_role, site=site, platform=platform,
+                tenant=tenant, cluster=cluster
+            ),
+        )
+        for device in devices:
+            device.save()
+        devices[1].tags.add(tag)
+
+        virtual_machines = (
+            VirtualMachine(name='Virtual Machine 1', cluster=cluster),
+            VirtualMachine(name='Virtual Machine 2', cluster=cluster, role=device_role, platform=platform, tenant=tenant),
+        )
+        for virtual_machine in virtual_machines:
+            virtual_machine.save()
+        virtual_machines[1].tags.add(tag)
+
+    def assertMatchesQuerySet(self, objects):
+        matcher = ConfigContextMatcher()
+        for obj, data in zip(objects, matcher.get_config_context_data(objects)):
+            expected = {}
+            for context in ConfigContext.objects.get_for_object(obj, aggregate_data=True) or []:
+                expected.update(context)
+            self.assertEqual(data, expected)
+
+    def test_devices(self):
+        self.assertMatchesQuerySet(Device.objects.all())
+
+    def test_virtual_machines(self):
+        self.assertMatchesQuerySet(VirtualMachine.objects.all())
+
+    def test_bulk_resolution(self):
+        matcher = ConfigContextMatcher()
+        devices = list(Device.objects.all())
+
+        # Retrieve clusters, sites, tenants, and tags
+        with self.assertNumQueries(4):
+            data = matcher.get_config_context_data(devices)
+        self.assertEqual(len(data), len(devices))
+
+        # Merged data is compiled only once per combination of ConfigContexts, and a copy is returned to each caller
+        merged_data = dict(matcher._merged_data)
+        self.assertEqual(matcher.get_config_context_data(devices[:1])[0], data[0])
+        self.assertEqual(matcher._merged_data, merged_data)
+        data[0]['name'] = 'modified'
+        self.assertNotEqual(matcher.get_config_context_data(devices[:1])[0], data[0])
+
+    def test_cache(self):
+        with outside_transaction():
+            ConfigContextMatcher.clear_cache()
+            matcher = ConfigContextMatcher.get()
+            with self.assertNumQueries(0):
+                self.assertIs(ConfigContextMatcher.get(), matcher)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ConfigContext.objects.create(name='new', data={'new': True})
+        with outside_transaction():
+            self.assertIsNot(ConfigContextMatcher.get(), matcher)
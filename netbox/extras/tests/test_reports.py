@@ -0,0 +1,223 @@
+import uuid
+from unittest.mock import MagicMock, patch
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+from rq.job import Job
+
+from dcim.models import Site
+from extras.choices import JobResultStatusChoices, LogLevelChoices
+from extras.models import JobResult
+from extras.reports import Report, finish_report, get_report_log, run_report_test
+
+
+class SiteReport(Report):
+
+    def test_names(self):
+        for site in Site.objects.all():
+            self.log_success(site)
+            # Results should be visible while the test is running
+            self.saved_data = JobResult.objects.get(pk=self._job_result.pk).data
+
+    def test_slugs(self):
+        for site in Site.objects.all():
+            if site.slug != 'site-1':
+                self.log_failure(site, "Unexpected slug")
+
+
+class ParallelSiteReport(SiteReport):
+    parallel = True
+
+    def pre_run(self):
+        self.pre_run_called = True
+
+    def test_names(self):
+        # pre_run() should be called by the instance running each test
+        assert self.pre_run_called
+        super().test_names()
+
+
+class SampledSiteReport(Report):
+    log_limit = 4
+    log_success_limit = 2
+    log_success_interval = 3
+
+    def test_sites(self):
+        self.log("Starting")
+        for i in range(10):
+            self.log_success(None, f"Success {i}")
+        self.log_warning(None, "Warning 1")
+        self.log_warning(None, "Warning 2")
+
+
+class ErroringSiteReport(Report):
+    log_limit = 4
+
+    def test_sites(self):
+        for i in range(5):
+            self.log(f"Message {i}")
+        raise Exception("Test exception")
+
+
+class ReportTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create((
+            Site(name='Site 1', slug='site-1'),
+            Site(name='Site 2', slug='site-2'),
+        ))
+
+    def get_job_result(self, report):
+        return JobResult.objects.create(
+            name=report.full_name,
+            obj_type=ContentType.objects.get(app_label='extras', model='report'),
+            job_id=uuid.uuid4()
+        )
+
+    @patch('extras.reports.REPORT_RESULTS_SAVE_INTERVAL', 0)
+    def test_run(self):
+        report = SiteReport()
+        job_result = self.get_job_result(report)
+        report.run(job_result)
+
+        self.assertEqual(report.saved_data['test_names']['success'], 2)
+        self.assertEqual(report.saved_data['test_slugs']['failure'], 0)
+
+        job_result.refresh_from_db()
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILED)
+        self.assertIsNotNone(job_result.completed)
+        self.assertEqual(job_result.data['test_names']['success'], 2)
+        self.assertEqual(job_result.data['test_slugs']['failure'], 1)
+        self.assertEqual(job_result.data['test_slugs']['log'][0][3], Site.objects.get(name='Site 2').pk)
+
+    @patch('extras.reports.django_rq.get_queue')
+    def test_run_parallel(self, get_queue):
+        get_queue.return_value.enqueue.side_effect = lambda *args, **kwargs: MagicMock(spec=Job)
+        report = ParallelSiteReport()
+        job_result = self.get_job_result(report)
+        report.run(job_result)
+
+        # A job should be enqueued for each test method, followed by a job to finish the report
+        enqueue_calls = get_queue.return_value.enqueue.call_args_list
+        self.assertEqual(
+            [(call.args[0], call.kwargs.get('test_name')) for call in enqueue_calls],
+            [(run_report_test, 'test_names'), (run_report_test, 'test_slugs'), (finish_report, None)]
+        )
+        # The report should be finished even if the job of a test method fails
+        dependency = enqueue_calls[2].kwargs['depends_on']
+        self.assertTrue(dependency.allow_failure)
+        self.assertEqual(len(dependency.dependencies), 2)
+        self.assertEqual(list(enqueue_calls[2].kwargs['test_jobs'].values()), ['test_names', 'test_slugs'])
+        job_result.refresh_from_db()
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_RUNNING)
+
+        # Run the test methods in reverse order, as separate workers would
+        ParallelSiteReport().run_test(job_result, 'test_slugs')
+        job_result.refresh_from_db()
+        self.assertEqual(job_result.data['test_slugs']['failure'], 1)
+        self.assertIsNone(job_result.completed)
+
+        ParallelSiteReport().run_test(job_result, 'test_names')
+        report = ParallelSiteReport()
+        report.finish(job_result)
+
+        job_result.refresh_from_db()
+        self.assertTrue(report.failed)
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILED)
+        self.assertIsNotNone(job_result.completed)
+        self.assertEqual(job_result.data['test_names']['success'], 2)
+        self.assertEqual(job_result.data['test_slugs']['failure'], 1)
+
+    def test_run_parallel_exception(self):
+        report = ParallelSiteReport()
+        job_result = self.get_job_result(report)
+        job_result.data = report._results
+        job_result.save()
+
+        with patch.object(ParallelSiteReport, 'test_names', side_effect=Exception('Test exception')):
+            ParallelSiteReport().run_test(job_result, 'test_names')
+        ParallelSiteReport().run_test(job_result, 'test_slugs')
+        ParallelSiteReport().finish(job_result)
+
+        job_result.refresh_from_db()
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_ERRORED)
+        self.assertIn('Test exception', job_result.data['test_names']['log'][0][5])
+        self.assertEqual(job_result.data['test_slugs']['failure'], 1)
+
+    @patch('extras.reports.django_rq.get_queue')
+    def test_run_parallel_job_failed(self, get_queue):
+        get_queue.return_value.fetch_job.side_effect = lambda job_id: MagicMock(is_failed=job_id == 'job-1')
+        report = ParallelSiteReport()
+        job_result = self.get_job_result(report)
+        job_result.data = report._results
+        job_result.save()
+
+        # The job running test_names failed without recording any results
+        ParallelSiteReport().run_test(job_result, 'test_slugs')
+        ParallelSiteReport().finish(job_result, {'job-1': 'test_names', 'job-2': 'test_slugs'})
+
+        job_result.refresh_from_db()
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_ERRORED)
+        self.assertIsNotNone(job_result.completed)
+        self.assertEqual(job_result.data['test_names']['failure'], 1)
+        self.assertIn('did not complete', job_result.data['test_names']['log'][0][5])
+        self.assertEqual(job_result.data['test_slugs']['failure'], 1)
+
+    def test_log_limit_exception(self):
+        report = ErroringSiteReport()
+        job_result = self.get_job_result(report)
+        job_result.data = report._results
+        job_result.save()
+        report.run_test(job_result, 'test_sites')
+
+        # The exception should be recorded even though the log limit has been reached
+        log = report._results['test_sites']['log']
+        self.assertEqual(len(log), 5)
+        self.assertIn('Test exception', log[4][5])
+        job_result.refresh_from_db()
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_ERRORED)
+
+    def test_log_sampling(self):
+        report = SampledSiteReport()
+        report.active_test = 'test_sites'
+        report.test_sites()
+
+        results = report._results['test_sites']
+        self.assertEqual(results['success'], 10)
+        self.assertEqual(results['warning'], 2)
+        # Every third success message should be recorded (up to two), and no more than four messages in total
+        self.assertEqual(
+            [entry[5] for entry in results['log']],
+            ['Starting', 'Success 0', 'Success 3', 'Warning 1']
+        )
+
+    def test_get_report_log(self):
+        report = SiteReport()
+        report.active_test = 'test_slugs'
+        site1, site2 = Site.objects.order_by('name')
+        report.log_failure(site1, "Site 1 failed")
+        report.log_failure(site2, "Site 2 failed")
+        report.log_info("Not a model", "Non-model object")
+        report._results['test_names']['log'].append(
+            ('2022-01-01T00:00:00+00:00', LogLevelChoices.LOG_INFO, 'Legacy', '/legacy/', "Legacy message")
+        )
+        site2_pk = site2.pk
+        site2.delete()
+
+        # Objects are stored by type and ID, and resolved only when displayed
+        object_type_id = ContentType.objects.get_for_model(Site).pk
+        self.assertEqual(report._results['test_slugs']['log'][0][1:], (
+            LogLevelChoices.LOG_FAILURE, object_type_id, site1.pk, None, "Site 1 failed"
+        ))
+        with self.assertNumQueries(1):
+            log = get_report_log(report._results)
+        self.assertEqual(
+            [entry[2:] for entry in log['test_slugs']],
+            [
+                (site1, site1.get_absolute_url(), "Site 1 failed"),
+                (f'site {site2_pk} (deleted)', None, "Site 2 failed"),
+                ('Not a model', None, "Non-model object"),
+            ]
+        )
+        self.assertEqual(log['test_names'][0][2:], ('Legacy', '/legacy/', "Legacy message"))
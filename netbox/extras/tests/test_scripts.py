@@ -1,11 +1,26 @@
+import os
+import sys
 import tempfile
+import uuid
+from unittest.mock import patch
 
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.test import RequestFactory, TestCase, override_settings
 from netaddr import IPAddress, IPNetwork
 
-from dcim.models import DeviceRole
+from dcim.choices import LinkStatusChoices
+from dcim.models import Cable, CablePath, Device, DeviceRole, Interface, Region, Site
+from extras.choices import ObjectChangeActionChoices
+from extras.context_managers import change_logging
+from extras.models import ObjectChange, Tag, Webhook
+from extras.reports import get_report, get_reports
 from extras.scripts import *
+from extras.scripts import get_script, get_scripts
+from ipam.models import Prefix
+from netbox import thread_locals
+from utilities.testing import create_test_device
 
 CHOICES = (
     ('ff0000', 'Red'),
@@ -31,6 +46,68 @@ JSON_DATA = """
 """
 
 
+SCRIPT_MODULE = """
+from extras.scripts import Script
+
+name = "Cached Scripts"
+
+class CachedScript(Script):
+    description = "{description}"
+"""
+
+REPORT_MODULE = """
+from extras.reports import Report
+
+class CachedReport(Report):
+    description = "{description}"
+
+    def test_foo(self):
+        pass
+"""
+
+
+class ModuleDiscoveryTest(TestCase):
+
+    def setUp(self):
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.root = root.name
+        self.addCleanup(sys.modules.pop, 'cached_module', None)
+
+    def write_module(self, content, description):
+        with open(os.path.join(self.root, 'cached_module.py'), 'w') as f:
+            f.write(content.format(description=description))
+
+    def test_get_scripts(self):
+        self.write_module(SCRIPT_MODULE, 'First')
+
+        with override_settings(SCRIPTS_ROOT=self.root):
+            script = get_script('cached_module', 'CachedScript')
+            self.assertEqual(script.description, 'First')
+            self.assertEqual(list(get_scripts(use_names=True)['Cached Scripts']), ['CachedScript'])
+
+            # Unchanged modules should not be re-imported
+            self.assertIs(get_script('cached_module', 'CachedScript'), script)
+
+            # Modified modules should be re-imported
+            self.write_module(SCRIPT_MODULE, 'Second (modified)')
+            self.assertEqual(get_script('cached_module', 'CachedScript').description, 'Second (modified)')
+
+    def test_get_reports(self):
+        self.write_module(REPORT_MODULE, 'First')
+
+        with override_settings(REPORTS_ROOT=self.root):
+            report = get_report('cached_module', 'CachedReport')
+            self.assertEqual(report.description, 'First')
+            (module_name, reports), = get_reports()
+            self.assertEqual(module_name, 'cached_module')
+            self.assertIs(reports[0].__class__, report.__class__)
+
+            self.write_module(REPORT_MODULE, 'Second (modified)')
+            self.assertEqual(get_report('cached_module', 'CachedReport').description, 'Second (modified)')
+            self.assertIsNone(get_report('nonexistent_module', 'CachedReport'))
+
+
 class ScriptTest(TestCase):
 
     def test_load_yaml(self):
@@ -322,3 +399,113 @@ class ScriptVariablesTest(TestCase):
         form = TestScript().as_form(data, None)
         self.assertTrue(form.is_valid())
         self.assertEqual(form.cleaned_data['var1'], IPNetwork(data['var1']))
+
+
+class BulkOperationsTest(TestCase):
+
+    def setUp(self):
+        self.request = RequestFactory().get('/')
+        self.request.id = uuid.uuid4()
+        self.request.user = User.objects.create_user(username='testuser')
+
+    @patch('extras.context_managers.flush_webhooks')
+    def test_bulk_create(self, flush_webhooks):
+        webhook = Webhook.objects.create(name='Webhook 1', type_create=True, payload_url='http://localhost/')
+        webhook.content_types.set([ContentType.objects.get_for_model(Site)])
+
+        with change_logging(self.request):
+            sites = Script().bulk_create(
+                (Site(name=f'Site {i}', slug=f'site-{i}') for i in range(5)),
+                batch_size=2
+            )
+            self.assertEqual(len(thread_locals.webhook_queue), 5)
+
+        self.assertEqual(Site.objects.count(), 5)
+        self.assertTrue(all(site.pk for site in sites))
+
+        objectchanges = ObjectChange.objects.filter(request_id=self.request.id)
+        self.assertEqual(objectchanges.count(), 5)
+        objectchange = objectchanges.get(changed_object_id=sites[0].pk)
+        self.assertEqual(objectchange.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(objectchange.user_name, 'testuser')
+        self.assertEqual(objectchange.postchange_data['name'], 'Site 0')
+        self.assertEqual(objectchange.postchange_data['tags'], [])
+
+    def test_bulk_update(self):
+        sites = Site.objects.bulk_create(Site(name=f'Site {i}', slug=f'site-{i}') for i in range(3))
+        sites[0].tags.add(Tag.objects.create(name='Tag 1', slug='tag-1'))
+        for site in sites:
+            site.description = 'Updated'
+
+        with change_logging(self.request):
+            self.assertEqual(Script().bulk_update(sites, ['description'], batch_size=2), 3)
+
+        self.assertEqual(Site.objects.filter(description='Updated').count(), 3)
+        objectchange = ObjectChange.objects.get(request_id=self.request.id, changed_object_id=sites[0].pk)
+        self.assertEqual(objectchange.action, ObjectChangeActionChoices.ACTION_UPDATE)
+        self.assertEqual(objectchange.prechange_data['description'], '')
+        self.assertEqual(objectchange.postchange_data['description'], 'Updated')
+        self.assertEqual(objectchange.postchange_data['tags'], ['Tag 1'])
+
+    def test_bulk_update_name(self):
+        sites = Site.objects.bulk_create(Site(name=f'Site {i}', slug=f'site-{i}') for i in range(3))
+        sites[0].name = 'Site 10'
+
+        Script().bulk_update(sites[:1], ['name'])
+
+        # The naturalized name used for ordering should be updated along with the name
+        self.assertEqual(list(Site.objects.values_list('name', flat=True)), ['Site 1', 'Site 2', 'Site 10'])
+
+    def test_bulk_create_without_change_logging(self):
+        Script().bulk_create([Site(name='Site 1', slug='site-1')])
+
+        self.assertTrue(Site.objects.filter(name='Site 1').exists())
+        self.assertFalse(ObjectChange.objects.exists())
+
+    def test_bulk_create_unsupported(self):
+        with self.assertRaises(ValueError):
+            Script().bulk_create([Region(name='Region 1', slug='region-1')])
+
+        # Device components are created from templates by Device.save()
+        device = create_test_device('Device 1')
+        with self.assertRaises(ValueError):
+            Script().bulk_create([
+                Device(name='Device 2', device_type=device.device_type, device_role=device.device_role, site=device.site)
+            ])
+
+    def test_prefix_hierarchy(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            prefixes = Script().bulk_create([
+                Prefix(prefix=IPNetwork('10.0.0.0/8')),
+                Prefix(prefix=IPNetwork('10.1.0.0/16')),
+                Prefix(prefix=IPNetwork('10.1.1.0/24')),
+            ])
+
+        self.assertEqual(
+            [(prefix._depth, prefix._children) for prefix in Prefix.objects.order_by('prefix')],
+            [(0, 2), (1, 1), (2, 0)]
+        )
+
+        prefixes[1].prefix = IPNetwork('10.2.0.0/16')
+        with self.captureOnCommitCallbacks(execute=True):
+            Script().bulk_update(prefixes[1:2], ['prefix'])
+
+        self.assertEqual(
+            [(prefix._depth, prefix._children) for prefix in Prefix.objects.order_by('prefix')],
+            [(0, 2), (1, 0), (1, 0)]
+        )
+
+    def test_cable_paths(self):
+        interfaces = [
+            Interface.objects.create(device=create_test_device(f'Device {i}'), name='eth0', type='1000base-t')
+            for i in range(2)
+        ]
+        cable = Cable(termination_a=interfaces[0], termination_b=interfaces[1])
+        cable.save()
+        self.assertTrue(CablePath.objects.get(origin_id=interfaces[0].pk).is_active)
+
+        cable.status = LinkStatusChoices.STATUS_PLANNED
+        with self.captureOnCommitCallbacks(execute=True):
+            Script().bulk_update([cable], ['status'])
+
+        self.assertFalse(CablePath.objects.get(origin_id=interfaces[0].pk).is_active)
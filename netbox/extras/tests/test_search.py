@@ -0,0 +1,140 @@
+from io import StringIO
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from circuits.filtersets import CircuitFilterSet
+from circuits.models import Circuit, CircuitTermination, CircuitType, Provider
+from dcim.filtersets import DeviceFilterSet, SiteFilterSet, VirtualChassisFilterSet
+from dcim.models import Device, DeviceRole, DeviceType, InventoryItem, Manufacturer, Site, VirtualChassis
+from extras.models import SearchIndexEntry
+from extras.models.search import create_trigram_indexes, get_trigram_indexes
+from ipam.models import ASN, RIR
+
+
+class SearchIndexTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create((
+            Site(name='Site 1', slug='site-1', facility='Alpha', description='First site'),
+            Site(name='Site 2', slug='site-2', facility='Beta', physical_address='1 Main Street\nAnytown'),
+            Site(name='Site 3', slug='site-3', comments='Decommissioned; replaced by site 1'),
+        ))
+
+    def get_entry(self, obj):
+        return SearchIndexEntry.objects.get(object_type=ContentType.objects.get_for_model(obj), object_id=obj.pk)
+
+    def search(self, value):
+        return SiteFilterSet({'q': value}, Site.objects.all()).qs
+
+    def test_bulk_create(self):
+        site = Site.objects.get(name='Site 2')
+        entry = self.get_entry(site)
+        self.assertEqual(entry.object, site)
+        self.assertEqual(entry.value, 'site 2\nbeta\n\n1 main street\nanytown\n\n')
+
+    def test_save(self):
+        site = Site.objects.create(name='Site 4', slug='site-4', description='Fourth site')
+        self.assertEqual(self.get_entry(site).value, 'site 4\n\nfourth site\n\n\n')
+
+        site.description = 'Updated'
+        site.save()
+        self.assertEqual(self.get_entry(site).value, 'site 4\n\nupdated\n\n\n')
+
+    def test_bulk_update(self):
+        sites = list(Site.objects.all())
+        for site in sites:
+            site.facility = f'{site.name} facility'
+        Site.objects.bulk_update(sites, ['facility'])
+
+        self.assertEqual(self.search('facility').count(), 3)
+
+    def test_delete(self):
+        site = Site.objects.get(name='Site 1')
+        pk = site.pk
+        site.delete()
+
+        self.assertFalse(SearchIndexEntry.objects.filter(object_id=pk).exists())
+
+    def test_search(self):
+        # Substrings (case-insensitive)
+        self.assertEqual(set(self.search('SITE').values_list('name', flat=True)), {'Site 1', 'Site 2', 'Site 3'})
+        self.assertEqual(set(self.search('lph').values_list('name', flat=True)), {'Site 1'})
+        self.assertEqual(set(self.search('main street').values_list('name', flat=True)), {'Site 2'})
+        # All words, in any order
+        self.assertEqual(set(self.search('anytown main').values_list('name', flat=True)), {'Site 2'})
+        # Values of different fields should not be joined
+        self.assertFalse(self.search('2beta').exists())
+        self.assertFalse(self.search('nonexistent').exists())
+
+    def test_search_related_objects(self):
+        rir = RIR.objects.create(name='RIR 1', slug='rir-1')
+        asn = ASN.objects.create(asn=65001, rir=rir)
+        asn.sites.add(Site.objects.get(name='Site 3'))
+        self.assertEqual(set(self.search('65001').values_list('name', flat=True)), {'Site 3'})
+        # Sites matching both an ASN and their indexed fields should not be duplicated
+        Site.objects.filter(name='Site 3').update(description='AS65001')
+        SearchIndexEntry.objects.update_index(Site)
+        self.assertEqual(list(self.search('65001').values_list('name', flat=True)), ['Site 3'])
+
+        manufacturer = Manufacturer.objects.create(name='Manufacturer 1', slug='manufacturer-1')
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Device Type 1', slug='device-type-1')
+        device_role = DeviceRole.objects.create(name='Device Role 1', slug='device-role-1')
+        site = Site.objects.first()
+        devices = (
+            Device.objects.create(name='Device 1', device_type=device_type, device_role=device_role, site=site),
+            Device.objects.create(name='Device 2', device_type=device_type, device_role=device_role, site=site),
+        )
+        InventoryItem.objects.create(device=devices[1], name='Inventory Item 1', serial='ABC123')
+        self.assertEqual(
+            list(DeviceFilterSet({'q': 'abc1'}, Device.objects.all()).qs.values_list('name', flat=True)),
+            ['Device 2']
+        )
+
+        virtual_chassis = VirtualChassis.objects.create(name='Virtual Chassis 1', master=devices[0])
+        Device.objects.filter(pk=devices[0].pk).update(virtual_chassis=virtual_chassis, vc_position=1)
+        self.assertEqual(VirtualChassisFilterSet({'q': 'device 1'}, VirtualChassis.objects.all()).qs.count(), 1)
+
+        provider = Provider.objects.create(name='Provider 1', slug='provider-1')
+        circuit_type = CircuitType.objects.create(name='Circuit Type 1', slug='circuit-type-1')
+        circuit = Circuit.objects.create(cid='Circuit 1', provider=provider, type=circuit_type)
+        CircuitTermination.objects.create(circuit=circuit, term_side='A', site=site, xconnect_id='XC-42')
+        self.assertEqual(CircuitFilterSet({'q': 'xc-42'}, Circuit.objects.all()).qs.count(), 1)
+
+    def test_rank(self):
+        Site.objects.filter(name='Site 1').update(name='Gamma')
+        SearchIndexEntry.objects.update_index(Site)
+        sites = SearchIndexEntry.objects.rank(self.search('site'), 'site')
+
+        # Sites with matches in more heavily weighted fields should be listed first
+        self.assertEqual(
+            list(sites.values_list('name', flat=True)),
+            ['Site 3', 'Site 2', 'Gamma']
+        )
+
+    def test_rebuild_search_index(self):
+        Site.objects.update(facility='Delta')
+        SearchIndexEntry.objects.filter(object_id=Site.objects.get(name='Site 1').pk).delete()
+
+        # Create missing entries
+        call_command('rebuild_search_index', 'dcim.Site', stdout=StringIO())
+        self.assertEqual(set(self.search('delta').values_list('name', flat=True)), {'Site 1'})
+
+        # Rebuild all entries
+        call_command('rebuild_search_index', 'dcim.Site', force=True, stdout=StringIO())
+        self.assertEqual(self.search('delta').count(), 3)
+
+    def test_trigram_indexes(self):
+        with connection.schema_editor() as schema_editor:
+            if not create_trigram_indexes(apps, schema_editor):
+                self.skipTest('The pg_trgm extension is not available')
+
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT indexname, indexdef FROM pg_indexes')
+            index_definitions = dict(cursor.fetchall())
+        for name, table, expression in get_trigram_indexes(apps, connection):
+            self.assertIn('gin_trgm_ops', index_definitions[name])
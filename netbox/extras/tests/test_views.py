@@ -1,13 +1,22 @@
+import os
+import sys
+import tempfile
 import urllib.parse
 import uuid
+from unittest.mock import patch
 
+import yaml
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
+from django.core.files.storage import default_storage
+from django.test import override_settings
 from django.urls import reverse
 
-from dcim.models import Site
+from dcim.models import DeviceType, Manufacturer, Site
 from extras.choices import *
+from extras.constants import TABLE_EXPORT_JOB_NAME
 from extras.models import *
+from netbox.tables.export import get_export_file_name, get_export_storage, run_table_export
 from utilities.testing import ViewTestCases, TestCase
 
 
@@ -339,3 +348,157 @@ class CustomLinkTest(TestCase):
         response = self.client.get(site.get_absolute_url(), follow=True)
         self.assertEqual(response.status_code, 200)
         self.assertIn(f'FOO {site.name} BAR', str(response.content))
+
+
+class TableExportTest(TestCase):
+    user_permissions = ['dcim.view_site']
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([
+            Site(name='Site 1', slug='site-1', status='active'),
+            Site(name='Site 2', slug='site-2', status='planned'),
+            Site(name='Site 3', slug='site-3', status='active'),
+        ])
+
+    def setUp(self):
+        super().setUp()
+        exports_root = tempfile.TemporaryDirectory()
+        self.addCleanup(exports_root.cleanup)
+        settings_override = override_settings(EXPORTS_ROOT=exports_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_export_table_streamed(self):
+        response = self.client.get(f'{reverse("dcim:site_list")}?status=active&export=table')
+        self.assertHttpStatus(response, 200)
+        self.assertTrue(response.streaming)
+        rows = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(rows[0].split(',')[0], 'Name')
+        self.assertEqual([row.split(',')[0] for row in rows[1:]], ['Site 1', 'Site 3'])
+
+    @patch('extras.models.models.django_rq.get_queue')
+    def test_export_table_job(self, get_queue):
+        response = self.client.get(f'{reverse("dcim:site_list")}?status=active&export=table&background=true')
+        job_result = JobResult.objects.get(name=TABLE_EXPORT_JOB_NAME)
+        self.assertRedirects(response, reverse('extras:export_result', kwargs={'job_result_pk': job_result.pk}))
+        self.assertEqual(job_result.user, self.user)
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_PENDING)
+
+        # Run the enqueued job
+        func, = get_queue.return_value.enqueue.call_args.args
+        func(**get_queue.return_value.enqueue.call_args.kwargs)
+        job_result.refresh_from_db()
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_COMPLETED)
+
+        response = self.client.get(reverse('extras:export_result', kwargs={'job_result_pk': job_result.pk}))
+        self.assertHttpStatus(response, 200)
+        self.assertIn('netbox_sites.csv', str(response.content))
+
+        response = self.client.get(reverse('extras:export_download', kwargs={'job_result_pk': job_result.pk}))
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="netbox_sites.csv"')
+        rows = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([row.split(',')[0] for row in rows[1:]], ['Site 1', 'Site 3'])
+
+        # The exported file should not be stored within MEDIA_ROOT, nor referenced by the job result's data
+        name = get_export_file_name(job_result.job_id)
+        self.assertTrue(get_export_storage().exists(name))
+        self.assertNotIn('file', job_result.data)
+        self.assertFalse(default_storage.exists(name))
+
+        # Deleting the JobResult should delete the exported file
+        with self.captureOnCommitCallbacks(execute=True):
+            job_result.delete()
+        self.assertFalse(get_export_storage().exists(name))
+
+    @patch('extras.models.models.django_rq.get_queue')
+    def test_export_yaml_job(self, get_queue):
+        manufacturer = Manufacturer.objects.create(name='Manufacturer 1', slug='manufacturer-1')
+        DeviceType.objects.bulk_create([
+            DeviceType(manufacturer=manufacturer, model='Device Type 1', slug='device-type-1'),
+            DeviceType(manufacturer=manufacturer, model='Device Type 2', slug='device-type-2'),
+        ])
+        self.add_permissions('dcim.view_devicetype')
+
+        response = self.client.get(f'{reverse("dcim:devicetype_list")}?export&background=true')
+        job_result = JobResult.objects.get(name=TABLE_EXPORT_JOB_NAME)
+        self.assertRedirects(response, reverse('extras:export_result', kwargs={'job_result_pk': job_result.pk}))
+
+        # Run the enqueued job
+        func, = get_queue.return_value.enqueue.call_args.args
+        func(**get_queue.return_value.enqueue.call_args.kwargs)
+        job_result.refresh_from_db()
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_COMPLETED)
+
+        response = self.client.get(reverse('extras:export_download', kwargs={'job_result_pk': job_result.pk}))
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response['Content-Type'], 'text/yaml')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="netbox_device types.yaml"')
+        data = list(yaml.load_all(b''.join(response.streaming_content), Loader=yaml.SafeLoader))
+        self.assertEqual([device_type['model'] for device_type in data], ['Device Type 1', 'Device Type 2'])
+
+    def test_export_table_job_other_user(self):
+        job_result = JobResult.objects.create(
+            name=TABLE_EXPORT_JOB_NAME,
+            obj_type=ContentType.objects.get_for_model(Site),
+            user=User.objects.create_user(username='other'),
+            job_id=uuid.uuid4()
+        )
+        run_table_export(job_result, view='dcim.views.SiteListView', query_params='')
+
+        # Exports should be accessible only to the user who requested them
+        for url_name in ('extras:export_result', 'extras:export_download'):
+            response = self.client.get(reverse(url_name, kwargs={'job_result_pk': job_result.pk}))
+            self.assertHttpStatus(response, 404)
+
+
+REPORT_MODULE = """
+from extras.reports import Report
+
+
+class SiteReport(Report):
+
+    def test_sites(self):
+        pass
+"""
+
+
+class ReportResultViewTest(TestCase):
+    user_permissions = ['extras.view_report']
+
+    def setUp(self):
+        super().setUp()
+        reports_root = tempfile.TemporaryDirectory()
+        self.addCleanup(reports_root.cleanup)
+        with open(os.path.join(reports_root.name, 'site_reports.py'), 'w') as f:
+            f.write(REPORT_MODULE)
+        settings_override = override_settings(REPORTS_ROOT=reports_root.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.addCleanup(sys.modules.pop, 'site_reports', None)
+
+    def test_report_result(self):
+        site = Site.objects.create(name='Site 1', slug='site-1')
+        job_result = JobResult.objects.create(
+            name='site_reports.SiteReport',
+            obj_type=ContentType.objects.get(app_label='extras', model='report'),
+            status=JobResultStatusChoices.STATUS_RUNNING,
+            job_id=uuid.uuid4(),
+            data={
+                'test_sites': {
+                    'success': 0, 'info': 0, 'warning': 0, 'failure': 1,
+                    'log': [
+                        ['2022-01-01T00:00:00+00:00', 'failure', ContentType.objects.get_for_model(Site).pk, site.pk,
+                         None, 'Invalid site'],
+                    ],
+                },
+            }
+        )
+
+        # Partial results should be displayed while the report is running
+        response = self.client.get(reverse('extras:report_result', kwargs={'job_result_pk': job_result.pk}))
+        self.assertHttpStatus(response, 200)
+        self.assertContains(response, f'<a href="{site.get_absolute_url()}">Site 1</a>', html=True)
+        self.assertContains(response, 'Invalid site')
+        self.assertContains(response, 'Results pending')
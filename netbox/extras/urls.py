@@ -98,6 +98,10 @@ urlpatterns = [
     path('changelog/', views.ObjectChangeListView.as_view(), name='objectchange_list'),
     path('changelog/<int:pk>/', views.ObjectChangeView.as_view(), name='objectchange'),
 
+    # Table exports
+    path('exports/<int:job_result_pk>/', views.ExportResultView.as_view(), name='export_result'),
+    path('exports/<int:job_result_pk>/download/', views.ExportDownloadView.as_view(), name='export_download'),
+
     # Reports
     path('reports/', views.ReportListView.as_view(), name='report_list'),
     path('reports/<str:module>.<str:name>/', views.ReportView.as_view(), name='report'),
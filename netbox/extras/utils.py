@@ -1,3 +1,10 @@
+import importlib.machinery
+import importlib.util
+import os
+import pkgutil
+import sys
+import threading
+
 from django.db.models import Q
 from django.utils.deconstruct import deconstructible
 from taggit.managers import _TaggableManager
@@ -5,6 +12,11 @@ from taggit.managers import _TaggableManager
 from extras.constants import EXTRAS_FEATURES
 from extras.registry import registry
 
+# Modules loaded from the scripts and reports paths, mapped by file path to the modification time and size of the file
+# when it was loaded
+_module_cache = {}
+_module_cache_lock = threading.Lock()
+
 
 def is_taggable(obj):
     """
@@ -61,3 +73,53 @@ def register_features(model, features):
             raise ValueError(f"{feature} is not a valid extras feature!")
         app_label, model_name = model._meta.label_lower.split('.')
         registry['model_features'][feature][app_label].add(model_name)
+
+
+def _load_module(spec):
+    """
+    Return the module for the given ModuleSpec, importing it only if it has not been imported previously or if its
+    file has since been modified (as determined by its modification time and size).
+    """
+    stat = os.stat(spec.origin)
+    file_version = (stat.st_mtime_ns, stat.st_size)
+
+    # Use a lock as loading modules and updating sys.modules is not thread safe
+    with _module_cache_lock:
+        cached = _module_cache.get(spec.origin)
+        if cached is not None and cached[0] == file_version:
+            module = cached[1]
+        else:
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[spec.name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[spec.name]
+                raise
+            _module_cache[spec.origin] = (file_version, module)
+        sys.modules[spec.name] = module
+
+    return module
+
+
+def get_modules(path):
+    """
+    Return a list of (module_name, module) tuples for all modules within the specified path (e.g. SCRIPTS_ROOT). Modules
+    are re-imported only when their files have changed.
+    """
+    return [
+        (module_name, _load_module(importer.find_spec(module_name)))
+        for importer, module_name, _ in pkgutil.iter_modules([path])
+    ]
+
+
+def get_module(path, module_name):
+    """
+    Return the named module within the specified path, or None if it does not exist. The module is re-imported only
+    when its file has changed.
+    """
+    spec = importlib.machinery.PathFinder.find_spec(module_name, [path])
+    if spec is None or spec.origin is None:
+        return None
+
+    return _load_module(spec)
@@ -1,13 +1,15 @@
 from django.contrib import messages
+from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Count, Q
-from django.http import Http404, HttpResponseForbidden
+from django.http import FileResponse, Http404, HttpResponseForbidden
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.views.generic import View
 from django_rq.queues import get_connection
 from rq import Worker
 
+from netbox.tables.export import get_export_file_name, get_export_storage
 from netbox.views import generic
 from utilities.forms import ConfirmationForm
 from utilities.htmx import is_htmx
@@ -15,8 +17,9 @@ from utilities.utils import copy_safe_request, count_related, get_viewname, norm
 from utilities.views import ContentTypePermissionRequiredMixin
 from . import filtersets, forms, tables
 from .choices import JobResultStatusChoices
+from .constants import TABLE_EXPORT_JOB_NAME
 from .models import *
-from .reports import get_report, get_reports, run_report
+from .reports import get_report, get_report_log, get_reports, run_report
 from .scripts import get_scripts, run_script
 
 
@@ -504,6 +507,65 @@ class JournalEntryBulkDeleteView(generic.BulkDeleteView):
     table = tables.JournalEntryTable
 
 
+#
+# Table exports
+#
+
+class GetExportResultMixin:
+
+    def get_export_result(self, request, job_result_pk):
+        """
+        Return the JobResult of a table export requested by the current user.
+        """
+        return get_object_or_404(
+            JobResult.objects.all(),
+            pk=job_result_pk,
+            name=TABLE_EXPORT_JOB_NAME,
+            user=request.user
+        )
+
+
+class ExportResultView(LoginRequiredMixin, GetExportResultMixin, View):
+    """
+    Display the status of a table export running in the background.
+    """
+    def get(self, request, job_result_pk):
+        result = self.get_export_result(request, job_result_pk)
+
+        # If this is an HTMX request, return only the result HTML
+        if is_htmx(request):
+            response = render(request, 'extras/htmx/export_result.html', {
+                'result': result,
+            })
+            if result.completed:
+                response.status_code = 286
+            return response
+
+        return render(request, 'extras/export_result.html', {
+            'model': result.obj_type.model_class(),
+            'result': result,
+        })
+
+
+class ExportDownloadView(LoginRequiredMixin, GetExportResultMixin, View):
+    """
+    Download the file produced by a completed table export.
+    """
+    def get(self, request, job_result_pk):
+        result = self.get_export_result(request, job_result_pk)
+        storage = get_export_storage()
+        name = get_export_file_name(result.job_id)
+        if result.status != JobResultStatusChoices.STATUS_COMPLETED or not storage.exists(name):
+            raise Http404
+
+        return FileResponse(
+            storage.open(name),
+            as_attachment=True,
+            filename=result.data['filename'],
+            content_type=result.data['content_type']
+        )
+
+
 #
 # Reports
 #
@@ -611,11 +673,15 @@ class ReportResultView(ContentTypePermissionRequiredMixin, View):
         report = get_report(module, report_name)
         report.result = result
 
+        # Resolve the objects referenced by the report's log
+        log = get_report_log(result.data) if result.data else {}
+
         # If this is an HTMX request, return only the result HTML
         if is_htmx(request):
             response = render(request, 'extras/htmx/report_result.html', {
                 'report': report,
                 'result': result,
+                'log': log,
             })
             if result.completed:
                 response.status_code = 286
@@ -624,6 +690,7 @@ class ReportResultView(ContentTypePermissionRequiredMixin, View):
         return render(request, 'extras/report_result.html', {
             'report': report,
             'result': result,
+            'log': log,
         })
 
 
@@ -12,6 +12,13 @@ from .choices import *
 from .models import Webhook
 from .registry import registry
 
+# Map each type of change to the Webhook field which enables it
+WEBHOOK_ACTION_FLAGS = {
+    ObjectChangeActionChoices.ACTION_CREATE: 'type_create',
+    ObjectChangeActionChoices.ACTION_UPDATE: 'type_update',
+    ObjectChangeActionChoices.ACTION_DELETE: 'type_delete',
+}
+
 
 def serialize_for_webhook(instance):
     """
@@ -67,6 +74,23 @@ def enqueue_object(queue, instance, user, request_id, action):
     })
 
 
+def enqueue_objects(queue, instances, user, request_id, action):
+    """
+    Enqueue the serialized representations of many objects of the same type which have been created or updated in
+    bulk. Objects are serialized only if an enabled webhook applies to their type and the action.
+    """
+    if not instances:
+        return
+
+    content_type = ContentType.objects.get_for_model(instances[0])
+    action_flag = WEBHOOK_ACTION_FLAGS[action]
+    if not Webhook.objects.filter(**{action_flag: True}, content_types=content_type, enabled=True).exists():
+        return
+
+    for instance in instances:
+        enqueue_object(queue, instance, user, request_id, action)
+
+
 def flush_webhooks(queue):
     """
     Flush a list of object representation to RQ for webhook processing.
@@ -80,11 +104,7 @@ def flush_webhooks(queue):
 
     for data in queue:
 
-        action_flag = {
-            ObjectChangeActionChoices.ACTION_CREATE: 'type_create',
-            ObjectChangeActionChoices.ACTION_UPDATE: 'type_update',
-            ObjectChangeActionChoices.ACTION_DELETE: 'type_delete',
-        }[data['event']]
+        action_flag = WEBHOOK_ACTION_FLAGS[data['event']]
         content_type = data['content_type']
 
         # Cache applicable Webhooks
@@ -6,6 +6,7 @@ from django.db.models import Q
 from netaddr.core import AddrFormatError
 
 from dcim.models import Device, Interface, Region, Site, SiteGroup
+from extras.models import SearchIndexEntry
 from netbox.filtersets import ChangeLoggedModelFilterSet, OrganizationalModelFilterSet, NetBoxModelFilterSet
 from tenancy.filtersets import TenancyFilterSet
 from utilities.filters import (
@@ -62,11 +63,7 @@ class VRFFilterSet(NetBoxModelFilterSet, TenancyFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(rd__icontains=value) |
-            Q(description__icontains=value)
-        )
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
     class Meta:
         model = VRF
@@ -856,7 +853,7 @@ class VLANFilterSet(NetBoxModelFilterSet, TenancyFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        qs_filter = Q(name__icontains=value) | Q(description__icontains=value)
+        qs_filter = Q(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
         try:
             qs_filter |= Q(vid=int(value.strip()))
         except ValueError:
@@ -920,5 +917,4 @@ class ServiceFilterSet(NetBoxModelFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        qs_filter = Q(name__icontains=value) | Q(description__icontains=value)
-        return queryset.filter(qs_filter)
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
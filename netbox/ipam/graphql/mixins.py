@@ -1,5 +1,8 @@
 import graphene
 
+from ipam.models import IPAddress, VLANGroup
+from netbox.graphql.loaders import load_related_objects
+
 __all__ = (
     'IPAddressesMixin',
     'VLANGroupsMixin',
@@ -10,11 +13,11 @@ class IPAddressesMixin:
     ip_addresses = graphene.List('ipam.graphql.types.IPAddressType')
 
     def resolve_ip_addresses(self, info):
-        return self.ip_addresses.restrict(info.context.user, 'view')
+        return load_related_objects(self, info, 'ip_addresses', IPAddress.objects.restrict(info.context.user, 'view'))
 
 
 class VLANGroupsMixin:
     vlan_groups = graphene.List('ipam.graphql.types.VLANGroupType')
 
     def resolve_vlan_groups(self, info):
-        return self.vlan_groups.restrict(info.context.user, 'view')
+        return load_related_objects(self, info, 'vlan_groups', VLANGroup.objects.restrict(info.context.user, 'view'))
@@ -0,0 +1,17 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ipam', '0057_created_datetimefield'),
+    ]
+
+    operations = [
+        # Serves the case-insensitive prefix matching of IP addresses by the quick search filter
+        # (TEXT(address) LIKE LOWER('<value>%'))
+        migrations.RunSQL(
+            sql='CREATE INDEX ipam_ipaddress_address_text ON ipam_ipaddress (TEXT(address) text_pattern_ops)',
+            reverse_sql='DROP INDEX IF EXISTS ipam_ipaddress_address_text'
+        ),
+    ]
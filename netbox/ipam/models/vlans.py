@@ -175,6 +175,8 @@ class VLAN(NetBoxModel):
 
     objects = VLANQuerySet.as_manager()
 
+    search_fields = {'name': 'A', 'description': 'C'}
+
     clone_fields = [
         'site', 'group', 'tenant', 'status', 'role', 'description',
     ]
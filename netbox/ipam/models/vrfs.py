@@ -55,6 +55,8 @@ class VRF(NetBoxModel):
         blank=True
     )
 
+    search_fields = {'name': 'A', 'rd': 'A', 'description': 'C'}
+
     clone_fields = [
         'tenant', 'enforce_unique', 'description',
     ]
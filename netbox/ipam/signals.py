@@ -1,9 +1,13 @@
+from django.db import transaction
 from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from dcim.models import Device
+from netbox import thread_locals
+from netbox.signals import post_bulk_save
 from virtualization.models import VirtualMachine
 from .models import IPAddress, Prefix
+from .utils import rebuild_prefixes
 
 
 def update_parents_children(prefix):
@@ -30,14 +34,14 @@ def update_children_depth(prefix):
 def handle_prefix_saved(instance, created, **kwargs):
 
     # Prefix has changed (or new instance has been created)
-    if created or instance.vrf != instance._vrf or instance.prefix != instance._prefix:
+    if created or instance.vrf_id != instance._vrf_id or instance.prefix != instance._prefix:
 
         update_parents_children(instance)
         update_children_depth(instance)
 
         # If this is not a new prefix, clean up parent/children of previous prefix
         if not created:
-            old_prefix = Prefix(vrf=instance._vrf, prefix=instance._prefix)
+            old_prefix = Prefix(vrf_id=instance._vrf_id, prefix=instance._prefix)
             update_parents_children(old_prefix)
             update_children_depth(old_prefix)
 
@@ -49,6 +53,30 @@ def handle_prefix_deleted(instance, **kwargs):
     update_children_depth(instance)
 
 
+def rebuild_queued_prefixes():
+    """
+    Rebuild the prefix hierarchy of each queued VRF (or the global table). This should be called only once the changes
+    which prompted the rebuild have been committed.
+    """
+    queue = getattr(thread_locals, 'prefix_rebuild_queue', set())
+    while queue:
+        rebuild_prefixes(queue.pop())
+
+
+@receiver(post_bulk_save, sender=Prefix)
+def handle_prefixes_bulk_saved(instances, fields=None, **kwargs):
+    """
+    Rebuild the hierarchy of each VRF in which prefixes have been created or modified in bulk once the changes have been
+    committed, rather than updating the parents and children of each prefix individually.
+    """
+    if fields is None or {'prefix', 'vrf', 'vrf_id'} & set(fields):
+        if not hasattr(thread_locals, 'prefix_rebuild_queue'):
+            thread_locals.prefix_rebuild_queue = set()
+        for instance in instances:
+            thread_locals.prefix_rebuild_queue.update({instance.vrf_id, instance._vrf_id})
+        transaction.on_commit(rebuild_queued_prefixes)
+
+
 @receiver(pre_delete, sender=IPAddress)
 def clear_primary_ip(instance, **kwargs):
     """
@@ -1,7 +1,14 @@
+from collections import OrderedDict
+
 from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
 
 from netbox.config import get_config
+from utilities.paginator import get_queryset_count
+from utilities.utils import chunked_queryset
 
 
 class OptionalLimitOffsetPagination(LimitOffsetPagination):
@@ -10,8 +17,12 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
     matching a query, but retains the same format as a paginated request. The limit can only be disabled if
     MAX_PAGE_SIZE has been set to 0 or None.
     """
+    # Number of objects to retrieve and serialize at a time when streaming an unpaginated response
+    stream_chunk_size = 1000
+
     def __init__(self):
         self.default_limit = get_config().PAGINATE_COUNT
+        self.count_approximate = False
 
     def paginate_queryset(self, queryset, request, view=None):
 
@@ -53,7 +64,62 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
         return self.default_limit
 
     def get_queryset_count(self, queryset):
-        return queryset.count()
+        count, self.count_approximate = get_queryset_count(queryset)
+        return count
+
+    def get_paginated_response(self, data):
+        response_data = OrderedDict([
+            ('count', self.count),
+        ])
+        # Flag estimated or cached counts
+        if self.count_approximate:
+            response_data['count_approximate'] = True
+        response_data.update([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data),
+        ])
+
+        return Response(response_data)
+
+    def get_streaming_response(self, queryset, request, serialize):
+        """
+        Return the entire QuerySet (less any requested offset) as a streamed JSON response in the same format as a
+        paginated response. Objects are retrieved and serialized `stream_chunk_size` at a time, so the complete result
+        set is never held in memory.
+
+        :param queryset: The filtered QuerySet to render
+        :param request: The current request
+        :param serialize: A callable which accepts a list of objects and returns their serialized representations
+        """
+        self.request = request
+        self.limit = None
+        self.offset = self.get_offset(request)
+        self.count = self.get_queryset_count(queryset)
+        renderer = JSONRenderer()
+
+        def stream():
+            response_data = OrderedDict([
+                ('count', self.count),
+            ])
+            if self.count_approximate:
+                response_data['count_approximate'] = True
+            response_data.update([
+                ('next', None),
+                ('previous', None),
+            ])
+            # Open the results list in place of the rendered object's closing brace
+            yield renderer.render(response_data)[:-1] + b',"results":['
+
+            delimiter = b''
+            for chunk in chunked_queryset(queryset[self.offset:], self.stream_chunk_size):
+                # Strip the enclosing brackets from the rendered list
+                yield delimiter + renderer.render(serialize(chunk))[1:-1]
+                delimiter = b','
+
+            yield b']}'
+
+        return StreamingHttpResponse(stream(), content_type=renderer.media_type)
 
     def get_next_link(self):
 
@@ -82,4 +148,4 @@ class StripCountAnnotationsPaginator(OptionalLimitOffsetPagination):
         cloned_queryset = queryset.all()
         cloned_queryset.query.annotations.clear()
 
-        return cloned_queryset.count()
+        return super().get_queryset_count(cloned_queryset)
@@ -1,8 +1,8 @@
-from django.contrib.contenttypes.models import ContentType
 from rest_framework import serializers
 from rest_framework.fields import CreateOnlyDefault
 
 from extras.api.customfields import CustomFieldsDataField, CustomFieldDefaultValues
+from extras.choices import CustomFieldTypeChoices
 from extras.models import CustomField
 from .nested import NestedTagSerializer
 
@@ -28,13 +28,20 @@ class CustomFieldModelSerializer(serializers.Serializer):
         if self.instance is not None:
 
             # Retrieve the set of CustomFields which apply to this type of object
-            content_type = ContentType.objects.get_for_model(self.Meta.model)
-            fields = CustomField.objects.filter(content_types=content_type)
+            fields = CustomField.objects.get_cached_for_model(self.Meta.model)
 
             # Populate custom field values for each instance from database
             if type(self.instance) in (list, tuple):
                 for obj in self.instance:
                     self._populate_custom_fields(obj, fields)
+
+                # Resolve all objects referenced by custom fields at once. (This is skipped for models with no object
+                # custom fields, some of which have no custom field data.)
+                object_types = (CustomFieldTypeChoices.TYPE_OBJECT, CustomFieldTypeChoices.TYPE_MULTIOBJECT)
+                if any(cf.type in object_types for cf in fields):
+                    self.custom_field_objects = CustomField.objects.get_related_objects(
+                        self.Meta.model, [obj.custom_field_data for obj in self.instance]
+                    )
             else:
                 self._populate_custom_fields(self.instance, fields)
 
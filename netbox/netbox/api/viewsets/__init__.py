@@ -5,10 +5,11 @@ from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
 from django.db import transaction
 from django.db.models import ProtectedError
 from django.shortcuts import get_object_or_404
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
-from extras.models import ExportTemplate
+from extras.models import CustomField, ExportTemplate
 from netbox.api.exceptions import SerializerNotFound
 from netbox.constants import NESTED_SERIALIZER_PREFIX
 from utilities.api import get_serializer_for_model
@@ -78,9 +79,8 @@ class NetBoxModelViewSet(BulkUpdateModelMixin, BulkDestroyModelMixin, ObjectVali
         context = super().get_serializer_context()
 
         if hasattr(self.queryset.model, 'custom_fields'):
-            content_type = ContentType.objects.get_for_model(self.queryset.model)
             context.update({
-                'custom_fields': content_type.custom_fields.all(),
+                'custom_fields': CustomField.objects.get_cached_for_model(self.queryset.model),
             })
 
         return context
@@ -129,7 +129,7 @@ class NetBoxModelViewSet(BulkUpdateModelMixin, BulkDestroyModelMixin, ObjectVali
 
     def list(self, request, *args, **kwargs):
         """
-        Overrides ListModelMixin to allow processing ExportTemplates.
+        Overrides ListModelMixin to allow processing ExportTemplates, and to stream unpaginated JSON responses.
         """
         if 'export' in request.GET:
             content_type = ContentType.objects.get_for_model(self.get_serializer_class().Meta.model)
@@ -137,8 +137,28 @@ class NetBoxModelViewSet(BulkUpdateModelMixin, BulkDestroyModelMixin, ObjectVali
             queryset = self.filter_queryset(self.get_queryset())
             return et.render_to_response(queryset)
 
+        # If pagination has been disabled for this request (limit=0), stream the response rather than rendering all
+        # objects in memory
+        if self._stream_response(request):
+            queryset = self.filter_queryset(self.get_queryset())
+            return self.paginator.get_streaming_response(
+                queryset,
+                request,
+                serialize=lambda objects: self.get_serializer(objects, many=True).data
+            )
+
         return super().list(request, *args, **kwargs)
 
+    def _stream_response(self, request):
+        """
+        Return True if the response to a list request should be streamed.
+        """
+        return (
+            hasattr(self.paginator, 'get_streaming_response') and
+            isinstance(request.accepted_renderer, JSONRenderer) and
+            not self.paginator.get_limit(request)
+        )
+
     def perform_create(self, serializer):
         model = self.queryset.model
         logger = logging.getLogger('netbox.api.views.ModelViewSet')
@@ -81,6 +81,13 @@ PARAMS = (
         description="Default unit width for rendered rack elevations",
         field=forms.IntegerField
     ),
+    ConfigParam(
+        name='RACK_ELEVATION_CACHE_TIMEOUT',
+        label='Rack elevation cache timeout',
+        default=0,
+        description="Seconds to cache rendered rack elevations (zero to disable)",
+        field=forms.IntegerField
+    ),
 
     # Power
     ConfigParam(
@@ -133,6 +140,20 @@ PARAMS = (
         default=1000,
         field=forms.IntegerField
     ),
+    ConfigParam(
+        name='COUNT_ESTIMATE_THRESHOLD',
+        label='Count estimate threshold',
+        default=0,
+        description="Report estimated counts for unfiltered lists of tables larger than this (zero to disable)",
+        field=forms.IntegerField
+    ),
+    ConfigParam(
+        name='COUNT_CACHE_TIMEOUT',
+        label='Count cache timeout',
+        default=0,
+        description="Seconds to cache the object counts of paginated lists (zero to disable)",
+        field=forms.IntegerField
+    ),
 
     # Validation
     ConfigParam(
@@ -205,6 +226,27 @@ PARAMS = (
         description="Enable the GraphQL API",
         field=forms.BooleanField
     ),
+    ConfigParam(
+        name='GRAPHQL_DEFAULT_PAGE_SIZE',
+        label='GraphQL default page size',
+        default=0,
+        description="Default number of objects returned by GraphQL list queries (zero for no limit)",
+        field=forms.IntegerField
+    ),
+    ConfigParam(
+        name='GRAPHQL_MAX_QUERY_COST',
+        label='GraphQL maximum query cost',
+        default=0,
+        description="Reject GraphQL queries estimated to resolve more than this number of objects (zero to disable)",
+        field=forms.IntegerField
+    ),
+    ConfigParam(
+        name='GRAPHQL_CACHE_TIMEOUT',
+        label='GraphQL cache timeout',
+        default=0,
+        description="Seconds to cache the responses to GraphQL queries (zero to disable)",
+        field=forms.IntegerField
+    ),
     ConfigParam(
         name='CHANGELOG_RETENTION',
         label='Changelog retention',
@@ -219,6 +261,20 @@ PARAMS = (
         description="Days to retain job result history (set to zero for unlimited)",
         field=forms.IntegerField
     ),
+    ConfigParam(
+        name='HOME_STATS_CACHE_TIMEOUT',
+        label='Home page statistics cache timeout',
+        default=0,
+        description="Seconds to cache the object counts displayed on the home page (zero to disable)",
+        field=forms.IntegerField
+    ),
+    ConfigParam(
+        name='SEARCH_TIMEOUT',
+        label='Search timeout',
+        default=5,
+        description="Seconds after which the global search of an object type is abandoned (zero to disable)",
+        field=forms.IntegerField
+    ),
     ConfigParam(
         name='MAPS_URL',
         label='Maps URL',
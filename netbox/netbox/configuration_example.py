@@ -149,6 +149,11 @@ LOGIN_REQUIRED = False
 # re-authenticate. (Default: 1209600 [14 days])
 LOGIN_TIMEOUT = None
 
+# The file path where the files produced by background exports are stored. This must be writable by the NetBox
+# background worker, and must not be within MEDIA_ROOT. A trailing slash is not needed. Note that the default value of
+# this setting is derived from the installed location.
+# EXPORTS_ROOT = '/opt/netbox/netbox/exports'
+
 # The file path where uploaded media such as image attachments are stored. A trailing slash is not needed. Note that
 # the default value of this setting is derived from the installed location.
 # MEDIA_ROOT = '/opt/netbox/netbox/media'
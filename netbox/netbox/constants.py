@@ -3,3 +3,6 @@ NESTED_SERIALIZER_PREFIX = 'Nested'
 
 # Max results per object type
 SEARCH_MAX_RESULTS = 15
+
+# Max object types to search concurrently
+SEARCH_MAX_WORKERS = 4
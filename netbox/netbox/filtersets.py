@@ -1,6 +1,5 @@
 import django_filters
 from copy import deepcopy
-from django.contrib.contenttypes.models import ContentType
 from django.db import models
 from django_filters.exceptions import FieldLookupError
 from django_filters.utils import get_model_field, resolve_field
@@ -231,14 +230,12 @@ class NetBoxModelFilterSet(ChangeLoggedModelFilterSet):
         super().__init__(*args, **kwargs)
 
         # Dynamically add a Filter for each CustomField applicable to the parent model
-        custom_fields = CustomField.objects.filter(
-            content_types=ContentType.objects.get_for_model(self._meta.model)
-        ).exclude(
-            filter_logic=CustomFieldFilterLogicChoices.FILTER_DISABLED
-        )
+        custom_fields = CustomField.objects.get_cached_for_model(self._meta.model)
 
         custom_field_filters = {}
         for custom_field in custom_fields:
+            if custom_field.filter_logic == CustomFieldFilterLogicChoices.FILTER_DISABLED:
+                continue
             filter_name = f'cf_{custom_field.name}'
             filter_instance = custom_field.to_filter()
             if filter_instance:
@@ -0,0 +1,34 @@
+from functools import lru_cache, partial
+
+from graphql import parse, validate
+from graphql.backend import GraphQLCoreBackend, GraphQLDocument
+from graphql.execution import ExecutionResult, execute
+
+__all__ = (
+    'CachedGraphQLBackend',
+)
+
+
+class CachedGraphQLBackend(GraphQLCoreBackend):
+    """
+    A GraphQL backend which retains the parsed and validated documents of the most recently executed queries, so that
+    repeated queries need not be parsed and validated against the schema again.
+    """
+    @lru_cache(maxsize=256)
+    def document_from_string(self, schema, document_string):
+        document_ast = parse(document_string)
+
+        # Validate the document once, recording any errors for return upon execution
+        validation_errors = validate(schema, document_ast)
+        if validation_errors:
+            def execute_document(*args, **kwargs):
+                return ExecutionResult(errors=validation_errors, invalid=True)
+        else:
+            execute_document = partial(execute, schema, document_ast, **self.execute_params)
+
+        return GraphQLDocument(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            execute=execute_document
+        )
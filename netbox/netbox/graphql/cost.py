@@ -0,0 +1,138 @@
+import math
+
+from graphql.language.ast import (
+    Field, FragmentDefinition, FragmentSpread, InlineFragment, OperationDefinition, Variable,
+)
+from graphql.type import GraphQLList, GraphQLNonNull
+
+from netbox.config import get_config
+from utilities.paginator import get_estimated_count
+
+__all__ = (
+    'get_query_cost',
+)
+
+
+class QueryCostAnalyzer:
+    """
+    Statically estimate the cost of a GraphQL query, prior to its execution, as the total number of objects it will
+    resolve. The number of objects returned by each list field is estimated from its `limit` argument (or the default
+    page size) and the size of the model's table, as estimated by PostgreSQL (or counted, for tables which have not yet
+    been analyzed). The number of objects related to each parent object is estimated as the ratio of the sizes of the
+    two tables.
+    """
+    def __init__(self, schema, document_ast, variables=None):
+        self.schema = schema
+        self.variables = variables or {}
+        self.operations = []
+        self.fragments = {}
+        for definition in document_ast.definitions:
+            if isinstance(definition, OperationDefinition):
+                self.operations.append(definition)
+            elif isinstance(definition, FragmentDefinition):
+                self.fragments[definition.name.value] = definition
+        self.default_page_size = get_config().GRAPHQL_DEFAULT_PAGE_SIZE
+        self.max_page_size = get_config().MAX_PAGE_SIZE
+        self._table_sizes = {}
+
+    def get_table_size(self, model):
+        """
+        Return the estimated number of rows in a model's table. If PostgreSQL has no estimate (because the table has
+        not yet been analyzed), the rows are counted.
+        """
+        if model not in self._table_sizes:
+            queryset = model._default_manager.all()
+            table_size = get_estimated_count(queryset)
+            self._table_sizes[model] = queryset.count() if table_size is None else table_size
+        return self._table_sizes[model]
+
+    def get_argument(self, field_ast, name):
+        for argument in field_ast.arguments:
+            if argument.name.value == name:
+                if isinstance(argument.value, Variable):
+                    return self.variables.get(argument.value.name.value)
+                return getattr(argument.value, 'value', None)
+
+    def get_fields(self, selection_set):
+        """
+        Yield each Field node in a selection set, expanding fragments.
+        """
+        for selection in selection_set.selections:
+            if isinstance(selection, Field):
+                yield selection
+            elif isinstance(selection, FragmentSpread):
+                fragment = self.fragments.get(selection.name.value)
+                if fragment is not None:
+                    yield from self.get_fields(fragment.selection_set)
+            elif isinstance(selection, InlineFragment):
+                yield from self.get_fields(selection.selection_set)
+
+    def get_row_count(self, field_ast, model, parent_model):
+        """
+        Estimate the number of objects returned by a list field for each parent object.
+        """
+        table_size = self.get_table_size(model) if model is not None else None
+
+        # Top-level list fields return at most one page of objects
+        if parent_model is None:
+            limit = self.get_argument(field_ast, 'limit')
+            try:
+                limit = int(self.default_page_size if limit is None else limit) or None
+            except (TypeError, ValueError):
+                limit = None
+            if table_size is None:
+                # The list is not of model instances, so assume the largest page unless a limit is given. (A
+                # MAX_PAGE_SIZE of zero imposes no maximum, so fall back to the default page size.)
+                return limit or self.max_page_size or self.default_page_size or 1
+            if limit:
+                return min(limit, table_size)
+            return table_size or 1
+
+        # Nested list fields return all related objects
+        parent_table_size = self.get_table_size(parent_model)
+        if table_size is None or not parent_table_size:
+            return 1
+        return max(math.ceil(table_size / parent_table_size), 1)
+
+    def get_cost(self, selection_set, graphql_type, parent_count=1, parent_model=None):
+        cost = 0
+        fields = getattr(graphql_type, 'fields', {})
+
+        for field_ast in self.get_fields(selection_set):
+            field = fields.get(field_ast.name.value)
+            if field is None or field_ast.selection_set is None:
+                # Scalar or introspection field
+                continue
+
+            # Unwrap the field's type
+            field_type = field.type
+            is_list = False
+            while isinstance(field_type, (GraphQLList, GraphQLNonNull)):
+                is_list = is_list or isinstance(field_type, GraphQLList)
+                field_type = field_type.of_type
+            model = getattr(getattr(getattr(field_type, 'graphene_type', None), '_meta', None), 'model', None)
+
+            count = parent_count
+            if is_list:
+                count *= self.get_row_count(field_ast, model, parent_model)
+            cost += count + self.get_cost(field_ast.selection_set, field_type, count, model)
+
+        return cost
+
+    def analyze(self, operation_name=None):
+        """
+        Return the estimated cost of the given (or only) operation.
+        """
+        for operation in self.operations:
+            if operation_name is None or (operation.name and operation.name.value == operation_name):
+                if operation.operation == 'query':
+                    return self.get_cost(operation.selection_set, self.schema.get_query_type())
+                return 0
+        return 0
+
+
+def get_query_cost(schema, document_ast, variables=None, operation_name=None):
+    """
+    Return the estimated cost of a GraphQL query (see QueryCostAnalyzer).
+    """
+    return QueryCostAnalyzer(schema, document_ast, variables).analyze(operation_name)
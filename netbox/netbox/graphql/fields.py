@@ -2,7 +2,10 @@ from functools import partial
 
 import graphene
 from graphene_django import DjangoListField
+from graphql import GraphQLError
 
+from netbox.config import get_config
+from .optimizer import optimize_queryset
 from .utils import get_graphene_type
 
 __all__ = (
@@ -38,10 +41,13 @@ class ObjectField(graphene.Field):
 
 class ObjectListField(DjangoListField):
     """
-    Retrieve a list of objects, optionally filtered by one or more FilterSet filters.
+    Retrieve a list of objects, optionally filtered by one or more FilterSet filters and paginated by limit and offset.
     """
     def __init__(self, _type, *args, **kwargs):
-        filter_kwargs = {}
+        filter_kwargs = {
+            'limit': graphene.Int(),
+            'offset': graphene.Int(),
+        }
 
         # Get FilterSet kwargs
         filterset_class = getattr(_type._meta, 'filterset_class', None)
@@ -54,6 +60,13 @@ class ObjectListField(DjangoListField):
 
     @staticmethod
     def list_resolver(django_object_type, resolver, default_manager, root, info, **args):
+        limit = args.pop('limit', None)
+        offset = args.pop('offset', None) or 0
+        if limit is None:
+            limit = get_config().GRAPHQL_DEFAULT_PAGE_SIZE
+        if limit < 0 or offset < 0:
+            raise GraphQLError("The limit and offset must not be negative.")
+
         # Get the QuerySet from the object type
         queryset = django_object_type.get_queryset(default_manager, info)
 
@@ -61,6 +74,14 @@ class ObjectListField(DjangoListField):
         filterset_class = django_object_type._meta.filterset_class
         if filterset_class:
             filterset = filterset_class(data=args, queryset=queryset, request=info.context)
-            return filterset.qs
+            queryset = filterset.qs
+
+        # Retrieve related objects and limit the fields retrieved according to the query
+        queryset = optimize_queryset(queryset, info, django_object_type)
 
+        # Paginate the results (a limit of zero returns all remaining objects)
+        if limit:
+            return queryset[offset:offset + limit]
+        if offset:
+            return queryset[offset:]
         return queryset
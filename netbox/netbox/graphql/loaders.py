@@ -0,0 +1,116 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Prefetch, prefetch_related_objects
+from promise import Promise
+from promise.dataloader import DataLoader
+
+__all__ = (
+    'ConfigContextLoader',
+    'GenericRelatedObjectsLoader',
+    'ObjectLoader',
+    'RelatedObjectsLoader',
+    'get_loader',
+    'load_related_objects',
+)
+
+
+def get_loader(info, key, loader_class, *args, **kwargs):
+    """
+    Return the DataLoader identified by `key` for the current request, creating it if necessary. Because loaders are
+    scoped to the request, each batches the retrieval of objects for all parent objects at a given nesting level.
+    """
+    if not hasattr(info.context, 'graphql_loaders'):
+        info.context.graphql_loaders = {}
+    if key not in info.context.graphql_loaders:
+        info.context.graphql_loaders[key] = loader_class(*args, **kwargs)
+
+    return info.context.graphql_loaders[key]
+
+
+def load_related_objects(root, info, accessor, queryset=None):
+    """
+    Return a Promise for the objects related to `root` via `accessor` (a reverse foreign key, many-to-many, or generic
+    relation), optionally limited to those within the given QuerySet.
+    """
+    loader = get_loader(info, (type(root), accessor), RelatedObjectsLoader, accessor, queryset)
+
+    return loader.load(root)
+
+
+class ObjectLoader(DataLoader):
+    """
+    Batch the retrieval of objects by primary key (or another unique field), e.g. to resolve foreign keys.
+    """
+    def __init__(self, queryset, field_name='pk'):
+        super().__init__()
+        self.queryset = queryset
+        self.field_name = field_name
+
+    def batch_load_fn(self, keys):
+        objects = self.queryset.in_bulk(keys, field_name=self.field_name)
+
+        return Promise.resolve([objects.get(key) for key in keys])
+
+
+class RelatedObjectsLoader(DataLoader):
+    """
+    Batch the retrieval of the objects related to each of many parent objects via a reverse foreign key, many-to-many,
+    or generic relation. Keys are the parent objects themselves.
+    """
+    def __init__(self, accessor, queryset=None):
+        super().__init__(get_cache_key=lambda obj: obj.pk)
+        self.accessor = accessor
+        self.queryset = queryset
+
+    def batch_load_fn(self, instances):
+        to_attr = f'_loaded_{self.accessor}'
+        prefetch_related_objects(instances, Prefetch(self.accessor, queryset=self.queryset, to_attr=to_attr))
+
+        return Promise.resolve([getattr(instance, to_attr) for instance in instances])
+
+
+class GenericRelatedObjectsLoader(DataLoader):
+    """
+    Batch the retrieval of objects which reference each of many parent objects by content type and object ID, where
+    the parent model defines no GenericRelation. Keys are the parent objects themselves.
+    """
+    def __init__(self, queryset, ct_field='content_type', fk_field='object_id'):
+        super().__init__(get_cache_key=lambda obj: obj.pk)
+        self.queryset = queryset
+        self.ct_field = ct_field
+        self.fk_field = fk_field
+
+    def batch_load_fn(self, instances):
+        related_objects = defaultdict(list)
+        queryset = self.queryset.filter(**{
+            self.ct_field: ContentType.objects.get_for_model(instances[0]),
+            f'{self.fk_field}__in': [instance.pk for instance in instances],
+        })
+        for obj in queryset:
+            related_objects[getattr(obj, self.fk_field)].append(obj)
+
+        return Promise.resolve([related_objects[instance.pk] for instance in instances])
+
+
+class ConfigContextLoader(DataLoader):
+    """
+    Batch the rendering of config context data for devices and virtual machines which have no precompiled data. Keys
+    are the objects themselves.
+    """
+    def __init__(self):
+        super().__init__(get_cache_key=lambda obj: obj.pk)
+
+    def batch_load_fn(self, instances):
+        from extras.configcontexts import ConfigContextMatcher
+
+        uncompiled = [instance for instance in instances if instance._config_context is None]
+        rendered = dict(zip(
+            [instance.pk for instance in uncompiled],
+            ConfigContextMatcher.get().render(uncompiled)
+        ))
+
+        return Promise.resolve([
+            instance._config_context if instance._config_context is not None else rendered[instance.pk]
+            for instance in instances
+        ])
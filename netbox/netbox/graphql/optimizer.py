@@ -0,0 +1,159 @@
+from django.db.models import ManyToManyRel, ManyToOneRel, Model, Prefetch
+from graphql.language.ast import Field, FragmentSpread, InlineFragment
+from mptt.models import MPTTModel
+
+__all__ = (
+    'get_selections',
+    'optimize_queryset',
+)
+
+
+def get_selections(info, field_asts=None):
+    """
+    Return a dictionary mapping the name of each field selected beneath the current field to the AST nodes of its
+    own selections (if any). Fragments are expanded, and selections made under different aliases are merged.
+    """
+    selections = {}
+
+    def _walk(selection_set):
+        if selection_set is None:
+            return
+        for selection in selection_set.selections:
+            if isinstance(selection, Field):
+                node_list = selections.setdefault(selection.name.value, [])
+                if selection.selection_set is not None:
+                    node_list.append(selection)
+            elif isinstance(selection, FragmentSpread):
+                _walk(info.fragments[selection.name.value].selection_set)
+            elif isinstance(selection, InlineFragment):
+                _walk(selection.selection_set)
+
+    for field_ast in field_asts if field_asts is not None else info.field_asts:
+        _walk(field_ast.selection_set)
+
+    return selections
+
+
+def get_model_fields(model):
+    """
+    Return a dictionary mapping the GraphQL name of each field of a model (including the accessor names of reverse
+    relations) to the field itself.
+    """
+    fields = {}
+    for field in model._meta.get_fields():
+        if isinstance(field, (ManyToOneRel, ManyToManyRel)):
+            fields[field.get_accessor_name()] = field
+        else:
+            fields[field.name] = field
+
+    return fields
+
+
+def supports_deferred_fields(model):
+    """
+    Return True if the fields of a model can safely be deferred. Models which access their fields upon initialization
+    (e.g. to record their original values) would otherwise retrieve each deferred field using a separate query.
+    """
+    for cls in model.__mro__:
+        # MPTTModel accounts for deferred fields
+        if not issubclass(cls, Model) or cls in (Model, MPTTModel):
+            continue
+        if '__init__' in vars(cls) or 'from_db' in vars(cls):
+            return False
+
+    return True
+
+
+def _optimize(object_type, selections, info, prefix=''):
+    """
+    Determine the related objects to select and prefetch, and the fields to retrieve, for the given selections on an
+    object type. Returns a tuple of select_related() lookups, Prefetch objects, and only() lookups. The latter is None
+    if the fields to be retrieved cannot be determined (e.g. where a selected field has a custom resolver), in which
+    case all fields of the object type are retrieved.
+    """
+    model = object_type._meta.model
+    model_fields = get_model_fields(model)
+    related_fields = getattr(object_type, '_related_fields', {})
+    select_related = []
+    prefetch_related = []
+    only = set() if supports_deferred_fields(model) else None
+
+    for name, field_asts in selections.items():
+        if name not in object_type._meta.fields:
+            # Introspection field (e.g. __typename)
+            continue
+        model_field = model_fields.get(name)
+        resolver = getattr(object_type, f'resolve_{name}', None)
+
+        # The resources needed to resolve fields which do not correspond to a model field are unknown
+        if model_field is None:
+            only = None
+            continue
+
+        # Concrete fields. Custom resolvers for these (e.g. for choice fields) are assumed to reference only the field
+        # itself.
+        if model_field.concrete and not model_field.is_relation:
+            if only is not None:
+                only.add(f'{prefix}{model_field.name}')
+            continue
+
+        # Forward foreign keys and one-to-one fields
+        is_forward = model_field.concrete and (model_field.many_to_one or model_field.one_to_one)
+        if is_forward and (resolver is None or name in related_fields):
+            if only is not None:
+                only.add(f'{prefix}{name}')
+            related_type = object_type._meta.registry.get_type_for_model(model_field.related_model)
+            select_related.append(f'{prefix}{name}')
+            if related_type is None or not field_asts:
+                continue
+            _select_related, _prefetch_related, _only = _optimize(
+                related_type, get_selections(info, field_asts), info, prefix=f'{prefix}{name}__'
+            )
+            select_related.extend(_select_related)
+            prefetch_related.extend(_prefetch_related)
+            if only is not None and _only is not None:
+                only |= _only
+            continue
+
+        # Reverse foreign keys and many-to-many relations which are resolved in batches
+        if name in related_fields and (model_field.one_to_many or model_field.many_to_many):
+            related_model = model_field.related_model
+            related_type = object_type._meta.registry.get_type_for_model(related_model)
+            queryset = optimize_queryset(
+                related_type.get_queryset(related_model._default_manager.all(), info),
+                info,
+                related_type,
+                get_selections(info, field_asts),
+                # The foreign key to the parent is needed to match prefetched objects to their parents
+                required_fields=[model_field.field.name] if isinstance(model_field, ManyToOneRel) else []
+            )
+            prefetch_related.append(Prefetch(f'{prefix}{name}', queryset=queryset, to_attr=f'_loaded_{name}'))
+            continue
+
+        # The resources needed by any other relation are unknown
+        only = None
+
+    return select_related, prefetch_related, only
+
+
+def optimize_queryset(queryset, info, object_type, selections=None, required_fields=()):
+    """
+    Apply select_related(), prefetch_related(), and only() to a QuerySet of the given object type according to the
+    fields selected by the GraphQL query, so that related objects are retrieved together with their parents.
+
+    Forward relations are selected; reverse and many-to-many relations which are resolved in batches by default are
+    prefetched, restricted to the objects which the user has permission to view. Retrieval is limited to the selected
+    fields only where all of the fields needed to resolve the selection are known.
+    """
+    if selections is None:
+        selections = get_selections(info)
+    select_related, prefetch_related, only = _optimize(object_type, selections, info)
+
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    if only is not None:
+        queryset = queryset.only(*only, *required_fields)
+
+    return queryset
@@ -1,7 +1,10 @@
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import ForeignKey, ManyToManyField, ManyToManyRel, ManyToOneRel, OneToOneField, OneToOneRel
+from graphene.types import Dynamic
 from graphene_django import DjangoObjectType
 
 from extras.graphql.mixins import ChangelogMixin, CustomFieldsMixin, JournalEntriesMixin, TagsMixin
+from .loaders import ObjectLoader, get_loader, load_related_objects
 
 __all__ = (
     'BaseObjectType',
@@ -11,6 +14,41 @@ __all__ = (
 )
 
 
+#
+# Resolvers
+#
+
+def get_related_object_resolver(field):
+    """
+    Return a resolver for a forward foreign key which batches the retrieval of related objects across all parents.
+    """
+    def resolver(root, info):
+        # Defer to the related object if it has already been retrieved (e.g. using select_related())
+        if field.is_cached(root) or getattr(root, field.attname) is None:
+            return getattr(root, field.name)
+        model = field.related_model
+        field_name = field.target_field.name
+        loader = get_loader(info, (model, field_name), ObjectLoader, model._base_manager.all(), field_name)
+        return loader.load(getattr(root, field.attname))
+
+    return resolver
+
+
+def get_related_objects_resolver(accessor, model, registry):
+    """
+    Return a resolver for a reverse foreign key or many-to-many relation which batches the retrieval of related objects
+    across all parents.
+    """
+    def resolver(root, info):
+        # Return the related objects if they have already been prefetched (see optimize_queryset())
+        if hasattr(root, f'_loaded_{accessor}'):
+            return getattr(root, f'_loaded_{accessor}')
+        queryset = registry.get_type_for_model(model).get_queryset(model._default_manager.all(), info)
+        return load_related_objects(root, info, accessor, queryset)
+
+    return resolver
+
+
 #
 # Base types
 #
@@ -18,10 +56,35 @@ __all__ = (
 class BaseObjectType(DjangoObjectType):
     """
     Base GraphQL object type for all NetBox objects. Restricts the model queryset to enforce object permissions.
+    Related objects are retrieved in batches across all objects at the same level of the query.
     """
     class Meta:
         abstract = True
 
+    @classmethod
+    def __init_subclass_with_meta__(cls, **options):
+        super().__init_subclass_with_meta__(**options)
+
+        # Assign batching resolvers to all relations for which no resolver has been defined
+        cls._related_fields = {}
+        for model_field in cls._meta.model._meta.get_fields():
+            if isinstance(model_field, (ManyToOneRel, ManyToManyRel)):
+                name = model_field.get_accessor_name()
+            else:
+                name = model_field.name
+            if not isinstance(cls._meta.fields.get(name), Dynamic) or hasattr(cls, f'resolve_{name}'):
+                continue
+            if isinstance(model_field, (OneToOneField, OneToOneRel)):
+                continue
+            if isinstance(model_field, ForeignKey):
+                setattr(cls, f'resolve_{name}', get_related_object_resolver(model_field))
+            elif isinstance(model_field, (ManyToOneRel, ManyToManyField, ManyToManyRel)):
+                resolver = get_related_objects_resolver(name, model_field.related_model, cls._meta.registry)
+                setattr(cls, f'resolve_{name}', resolver)
+            else:
+                continue
+            cls._related_fields[name] = model_field
+
     @classmethod
     def get_queryset(cls, queryset, info):
         # Enforce object permissions on the queryset
@@ -1,20 +1,63 @@
+import hashlib
+import json
+
 from django.conf import settings
 from django.contrib.auth.views import redirect_to_login
-from django.http import HttpResponseNotFound, HttpResponseForbidden
+from django.core.cache import cache
+from django.http import HttpResponseBadRequest, HttpResponseNotFound, HttpResponseForbidden
 from django.urls import reverse
-from graphene_django.views import GraphQLView as GraphQLView_
+from graphene_django.views import GraphQLView as GraphQLView_, HttpError
+from graphql import GraphQLError
+from graphql.execution import ExecutionResult
 from rest_framework.exceptions import AuthenticationFailed
 
 from netbox.api.authentication import TokenAuthentication
 from netbox.config import get_config
+from users.models import get_permissions_version
+from .backends import CachedGraphQLBackend
+from .cost import get_query_cost
+
+# Retains parsed and validated query documents across requests
+backend = CachedGraphQLBackend()
+
+# The number of seconds for which a persisted query is retained after it was last used
+PERSISTED_QUERY_TIMEOUT = 60 * 60 * 24 * 7
+
+
+def get_persisted_query(query_hash, query=None):
+    """
+    Return the persisted query identified by its SHA256 hash. If the query itself is provided, it is registered under
+    the given hash. Queries which have not been used for PERSISTED_QUERY_TIMEOUT seconds expire.
+    """
+    if not isinstance(query_hash, str):
+        raise HttpError(HttpResponseBadRequest("A persisted query must be identified by its SHA256 hash."))
+    cache_key = f'graphql:persisted_query:{query_hash.lower()}'
+
+    # Register the query
+    if query:
+        if hashlib.sha256(query.encode('utf-8')).hexdigest() != query_hash.lower():
+            raise HttpError(HttpResponseBadRequest("The provided hash does not match the query."))
+        cache.set(cache_key, query, PERSISTED_QUERY_TIMEOUT)
+        return query
+
+    query = cache.get(cache_key)
+    if query is None:
+        raise HttpError(HttpResponseBadRequest("PersistedQueryNotFound"))
+    cache.touch(cache_key, PERSISTED_QUERY_TIMEOUT)
+
+    return query
 
 
 class GraphQLView(GraphQLView_):
     """
-    Extends graphene_django's GraphQLView to support DRF's token-based authentication.
+    Extends graphene_django's GraphQLView to support DRF's token-based authentication, persisted queries, response
+    caching, and the enforcement of a maximum query cost.
     """
     graphiql_template = 'graphiql.html'
 
+    def get_backend(self, request):
+        return backend
+
     def dispatch(self, request, *args, **kwargs):
         config = get_config()
 
@@ -42,3 +85,70 @@ class GraphQLView(GraphQLView_):
             return HttpResponseForbidden("No credentials provided.")
 
         return super().dispatch(request, *args, **kwargs)
+
+    @staticmethod
+    def get_graphql_params(request, data):
+        query, variables, operation_name, id = GraphQLView_.get_graphql_params(request, data)
+
+        # Resolve a persisted query, if one has been referenced (following the Apollo protocol)
+        extensions = request.GET.get('extensions') or data.get('extensions')
+        if extensions and isinstance(extensions, str):
+            try:
+                extensions = json.loads(extensions)
+            except ValueError:
+                raise HttpError(HttpResponseBadRequest("Extensions are invalid JSON."))
+        if isinstance(extensions, dict) and extensions.get('persistedQuery'):
+            query = get_persisted_query(extensions['persistedQuery'].get('sha256Hash'), query)
+
+        return query, variables, operation_name, id
+
+    @staticmethod
+    def get_cache_key(request, query, variables, operation_name):
+        """
+        Return the key under which the response to a query is cached. This reflects the user's permissions, which are
+        versioned to reflect any changes.
+        """
+        key = json.dumps(
+            [query, variables, operation_name, request.user.pk, get_permissions_version()],
+            sort_keys=True,
+            default=str
+        )
+        return f'graphql:response:{hashlib.sha256(key.encode("utf-8")).hexdigest()}'
+
+    def execute_graphql_request(self, request, data, query, variables, operation_name, show_graphiql=False):
+        config = get_config()
+
+        if not query:
+            return super().execute_graphql_request(request, data, query, variables, operation_name, show_graphiql)
+        try:
+            document = self.get_backend(request).document_from_string(self.schema, query)
+        except Exception:
+            # Defer to the parent class for error handling
+            return super().execute_graphql_request(request, data, query, variables, operation_name, show_graphiql)
+        if document.get_operation_type(operation_name) != 'query':
+            return super().execute_graphql_request(request, data, query, variables, operation_name, show_graphiql)
+
+        # Enforce GRAPHQL_MAX_QUERY_COST prior to executing the query
+        if config.GRAPHQL_MAX_QUERY_COST:
+            cost = get_query_cost(self.schema, document.document_ast, variables, operation_name)
+            if cost > config.GRAPHQL_MAX_QUERY_COST:
+                return ExecutionResult(errors=[GraphQLError(
+                    f"The estimated cost of this query ({cost}) exceeds the maximum permitted "
+                    f"({config.GRAPHQL_MAX_QUERY_COST}). Reduce the number of objects requested using the limit "
+                    f"argument."
+                )], invalid=True)
+
+        # Return the cached response, if any
+        if config.GRAPHQL_CACHE_TIMEOUT:
+            cache_key = self.get_cache_key(request, query, variables, operation_name)
+            cached_data = cache.get(cache_key)
+            if cached_data is not None:
+                return ExecutionResult(data=cached_data)
+
+        result = super().execute_graphql_request(request, data, query, variables, operation_name, show_graphiql)
+
+        # Cache successful responses
+        if config.GRAPHQL_CACHE_TIMEOUT and result is not None and not result.errors and not result.invalid:
+            cache.set(cache_key, result.data, config.GRAPHQL_CACHE_TIMEOUT)
+
+        return result
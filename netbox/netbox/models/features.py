@@ -111,7 +111,7 @@ class CustomFieldsMixin(models.Model):
         from extras.models import CustomField
 
         data = {}
-        for field in CustomField.objects.get_for_model(self):
+        for field in CustomField.objects.get_cached_for_model(self):
             value = self.custom_field_data.get(field.name)
             data[field] = field.deserialize(value)
 
@@ -122,7 +122,7 @@ class CustomFieldsMixin(models.Model):
         from extras.models import CustomField
 
         custom_fields = {
-            cf.name: cf for cf in CustomField.objects.get_for_model(self)
+            cf.name: cf for cf in CustomField.objects.get_cached_for_model(self)
         }
 
         # Validate all field values
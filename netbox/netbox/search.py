@@ -1,3 +1,10 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connection, OperationalError
+from psycopg2.errors import QueryCanceled
+
 import circuits.filtersets
 import circuits.tables
 import dcim.filtersets
@@ -15,7 +22,9 @@ from dcim.models import (
     Cable, Device, DeviceType, Interface, Location, Module, ModuleType, PowerFeed, Rack, RackReservation, Site,
     VirtualChassis,
 )
+from extras.models import SearchIndexEntry
 from ipam.models import Aggregate, ASN, IPAddress, Prefix, Service, VLAN, VRF
+from netbox.constants import SEARCH_MAX_RESULTS, SEARCH_MAX_WORKERS
 from tenancy.models import Contact, Tenant, ContactAssignment
 from utilities.utils import count_related
 from wireless.models import WirelessLAN, WirelessLink
@@ -259,3 +268,88 @@ def build_search_types():
 
 
 SEARCH_TYPES = build_search_types()
+
+
+def search_object_type(obj_type, queryset, value):
+    """
+    Search a QuerySet of the given object type for a value. Returns a table of the first page of matching objects.
+    """
+    filterset = SEARCH_TYPES[obj_type]['filterset']
+    queryset = filterset({'q': value}, queryset=queryset).qs
+
+    # Order objects in the search index by relevance
+    if getattr(queryset.model, 'search_fields', None):
+        queryset = SearchIndexEntry.objects.rank(queryset, value)
+
+    table = SEARCH_TYPES[obj_type]['table'](queryset, orderable=False)
+    table.paginate(per_page=SEARCH_MAX_RESULTS)
+
+    # Retrieve the objects now, so that the current thread's database connection is used
+    list(table.page.object_list.data)
+
+    return table
+
+
+def search_object_types(querysets, value, timeout=None, max_workers=SEARCH_MAX_WORKERS):
+    """
+    Search multiple object types for a value concurrently.
+
+    Args:
+        querysets: A dictionary mapping object types (see SEARCH_TYPES) to the QuerySets to be searched
+        value: The value to search for
+        timeout: The number of seconds after which each database query is cancelled (optional)
+        max_workers: The maximum number of object types to search at once (each uses its own database connection)
+
+    Yields a two-tuple of each object type and a table of matching objects, in order of completion. The table is None
+    if the search was cancelled upon reaching the timeout.
+    """
+    # Objects created within the current transaction would not be visible to other database connections
+    if max_workers <= 1 or connection.in_atomic_block:
+        for obj_type, queryset in querysets.items():
+            yield obj_type, search_object_type(obj_type, queryset, value)
+        return
+
+    pending = queue.SimpleQueue()
+    for item in querysets.items():
+        pending.put(item)
+    results = queue.SimpleQueue()
+    cancelled = threading.Event()
+
+    def search(obj_type, queryset):
+        try:
+            if timeout:
+                with connection.cursor() as cursor:
+                    cursor.execute('SET statement_timeout = %s', [int(timeout * 1000)])
+            return search_object_type(obj_type, queryset, value)
+        except OperationalError as e:
+            if isinstance(e.__cause__, QueryCanceled):
+                return None
+            raise
+
+    def worker():
+        try:
+            while not cancelled.is_set():
+                try:
+                    obj_type, queryset = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    results.put((obj_type, search(obj_type, queryset)))
+                except Exception as e:
+                    results.put((obj_type, e))
+        finally:
+            connection.close()
+
+    worker_count = min(max_workers, len(querysets))
+    with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix='search') as executor:
+        for _ in range(worker_count):
+            executor.submit(worker)
+        try:
+            for _ in range(len(querysets)):
+                obj_type, result = results.get()
+                if isinstance(result, Exception):
+                    raise result
+                yield obj_type, result
+        finally:
+            # Stop searching any remaining object types if the caller has stopped consuming results
+            cancelled.set()
@@ -3,3 +3,6 @@ from django.dispatch import Signal
 
 # Signals that a model has completed its clean() method
 post_clean = Signal()
+
+# Signals that objects have been created or updated in bulk, without calling their save() methods
+post_bulk_save = Signal()
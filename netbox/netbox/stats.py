@@ -0,0 +1,79 @@
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connection
+from django_rq import get_queue
+
+__all__ = (
+    'get_object_counts',
+    'refresh_object_counts',
+)
+
+# Cached counts are retained (and displayed while being refreshed) for this multiple of the cache timeout
+STALE_COUNT_RETENTION = 10
+
+
+def get_counts_sql(querysets):
+    """
+    Compile a single SQL statement which returns the number of objects in each of the given QuerySets as one row.
+    """
+    columns = []
+    params = []
+    for i, queryset in enumerate(querysets):
+        try:
+            sql, qs_params = queryset.order_by().values('pk').query.sql_with_params()
+        except EmptyResultSet:
+            columns.append('0')
+            continue
+        columns.append(f'(SELECT COUNT(*) FROM ({sql}) AS count_{i})')
+        params.extend(qs_params)
+
+    return f'SELECT {", ".join(columns)}', params
+
+
+def count_objects(sql, params):
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return list(cursor.fetchone())
+
+
+def refresh_object_counts(cache_key, sql, params, cache_timeout):
+    """
+    Count and cache the objects in a set of QuerySets (see get_object_counts()).
+    """
+    counts = count_objects(sql, params)
+    cache.set(cache_key, (time.time(), counts), cache_timeout * STALE_COUNT_RETENTION)
+    cache.delete(f'{cache_key}:refresh')
+
+    return counts
+
+
+def get_object_counts(querysets, cache_timeout=0):
+    """
+    Return the number of objects in each of the given QuerySets, in order, using a single database query.
+
+    If a cache timeout is specified, counts are cached per unique set of QuerySets (and thus per set of permission
+    constraints). Once the timeout has passed, the cached counts continue to be returned while they are refreshed by
+    a background worker, so that only the first request for a set of QuerySets waits for the counts.
+    """
+    querysets = list(querysets)
+    if not querysets:
+        return []
+    sql, params = get_counts_sql(querysets)
+    if not cache_timeout:
+        return count_objects(sql, params)
+
+    digest = hashlib.sha256(f'{sql}{params}'.encode('utf-8')).hexdigest()
+    cache_key = f'object_counts:{digest}'
+    cached = cache.get(cache_key)
+    if cached is None:
+        return refresh_object_counts(cache_key, sql, params, cache_timeout)
+
+    # Schedule a refresh of expired counts, unless one is already pending
+    updated, counts = cached
+    if time.time() - updated > cache_timeout and cache.add(f'{cache_key}:refresh', True, cache_timeout):
+        get_queue('low').enqueue(refresh_object_counts, cache_key, sql, params, cache_timeout)
+
+    return counts
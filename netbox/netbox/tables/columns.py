@@ -13,6 +13,7 @@ from django_tables2.columns import library
 from django_tables2.utils import Accessor
 
 from extras.choices import CustomFieldTypeChoices
+from extras.models import CustomField
 from utilities.utils import content_type_identifier, content_type_name, get_viewname
 
 __all__ = (
@@ -431,7 +432,27 @@ class CustomFieldColumn(tables.Column):
             return f'<a href="{item.get_absolute_url()}">{item}</a>'
         return item
 
-    def render(self, value):
+    @staticmethod
+    def _get_related_objects(table):
+        """
+        Resolve the objects referenced by custom fields for all rows in the table (or on the current page) at once.
+        """
+        if not hasattr(table, '_custom_field_objects'):
+            if hasattr(table, 'page'):
+                records = [row.record for row in table.page.object_list]
+            else:
+                records = table.data
+            table._custom_field_objects = CustomField.objects.get_related_objects(
+                table._meta.model, [record.custom_field_data for record in records]
+            )
+        return table._custom_field_objects
+
+    def _deserialize(self, value, table):
+        if self.customfield.type in (CustomFieldTypeChoices.TYPE_OBJECT, CustomFieldTypeChoices.TYPE_MULTIOBJECT):
+            return self.customfield.deserialize(value, self._get_related_objects(table))
+        return self.customfield.deserialize(value)
+
+    def render(self, value, table):
         if self.customfield.type == CustomFieldTypeChoices.TYPE_BOOLEAN and value is True:
             return mark_safe('<i class="mdi mdi-check-bold text-success"></i>')
         if self.customfield.type == CustomFieldTypeChoices.TYPE_BOOLEAN and value is False:
@@ -442,18 +463,18 @@ class CustomFieldColumn(tables.Column):
             return ', '.join(v for v in value)
         if self.customfield.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
             return mark_safe(', '.join([
-                self._likify_item(obj) for obj in self.customfield.deserialize(value)
+                self._likify_item(obj) for obj in self._deserialize(value, table)
             ]))
         if value is not None:
-            obj = self.customfield.deserialize(value)
+            obj = self._deserialize(value, table)
             return mark_safe(self._likify_item(obj))
         return self.default
 
-    def value(self, value):
+    def value(self, value, table):
         if isinstance(value, list):
-            return ','.join(str(v) for v in self.customfield.deserialize(value))
+            return ','.join(str(v) for v in self._deserialize(value, table))
         if value is not None:
-            return self.customfield.deserialize(value)
+            return self._deserialize(value, table)
         return self.default
 
 
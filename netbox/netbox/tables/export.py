@@ -0,0 +1,160 @@
+import csv
+import logging
+import tempfile
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.http import QueryDict
+from django.utils.encoding import force_str
+from django.utils.module_loading import import_string
+from django_tables2.data import TableQuerysetData
+from django_tables2.rows import BoundRow
+
+from extras.choices import JobResultStatusChoices
+from utilities.utils import chunked_queryset
+
+__all__ = (
+    'get_export_columns',
+    'get_export_file_name',
+    'get_export_storage',
+    'run_table_export',
+    'table_to_csv',
+)
+
+# Number of objects retrieved and rendered at a time when exporting a table
+EXPORT_CHUNK_SIZE = 1000
+
+# Content types of the files produced by background exports
+EXPORT_CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'yaml': 'text/yaml',
+}
+
+
+def get_export_storage():
+    """
+    Return the storage for the files produced by background exports. These files are kept in EXPORTS_ROOT, outside of
+    MEDIA_ROOT (which is served to all authenticated users), and are served only by ExportDownloadView.
+    """
+    return FileSystemStorage(location=settings.EXPORTS_ROOT)
+
+
+def get_export_file_name(job_id):
+    """
+    Return the name under which the file produced by a background export is stored.
+    """
+    return str(job_id)
+
+
+class Echo:
+    """
+    A file-like object which returns (rather than stores) the value written to it, for use with csv.writer.
+    """
+    def write(self, value):
+        return value
+
+
+def get_export_columns(table, columns=None):
+    """
+    Return the names of the table columns to be exported.
+
+    Args:
+        table: The Table instance to export
+        columns: A list of specific columns to include. If None, all columns will be exported.
+    """
+    return [
+        column.name for column in table.columns.iterall()
+        if not column.column.exclude_from_export and
+        column.name not in ('pk', 'actions') and
+        (not columns or column.name in columns)
+    ]
+
+
+def iter_table_rows(table, column_names, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield lists of the exported values of the table's rows (less the header), one list per chunk of rows. Rows
+    backed by a QuerySet are retrieved in chunks, applying the table's prefetches to each chunk.
+    """
+    if not isinstance(table.data, TableQuerysetData):
+        rows = table.as_values(exclude_columns=[name for name in table.columns.names() if name not in column_names])
+        next(rows)
+        yield list(rows)
+        return
+
+    for chunk in chunked_queryset(table.data.data, chunk_size):
+        rows = []
+        for record in chunk:
+            row = BoundRow(record, table=table)
+            rows.append([force_str(row.get_cell_value(name), strings_only=True) for name in column_names])
+        yield rows
+
+
+def table_to_csv(table, columns=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Render a table in CSV format, yielding the output in parts. The output is the same as exporting the table using
+    django-tables2's TableExport, but the rows are rendered one chunk at a time rather than all in memory at once.
+
+    Args:
+        table: The Table instance to export
+        columns: A list of specific columns to include. If None, all columns will be exported.
+        chunk_size: The number of rows to retrieve and render at a time
+    """
+    column_names = get_export_columns(table, columns)
+    writer = csv.writer(Echo())
+
+    yield writer.writerow([force_str(table.columns[name].header, strings_only=True) for name in column_names])
+    for rows in iter_table_rows(table, column_names, chunk_size):
+        yield ''.join(writer.writerow(row) for row in rows)
+
+
+def run_table_export(job_result, view, query_params, export_format='csv', columns=None, *args, **kwargs):
+    """
+    Export the objects listed by an ObjectListView to a file in the background, saving the file to the export storage
+    (see get_export_storage()) under the job's ID. The file's name and content type are recorded in the job result's
+    data.
+
+    Args:
+        job_result: The JobResult tracking the export
+        view: The dotted path of the ObjectListView class
+        query_params: The URL-encoded query parameters used to filter the objects
+        export_format: The format of the exported file: "csv" (table data) or "yaml" (see ObjectListView.export_yaml())
+        columns: A list of specific table columns to include. If None, all columns will be exported.
+    """
+    logger = logging.getLogger('netbox.tables.export')
+    job_result.set_status(JobResultStatusChoices.STATUS_RUNNING)
+    job_result.save()
+
+    try:
+        view = import_string(view)()
+        queryset = view.queryset.restrict(job_result.user, 'view')
+        if view.filterset:
+            queryset = view.filterset(QueryDict(query_params), queryset).qs
+        if export_format == 'yaml':
+            view.queryset = queryset
+            output = view.export_yaml()
+        else:
+            output = table_to_csv(view.table(queryset, user=job_result.user), columns)
+
+        with tempfile.TemporaryFile() as f:
+            for part in output:
+                f.write(part.encode('utf-8'))
+            f.seek(0)
+            storage = get_export_storage()
+            name = get_export_file_name(job_result.job_id)
+            storage.delete(name)
+            storage.save(name, File(f))
+
+        job_result.data = {
+            'filename': f'netbox_{queryset.model._meta.verbose_name_plural}.{export_format}',
+            'content_type': EXPORT_CONTENT_TYPES[export_format],
+        }
+        job_result.set_status(JobResultStatusChoices.STATUS_COMPLETED)
+    except Exception as e:
+        logger.error(f"Error exporting {view}: {e}")
+        job_result.data = {
+            'error': str(e),
+        }
+        job_result.set_status(JobResultStatusChoices.STATUS_ERRORED)
+
+    job_result.save()
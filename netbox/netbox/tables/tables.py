@@ -178,7 +178,7 @@ class NetBoxTable(BaseTable):
 
         # Add custom field & custom link columns
         content_type = ContentType.objects.get_for_model(self._meta.model)
-        custom_fields = CustomField.objects.filter(content_types=content_type)
+        custom_fields = CustomField.objects.get_cached_for_model(self._meta.model)
         extra_columns.extend([
             (f'cf_{cf.name}', columns.CustomFieldColumn(cf)) for cf in custom_fields
         ])
@@ -1,7 +1,26 @@
-from django.test import override_settings
+import hashlib
+import json
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from graphql import parse, validate as validate_document
 
+from dcim.choices import InterfaceModeChoices, InterfaceTypeChoices
+from dcim.models import Device, DeviceRole, DeviceType, Interface, Manufacturer, Rack, Region, Site
+from extras.models import Tag
+from ipam.models import IPAddress, Prefix, VLAN, VRF
+from users.models import ObjectPermission
+from netbox.graphql.cost import QueryCostAnalyzer, get_query_cost
+from netbox.graphql.schema import schema
+from netbox.graphql.views import backend, PERSISTED_QUERY_TIMEOUT
+from tenancy.models import Tenant
 from utilities.testing import disable_warnings, TestCase
+from virtualization.models import Cluster, ClusterType, VirtualMachine, VMInterface
 
 
 class GraphQLTestCase(TestCase):
@@ -34,3 +53,431 @@ class GraphQLTestCase(TestCase):
         response = self.client.get(url, **header)
         with disable_warnings('django.request'):
             self.assertHttpStatus(response, 302)  # Redirect to login page
+
+
+class GraphQLBatchingTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        manufacturer = Manufacturer.objects.create(name='Manufacturer 1', slug='manufacturer-1')
+        cls.device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Device Type 1', slug='device-type-1')
+        cls.device_role = DeviceRole.objects.create(name='Device Role 1', slug='device-role-1')
+        cls.site = Site.objects.create(name='Site 1', slug='site-1')
+        cls.tag = Tag.objects.create(name='Tag 1', slug='tag-1')
+
+    def create_devices(self, count):
+        for i in range(Device.objects.count(), Device.objects.count() + count):
+            device = Device.objects.create(
+                name=f'Device {i}', device_type=self.device_type, device_role=self.device_role, site=self.site,
+                local_context_data={'device': i}
+            )
+            device.tags.add(self.tag)
+            for j in range(2):
+                interface = Interface.objects.create(device=device, name=f'Interface {j}', type=InterfaceTypeChoices.TYPE_1GE_FIXED)
+                IPAddress.objects.create(address=f'10.{i}.{j}.1/24', assigned_object=interface)
+
+    def execute_query(self, query):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(reverse('graphql'), data={'query': query})
+        self.assertHttpStatus(response, 200)
+        data = json.loads(response.content)
+        self.assertNotIn('errors', data)
+        return data['data'], len(context.captured_queries)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_related_objects_batched(self):
+        """
+        The number of queries needed to resolve nested relations should not depend on the number of objects.
+        """
+        query = """
+        {
+            device_list {
+                name
+                site { name }
+                interfaces { name ip_addresses { address } }
+                tags { name }
+                config_context
+                changelog { id }
+            }
+        }
+        """
+        self.create_devices(2)
+        self.execute_query(query)
+        data, query_count = self.execute_query(query)
+        self.assertEqual(len(data['device_list']), 2)
+
+        self.create_devices(5)
+        with self.assertNumQueries(query_count):
+            data, _ = self.execute_query(query)
+        self.assertEqual(len(data['device_list']), 7)
+
+        device = data['device_list'][6]
+        self.assertEqual(device['site']['name'], 'Site 1')
+        self.assertEqual(len(device['interfaces']), 2)
+        self.assertEqual(device['interfaces'][1]['ip_addresses'][0]['address'], '10.6.1.1/24')
+        self.assertEqual(device['tags'][0]['name'], 'Tag 1')
+        self.assertEqual(device['config_context'], {'device': 6})
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['dcim.device', 'dcim.interface'])
+    def test_related_objects_restricted(self):
+        """
+        Batched related objects should be restricted to those which the user has permission to view.
+        """
+        self.create_devices(2)
+        data, _ = self.execute_query('{ device_list { interfaces { ip_addresses { address } } } }')
+        for device in data['device_list']:
+            for interface in device['interfaces']:
+                self.assertEqual(interface['ip_addresses'], [])
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+class GraphQLQueryOptimizationTestCase(TestCase):
+    """
+    Regression tests for the number of database queries needed to resolve representative GraphQL queries. Related
+    objects are selected or prefetched by ObjectListField, so the number of queries must not depend on the number of
+    objects returned.
+    """
+    @classmethod
+    def setUpTestData(cls):
+        region = Region.objects.create(name='Region 1', slug='region-1')
+        tenant = Tenant.objects.create(name='Tenant 1', slug='tenant-1')
+        site = Site.objects.create(name='Site 1', slug='site-1', region=region, tenant=tenant)
+        rack = Rack.objects.create(name='Rack 1', site=site)
+        manufacturer = Manufacturer.objects.create(name='Manufacturer 1', slug='manufacturer-1')
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Device Type 1', slug='device-type-1')
+        device_role = DeviceRole.objects.create(name='Device Role 1', slug='device-role-1')
+        vrf = VRF.objects.create(name='VRF 1')
+        vlan = VLAN.objects.create(vid=100, name='VLAN 100', tenant=tenant)
+        cluster_type = ClusterType.objects.create(name='Cluster Type 1', slug='cluster-type-1')
+        cluster = Cluster.objects.create(name='Cluster 1', type=cluster_type, site=site)
+
+        for i in range(3):
+            device = Device.objects.create(
+                name=f'Device {i}', device_type=device_type, device_role=device_role, site=site, rack=rack,
+                tenant=tenant
+            )
+            virtual_machine = VirtualMachine.objects.create(name=f'VM {i}', cluster=cluster, tenant=tenant)
+            Prefix.objects.create(prefix=f'10.{i}.0.0/16', vrf=vrf, site=site, vlan=vlan)
+            for j in range(2):
+                interface = Interface.objects.create(
+                    device=device, name=f'Interface {j}', type=InterfaceTypeChoices.TYPE_1GE_FIXED,
+                    mode=InterfaceModeChoices.MODE_ACCESS, untagged_vlan=vlan
+                )
+                vminterface = VMInterface.objects.create(
+                    virtual_machine=virtual_machine, name=f'Interface {j}', mode=InterfaceModeChoices.MODE_TAGGED
+                )
+                vminterface.tagged_vlans.add(vlan)
+                IPAddress.objects.create(address=f'10.{i}.{j}.1/24', vrf=vrf, tenant=tenant, assigned_object=interface)
+
+    def execute_query(self, query, num_queries):
+        request = RequestFactory().get('/')
+        request.user = self.user
+        # Warm up any caches (e.g. content types)
+        schema.execute(query, context_value=request)
+        # The FilterSet retrieves any custom fields
+        with self.assertNumQueries(num_queries + 1):
+            result = schema.execute(query, context_value=request)
+        self.assertIsNone(result.errors)
+        return result.data
+
+    def test_dcim_device_list(self):
+        query = """
+        {
+            device_list {
+                name
+                site { name region { name } }
+                rack { name }
+                device_type { model manufacturer { name } }
+                interfaces { name untagged_vlan { vid } }
+            }
+        }
+        """
+        # Devices (with all forward relations) and interfaces (with VLANs)
+        data = self.execute_query(query, 2)
+        self.assertEqual(len(data['device_list']), 3)
+        device = data['device_list'][0]
+        self.assertEqual(device['site']['region']['name'], 'Region 1')
+        self.assertEqual(device['device_type']['manufacturer']['name'], 'Manufacturer 1')
+        self.assertEqual(len(device['interfaces']), 2)
+        self.assertEqual(device['interfaces'][0]['untagged_vlan']['vid'], 100)
+
+    def test_dcim_site_list(self):
+        query = """
+        {
+            site_list {
+                name
+                tenant { name }
+                racks { name }
+                devices { name rack { name } }
+            }
+        }
+        """
+        # Sites, racks, and devices
+        data = self.execute_query(query, 3)
+        site = data['site_list'][0]
+        self.assertEqual(site['tenant']['name'], 'Tenant 1')
+        self.assertEqual(len(site['racks']), 1)
+        self.assertEqual(len(site['devices']), 3)
+        self.assertEqual(site['devices'][0]['rack']['name'], 'Rack 1')
+
+    def test_ipam_ip_address_list(self):
+        query = """
+        {
+            ip_address_list {
+                address
+                vrf { name }
+                tenant { name }
+            }
+        }
+        """
+        data = self.execute_query(query, 1)
+        self.assertEqual(len(data['ip_address_list']), 6)
+        self.assertEqual(data['ip_address_list'][0]['vrf']['name'], 'VRF 1')
+
+    def test_ipam_prefix_list(self):
+        query = """
+        {
+            prefix_list {
+                prefix
+                vrf { name }
+                site { name }
+                vlan { vid tenant { name } }
+            }
+        }
+        """
+        data = self.execute_query(query, 1)
+        self.assertEqual(len(data['prefix_list']), 3)
+        self.assertEqual(data['prefix_list'][0]['vlan']['tenant']['name'], 'Tenant 1')
+
+    def test_ipam_vlan_list(self):
+        query = """
+        {
+            vlan_list {
+                vid
+                interfaces_as_untagged { name device { name } }
+                vminterfaces_as_tagged { name virtual_machine { name } }
+            }
+        }
+        """
+        # VLANs, device interfaces, and VM interfaces
+        data = self.execute_query(query, 3)
+        vlan = data['vlan_list'][0]
+        self.assertEqual(len(vlan['interfaces_as_untagged']), 6)
+        self.assertEqual(len(vlan['vminterfaces_as_tagged']), 6)
+        self.assertEqual(vlan['vminterfaces_as_tagged'][0]['virtual_machine']['name'], 'VM 0')
+
+    def test_virtualization_virtual_machine_list(self):
+        query = """
+        {
+            virtual_machine_list {
+                name
+                cluster { name type { name } site { name } }
+                tenant { name }
+                interfaces { name tagged_vlans { vid } }
+            }
+        }
+        """
+        # Virtual machines, interfaces, and tagged VLANs
+        data = self.execute_query(query, 3)
+        self.assertEqual(len(data['virtual_machine_list']), 3)
+        virtual_machine = data['virtual_machine_list'][0]
+        self.assertEqual(virtual_machine['cluster']['type']['name'], 'Cluster Type 1')
+        self.assertEqual(virtual_machine['interfaces'][0]['tagged_vlans'][0]['vid'], 100)
+
+    def test_only_selected_fields(self):
+        """
+        Only the selected fields should be retrieved where no custom resolvers are involved.
+        """
+        request = RequestFactory().get('/')
+        request.user = self.user
+        with CaptureQueriesContext(connection) as context:
+            schema.execute('{ device_list { name site { name } } }', context_value=request)
+        sql = context.captured_queries[-1]['sql']
+        self.assertNotIn('"dcim_device"."comments"', sql)
+        self.assertNotIn('"dcim_site"."comments"', sql)
+        self.assertIn('"dcim_site"."name"', sql)
+
+        # Custom field data must be retrieved to resolve custom fields
+        with CaptureQueriesContext(connection) as context:
+            schema.execute('{ device_list { name custom_fields } }', context_value=request)
+        self.assertIn('"dcim_device"."custom_field_data"', context.captured_queries[-1]['sql'])
+
+
+@override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+class GraphQLPaginationTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(1, 11):
+            site = Site.objects.create(name=f'Site {i}', slug=f'site-{i}')
+            for j in range(1, 3):
+                Rack.objects.create(name=f'Rack {i}-{j}', site=site)
+
+    def execute_query(self, query, variables=None):
+        data = {'query': query}
+        if variables is not None:
+            data['variables'] = variables
+        response = self.client.post(reverse('graphql'), data=json.dumps(data), content_type='application/json')
+        return response, json.loads(response.content)
+
+    def test_limit_offset(self):
+        response, data = self.execute_query('{ site_list(limit: 3, offset: 2) { name } }')
+        self.assertHttpStatus(response, 200)
+        self.assertEqual([site['name'] for site in data['data']['site_list']], ['Site 3', 'Site 4', 'Site 5'])
+
+        # Offset without a limit
+        response, data = self.execute_query('{ site_list(offset: 8) { name } }')
+        self.assertEqual([site['name'] for site in data['data']['site_list']], ['Site 9', 'Site 10'])
+
+    def test_invalid_limit(self):
+        with self.assertLogs('graphql.execution', level='ERROR'):
+            response, data = self.execute_query('{ site_list(limit: -1) { name } }')
+        self.assertIn('errors', data)
+
+    @override_settings(GRAPHQL_DEFAULT_PAGE_SIZE=4)
+    def test_default_page_size(self):
+        response, data = self.execute_query('{ site_list { name } }')
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(len(data['data']['site_list']), 4)
+
+        # A limit of zero returns all objects
+        response, data = self.execute_query('{ site_list(limit: 0) { name } }')
+        self.assertEqual(len(data['data']['site_list']), 10)
+
+    def test_query_cost(self):
+        # Populate pg_class.reltuples for the Site and Rack tables
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE dcim_site')
+            cursor.execute('ANALYZE dcim_rack')
+
+        # Each of 10 sites
+        self.assertEqual(get_query_cost(schema, parse('{ site_list { name } }')), 10)
+        # Each of 2 sites, plus 2 racks per site
+        self.assertEqual(get_query_cost(schema, parse('{ site_list(limit: 2) { racks { name } } }')), 6)
+        # Each of 3 racks, plus the site of each
+        query = parse(
+            'query ($limit: Int) { rack_list(limit: $limit) { ...RackFields } } '
+            'fragment RackFields on RackType { site { name } }'
+        )
+        self.assertEqual(get_query_cost(schema, query, variables={'limit': 3}), 6)
+
+    def test_query_cost_unanalyzed_tables(self):
+        # Tables without an estimated size are counted
+        with patch('netbox.graphql.cost.get_estimated_count', return_value=None):
+            self.assertEqual(get_query_cost(schema, parse('{ site_list { name } }')), 10)
+            self.assertEqual(get_query_cost(schema, parse('{ site_list(limit: 2) { racks { name } } }')), 6)
+
+    def test_query_cost_non_model_list(self):
+        document = parse('{ site_list(limit: 0) { name } }')
+        field_ast = document.definitions[0].selection_set.selections[0]
+
+        # Lists of objects other than model instances are assumed to return the largest page
+        with override_settings(MAX_PAGE_SIZE=100, GRAPHQL_DEFAULT_PAGE_SIZE=50):
+            self.assertEqual(QueryCostAnalyzer(schema, document).get_row_count(field_ast, None, None), 100)
+
+        # If no maximum page size is enforced, the default page size (or a single object) is assumed
+        with override_settings(MAX_PAGE_SIZE=0, GRAPHQL_DEFAULT_PAGE_SIZE=50):
+            self.assertEqual(QueryCostAnalyzer(schema, document).get_row_count(field_ast, None, None), 50)
+        with override_settings(MAX_PAGE_SIZE=0, GRAPHQL_DEFAULT_PAGE_SIZE=0):
+            self.assertEqual(QueryCostAnalyzer(schema, document).get_row_count(field_ast, None, None), 1)
+
+    @override_settings(GRAPHQL_MAX_QUERY_COST=5)
+    def test_max_query_cost(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE dcim_site')
+
+        response, data = self.execute_query('{ site_list { name } }')
+        self.assertHttpStatus(response, 400)
+        self.assertIn('estimated cost', data['errors'][0]['message'])
+
+        response, data = self.execute_query('query ($limit: Int) { site_list(limit: $limit) { name } }', {'limit': 5})
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(len(data['data']['site_list']), 5)
+
+
+class GraphQLRequestCachingTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(1, 4):
+            Site.objects.create(name=f'Site {i}', slug=f'site-{i}')
+
+    def execute_query(self, data):
+        response = self.client.post(reverse('graphql'), data=json.dumps(data), content_type='application/json')
+        return response, json.loads(response.content)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_document_cache(self):
+        """
+        Repeated queries should be parsed and validated only once.
+        """
+        backend.document_from_string.cache_clear()
+        query = '{ site_list { name slug } }'
+        with patch('netbox.graphql.backends.validate', wraps=validate_document) as validate:
+            for _ in range(3):
+                response, data = self.execute_query({'query': query})
+                self.assertHttpStatus(response, 200)
+                self.assertEqual(len(data['data']['site_list']), 3)
+        self.assertEqual(validate.call_count, 1)
+
+        # Validation errors should be reported for each execution of an invalid query
+        for _ in range(2):
+            response, data = self.execute_query({'query': '{ site_list { invalid_field } }'})
+            self.assertHttpStatus(response, 400)
+            self.assertIn('invalid_field', data['errors'][0]['message'])
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=['*'])
+    def test_persisted_query(self):
+        query = '{ site_list { name } }'
+        query_hash = hashlib.sha256(query.encode('utf-8')).hexdigest()
+        cache.delete(f'graphql:persisted_query:{query_hash}')
+        extensions = {'persistedQuery': {'version': 1, 'sha256Hash': query_hash}}
+
+        # Unregistered query
+        with disable_warnings('django.request'):
+            response, data = self.execute_query({'extensions': extensions})
+        self.assertHttpStatus(response, 400)
+        self.assertEqual(data['errors'][0]['message'], 'PersistedQueryNotFound')
+
+        # Register the query
+        response, data = self.execute_query({'query': query, 'extensions': extensions})
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(len(data['data']['site_list']), 3)
+
+        # Execute the query by its hash alone (via GET)
+        response = self.client.get(
+            reverse('graphql'), {'extensions': json.dumps(extensions)}, HTTP_ACCEPT='application/json'
+        )
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(len(json.loads(response.content)['data']['site_list']), 3)
+
+        # Persisted queries expire
+        self.assertTrue(0 < cache.ttl(f'graphql:persisted_query:{query_hash}') <= PERSISTED_QUERY_TIMEOUT)
+
+        # A query which does not match its hash should be rejected
+        extensions['persistedQuery']['sha256Hash'] = hashlib.sha256(b'foo').hexdigest()
+        with disable_warnings('django.request'):
+            response, data = self.execute_query({'query': query, 'extensions': extensions})
+        self.assertHttpStatus(response, 400)
+
+    @override_settings(GRAPHQL_CACHE_TIMEOUT=60)
+    def test_response_cache(self):
+        query = {'query': '{ site_list { name } }'}
+        self.add_permissions('dcim.view_site')
+        response, data = self.execute_query(query)
+        self.assertEqual(len(data['data']['site_list']), 3)
+
+        # The cached response should be returned
+        Site.objects.create(name='Site 4', slug='site-4')
+        response, data = self.execute_query(query)
+        self.assertEqual(len(data['data']['site_list']), 3)
+
+        # A change to permissions should invalidate the cached response
+        ObjectPermission.objects.create(name='Permission 1', actions=['view'])
+        response, data = self.execute_query(query)
+        self.assertEqual(len(data['data']['site_list']), 4)
+
+        # Responses are not shared among users
+        self.client.force_login(User.objects.create_user(username='testuser2'))
+        response, data = self.execute_query(query)
+        self.assertEqual(data['data']['site_list'], [])
@@ -1,8 +1,11 @@
 from django.template import Context, Template
 from django.test import TestCase
+from django_tables2.export import TableExport
 
 from dcim.models import Site
+from dcim.tables import SiteTable
 from netbox.tables import NetBoxTable, columns
+from netbox.tables.export import table_to_csv
 from utilities.testing import create_tags
 
 
@@ -35,3 +38,38 @@ class TagColumnTest(TestCase):
             'table': table
         })
         template.render(context)
+
+
+class TableExportTest(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        tags = create_tags('Alpha', 'Bravo')
+
+        sites = [
+            Site(name=f'Site {i}', slug=f'site-{i}', description='Line 1\nLine 2, "quoted"') for i in range(1, 6)
+        ]
+        Site.objects.bulk_create(sites)
+        for site in sites[:3]:
+            site.tags.add(*tags)
+
+    def test_table_to_csv(self):
+        table = SiteTable(Site.objects.all())
+        expected = TableExport(TableExport.CSV, table, exclude_columns=('pk', 'actions')).export()
+
+        # Output should match that of django-tables2, regardless of the chunk size
+        self.assertEqual(''.join(table_to_csv(table)), expected)
+        self.assertEqual(''.join(table_to_csv(table, chunk_size=2)), expected)
+
+    def test_table_to_csv_columns(self):
+        table = SiteTable(Site.objects.all())
+        output = ''.join(table_to_csv(table, columns=['name', 'tags']))
+
+        self.assertEqual(output.splitlines()[:2], ['Name,Tags', 'Site 1,"Alpha,Bravo"'])
+
+    def test_table_to_csv_prefetch(self):
+        table = TagColumnTable(Site.objects.all())
+
+        # The table's prefetches should be applied to each chunk of rows
+        with self.assertNumQueries(4):
+            ''.join(table_to_csv(table, columns=['name', 'tags'], chunk_size=2))
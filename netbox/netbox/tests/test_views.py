@@ -1,8 +1,17 @@
+import time
 import urllib.parse
+from unittest.mock import patch
 
-from utilities.testing import TestCase
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
 
+from dcim.models import Site
+from netbox.search import search_object_types
+from netbox.stats import get_object_counts, refresh_object_counts
+from tenancy.models import Tenant
+from utilities.testing import TestCase, outside_transaction
+
 
 class HomeViewTestCase(TestCase):
 
@@ -13,6 +22,18 @@ class HomeViewTestCase(TestCase):
         response = self.client.get(url)
         self.assertHttpStatus(response, 200)
 
+    def test_home_stats(self):
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)])
+        self.add_permissions('dcim.view_site')
+
+        response = self.client.get(reverse('home'))
+        self.assertHttpStatus(response, 200)
+        org_items = {item['label']: item for item in response.context['stats'][0][1]}
+        self.assertEqual(org_items['Sites']['count'], 3)
+        self.assertFalse(org_items['Sites']['disabled'])
+        self.assertIsNone(org_items['Tenants']['count'])
+        self.assertTrue(org_items['Tenants']['disabled'])
+
     def test_search(self):
 
         url = reverse('search')
@@ -22,3 +43,96 @@ class HomeViewTestCase(TestCase):
 
         response = self.client.get('{}?{}'.format(url, urllib.parse.urlencode(params)))
         self.assertHttpStatus(response, 200)
+
+    def test_search_results(self):
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)])
+        self.add_permissions('dcim.view_site')
+
+        url = reverse('search')
+        response = self.client.get('{}?{}'.format(url, urllib.parse.urlencode({'q': 'site'})))
+        self.assertHttpStatus(response, 200)
+        results = response.context['results']
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['name'], 'sites')
+        self.assertEqual(results[0]['table'].page.paginator.count, 3)
+
+
+class SearchObjectTypesTestCase(TestCase):
+
+    def test_search_concurrently(self):
+        querysets = {
+            'site': Site.objects.all(),
+            'tenant': Tenant.objects.all(),
+        }
+
+        # Objects must be searched using the current database connection within a transaction
+        Site.objects.create(name='Site 1', slug='site-1')
+        results = dict(search_object_types(querysets, 'site'))
+        self.assertEqual(results['site'].page.paginator.count, 1)
+        self.assertEqual(results['tenant'].page.paginator.count, 0)
+
+        # Outside a transaction, each object type is searched using a separate connection
+        with outside_transaction():
+            results = dict(search_object_types(querysets, 'site'))
+        self.assertEqual(set(results), {'site', 'tenant'})
+
+    def test_search_timeout(self):
+        querysets = {
+            'site': Site.objects.extra(where=['(SELECT pg_sleep(1)) IS NOT NULL']),
+            'tenant': Tenant.objects.all(),
+        }
+
+        with outside_transaction():
+            results = dict(search_object_types(querysets, 'site', timeout=0.1))
+        self.assertIsNone(results['site'])
+        self.assertIsNotNone(results['tenant'])
+
+
+class ObjectCountsTestCase(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Site.objects.bulk_create([Site(name=f'Site {i}', slug=f'site-{i}') for i in range(1, 4)])
+        Tenant.objects.create(name='Tenant 1', slug='tenant-1')
+
+    def test_object_counts(self):
+        querysets = (
+            Site.objects.all(),
+            Site.objects.filter(name='Site 1'),
+            Site.objects.none(),
+            Tenant.objects.all(),
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(get_object_counts(querysets), [3, 1, 0, 1])
+
+    def test_cached_object_counts(self):
+        querysets = (Site.objects.filter(name__startswith='Site'),)
+        cache.delete_pattern('object_counts:*')
+        self.assertEqual(get_object_counts(querysets, cache_timeout=60), [3])
+
+        # Cached counts should be returned
+        Site.objects.create(name='Site 4', slug='site-4')
+        with self.assertNumQueries(0):
+            self.assertEqual(get_object_counts(querysets, cache_timeout=60), [3])
+
+        # Once expired, the counts should be refreshed in the background while the cached counts are returned
+        with patch('netbox.stats.time.time', return_value=time.time() + 120), patch('netbox.stats.get_queue') as get_queue:
+            self.assertEqual(get_object_counts(querysets, cache_timeout=60), [3])
+            self.assertEqual(get_object_counts(querysets, cache_timeout=60), [3])
+        # Only one refresh should be scheduled
+        get_queue.return_value.enqueue.assert_called_once()
+        func, *args = get_queue.return_value.enqueue.call_args.args
+        self.assertEqual(func, refresh_object_counts)
+        func(*args)
+        self.assertEqual(get_object_counts(querysets, cache_timeout=60), [4])
+
+    @override_settings(HOME_STATS_CACHE_TIMEOUT=60)
+    def test_home_stats_cached(self):
+        self.add_permissions('dcim.view_site')
+        cache.delete_pattern('object_counts:*')
+        self.client.get(reverse('home'))
+
+        Site.objects.create(name='Site 4', slug='site-4')
+        response = self.client.get(reverse('home'))
+        org_items = {item['label']: item for item in response.context['stats'][0][1]}
+        self.assertEqual(org_items['Sites']['count'], 3)
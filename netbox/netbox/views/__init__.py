@@ -22,9 +22,10 @@ from dcim.models import (
 from extras.models import ObjectChange
 from extras.tables import ObjectChangeTable
 from ipam.models import Aggregate, IPAddress, IPRange, Prefix, VLAN, VRF
-from netbox.constants import SEARCH_MAX_RESULTS
+from netbox.config import get_config
 from netbox.forms import SearchForm
-from netbox.search import SEARCH_TYPES
+from netbox.search import SEARCH_TYPES, search_object_types
+from netbox.stats import get_object_counts
 from tenancy.models import Tenant
 from virtualization.models import Cluster, VirtualMachine
 from wireless.models import WirelessLAN, WirelessLink
@@ -37,58 +38,58 @@ class HomeView(View):
         if settings.LOGIN_REQUIRED and not request.user.is_authenticated:
             return redirect("login")
 
-        connected_consoleports = ConsolePort.objects.restrict(request.user, 'view').prefetch_related('_path').filter(
+        connected_consoleports = ConsolePort.objects.restrict(request.user, 'view').filter(
             _path__destination_id__isnull=False
         )
-        connected_powerports = PowerPort.objects.restrict(request.user, 'view').prefetch_related('_path').filter(
+        connected_powerports = PowerPort.objects.restrict(request.user, 'view').filter(
             _path__destination_id__isnull=False
         )
-        connected_interfaces = Interface.objects.restrict(request.user, 'view').prefetch_related('_path').filter(
+        connected_interfaces = Interface.objects.restrict(request.user, 'view').filter(
             _path__destination_id__isnull=False,
             pk__lt=F('_path__destination_id')
         )
 
         def build_stats():
             org = (
-                ("dcim.view_site", "Sites", Site.objects.restrict(request.user, 'view').count),
-                ("tenancy.view_tenant", "Tenants", Tenant.objects.restrict(request.user, 'view').count),
+                ("dcim.view_site", "Sites", Site.objects.restrict(request.user, 'view')),
+                ("tenancy.view_tenant", "Tenants", Tenant.objects.restrict(request.user, 'view')),
             )
             dcim = (
-                ("dcim.view_rack", "Racks", Rack.objects.restrict(request.user, 'view').count),
-                ("dcim.view_devicetype", "Device Types", DeviceType.objects.restrict(request.user, 'view').count),
-                ("dcim.view_device", "Devices", Device.objects.restrict(request.user, 'view').count),
+                ("dcim.view_rack", "Racks", Rack.objects.restrict(request.user, 'view')),
+                ("dcim.view_devicetype", "Device Types", DeviceType.objects.restrict(request.user, 'view')),
+                ("dcim.view_device", "Devices", Device.objects.restrict(request.user, 'view')),
             )
             ipam = (
-                ("ipam.view_vrf", "VRFs", VRF.objects.restrict(request.user, 'view').count),
-                ("ipam.view_aggregate", "Aggregates", Aggregate.objects.restrict(request.user, 'view').count),
-                ("ipam.view_prefix", "Prefixes", Prefix.objects.restrict(request.user, 'view').count),
-                ("ipam.view_iprange", "IP Ranges", IPRange.objects.restrict(request.user, 'view').count),
-                ("ipam.view_ipaddress", "IP Addresses", IPAddress.objects.restrict(request.user, 'view').count),
-                ("ipam.view_vlan", "VLANs", VLAN.objects.restrict(request.user, 'view').count)
+                ("ipam.view_vrf", "VRFs", VRF.objects.restrict(request.user, 'view')),
+                ("ipam.view_aggregate", "Aggregates", Aggregate.objects.restrict(request.user, 'view')),
+                ("ipam.view_prefix", "Prefixes", Prefix.objects.restrict(request.user, 'view')),
+                ("ipam.view_iprange", "IP Ranges", IPRange.objects.restrict(request.user, 'view')),
+                ("ipam.view_ipaddress", "IP Addresses", IPAddress.objects.restrict(request.user, 'view')),
+                ("ipam.view_vlan", "VLANs", VLAN.objects.restrict(request.user, 'view'))
 
             )
             circuits = (
-                ("circuits.view_provider", "Providers", Provider.objects.restrict(request.user, 'view').count),
-                ("circuits.view_circuit", "Circuits", Circuit.objects.restrict(request.user, 'view').count),
+                ("circuits.view_provider", "Providers", Provider.objects.restrict(request.user, 'view')),
+                ("circuits.view_circuit", "Circuits", Circuit.objects.restrict(request.user, 'view')),
             )
             virtualization = (
-                ("virtualization.view_cluster", "Clusters", Cluster.objects.restrict(request.user, 'view').count),
-                ("virtualization.view_virtualmachine", "Virtual Machines", VirtualMachine.objects.restrict(request.user, 'view').count),
+                ("virtualization.view_cluster", "Clusters", Cluster.objects.restrict(request.user, 'view')),
+                ("virtualization.view_virtualmachine", "Virtual Machines", VirtualMachine.objects.restrict(request.user, 'view')),
 
             )
             connections = (
-                ("dcim.view_cable", "Cables", Cable.objects.restrict(request.user, 'view').count),
-                ("dcim.view_consoleport", "Console", connected_consoleports.count),
-                ("dcim.view_interface", "Interfaces", connected_interfaces.count),
-                ("dcim.view_powerport", "Power Connections", connected_powerports.count),
+                ("dcim.view_cable", "Cables", Cable.objects.restrict(request.user, 'view')),
+                ("dcim.view_consoleport", "Console", connected_consoleports),
+                ("dcim.view_interface", "Interfaces", connected_interfaces),
+                ("dcim.view_powerport", "Power Connections", connected_powerports),
             )
             power = (
-                ("dcim.view_powerpanel", "Power Panels", PowerPanel.objects.restrict(request.user, 'view').count),
-                ("dcim.view_powerfeed", "Power Feeds", PowerFeed.objects.restrict(request.user, 'view').count),
+                ("dcim.view_powerpanel", "Power Panels", PowerPanel.objects.restrict(request.user, 'view')),
+                ("dcim.view_powerfeed", "Power Feeds", PowerFeed.objects.restrict(request.user, 'view')),
             )
             wireless = (
-                ("wireless.view_wirelesslan", "Wireless LANs", WirelessLAN.objects.restrict(request.user, 'view').count),
-                ("wireless.view_wirelesslink", "Wireless Links", WirelessLink.objects.restrict(request.user, 'view').count),
+                ("wireless.view_wirelesslan", "Wireless LANs", WirelessLAN.objects.restrict(request.user, 'view')),
+                ("wireless.view_wirelesslink", "Wireless Links", WirelessLink.objects.restrict(request.user, 'view')),
             )
             sections = (
                 ("Organization", org, "domain"),
@@ -102,9 +103,10 @@ class HomeView(View):
             )
 
             stats = []
+            permitted_items = []
             for section_label, section_items, icon_class in sections:
                 items = []
-                for perm, item_label, get_count in section_items:
+                for perm, item_label, queryset in section_items:
                     app, scope = perm.split(".")
                     url = ":".join((app, scope.replace("view_", "") + "_list"))
                     item = {
@@ -115,11 +117,19 @@ class HomeView(View):
                         "icon": icon_class,
                     }
                     if request.user.has_perm(perm):
-                        item["count"] = get_count()
                         item["disabled"] = False
+                        permitted_items.append((item, queryset))
                     items.append(item)
                 stats.append((section_label, items, icon_class))
 
+            # Count the objects of all permitted types at once
+            counts = get_object_counts(
+                [queryset for item, queryset in permitted_items],
+                cache_timeout=get_config().HOME_STATS_CACHE_TIMEOUT
+            )
+            for (item, queryset), count in zip(permitted_items, counts):
+                item["count"] = count
+
             return stats
 
         # Compile changelog table
@@ -162,19 +172,20 @@ class SearchView(View):
                 url = reverse(SEARCH_TYPES[object_type]['url'])
                 return redirect(f"{url}?q={form.cleaned_data['q']}")
 
-            for obj_type in SEARCH_TYPES.keys():
+            querysets = {
+                obj_type: search_type['queryset'].restrict(request.user, 'view')
+                for obj_type, search_type in SEARCH_TYPES.items()
+            }
 
-                queryset = SEARCH_TYPES[obj_type]['queryset'].restrict(request.user, 'view')
-                filterset = SEARCH_TYPES[obj_type]['filterset']
-                table = SEARCH_TYPES[obj_type]['table']
-                url = SEARCH_TYPES[obj_type]['url']
+            # Search all object types concurrently. Object types which could not be searched within the configured
+            # time are listed with a link to their own search results.
+            tables = dict(search_object_types(querysets, form.cleaned_data['q'], timeout=get_config().SEARCH_TIMEOUT))
 
-                # Construct the results table for this object type
-                filtered_queryset = filterset({'q': form.cleaned_data['q']}, queryset=queryset).qs
-                table = table(filtered_queryset, orderable=False)
-                table.paginate(per_page=SEARCH_MAX_RESULTS)
+            for obj_type, queryset in querysets.items():
+                table = tables[obj_type]
+                url = SEARCH_TYPES[obj_type]['url']
 
-                if table.page:
+                if table is None or table.page:
                     results.append({
                         'name': queryset.model._meta.verbose_name_plural,
                         'table': table,
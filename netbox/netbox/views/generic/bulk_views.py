@@ -10,12 +10,13 @@ from django.db import transaction, IntegrityError
 from django.db.models import ManyToManyField, ProtectedError
 from django.db.models.fields.reverse_related import ManyToManyRel
 from django.forms import Form, ModelMultipleChoiceField, MultipleHiddenInput
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
-from django_tables2.export import TableExport
 
-from extras.models import ExportTemplate
+from extras.constants import TABLE_EXPORT_JOB_NAME
+from extras.models import ExportTemplate, JobResult
 from extras.signals import clear_webhooks
+from netbox.tables.export import run_table_export, table_to_csv
 from utilities.error_handlers import handle_protectederror
 from utilities.exceptions import PermissionsViolation
 from utilities.forms import (
@@ -23,6 +24,7 @@ from utilities.forms import (
 )
 from utilities.htmx import is_htmx
 from utilities.permissions import get_permission_for_model
+from utilities.utils import chunked_queryset
 from utilities.views import GetReturnURLMixin
 from .base import BaseMultiObjectView
 
@@ -82,15 +84,19 @@ class ObjectListView(BaseMultiObjectView):
 
     def export_yaml(self):
         """
-        Export the queryset of objects as concatenated YAML documents.
+        Export the queryset of objects as concatenated YAML documents, yielding each document as it is rendered.
+        Objects are retrieved in chunks, prefetching any related objects named by the model's `yaml_prefetch`.
         """
-        yaml_data = [obj.to_yaml() for obj in self.queryset]
-
-        return '---\n'.join(yaml_data)
+        queryset = self.queryset.prefetch_related(*getattr(self.queryset.model, 'yaml_prefetch', ()))
+        separator = ''
+        for chunk in chunked_queryset(queryset):
+            for obj in chunk:
+                yield separator + obj.to_yaml()
+                separator = '---\n'
 
     def export_table(self, table, columns=None, filename=None):
         """
-        Export all table data in CSV format.
+        Export all table data in CSV format. The response is streamed, rendering the table rows as they are sent.
 
         Args:
             table: The Table instance to export
@@ -98,21 +104,39 @@ class ObjectListView(BaseMultiObjectView):
             filename: The name of the file attachment sent to the client. If None, will be determined automatically
                 from the queryset model name.
         """
-        exclude_columns = {'pk', 'actions'}
-        if columns:
-            all_columns = [col_name for col_name, _ in table.selected_columns + table.available_columns]
-            exclude_columns.update({
-                col for col in all_columns if col not in columns
-            })
-        exporter = TableExport(
-            export_format=TableExport.CSV,
-            table=table,
-            exclude_columns=exclude_columns
-        )
-        return exporter.response(
-            filename=filename or f'netbox_{self.queryset.model._meta.verbose_name_plural}.csv'
+        response = StreamingHttpResponse(table_to_csv(table, columns), content_type='text/csv; charset=utf-8')
+        filename = filename or f'netbox_{self.queryset.model._meta.verbose_name_plural}.csv'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+        return response
+
+    def export_job(self, request, export_format, columns=None):
+        """
+        Export all objects using a background job, and redirect the user to the job's result, from which the exported
+        file can be downloaded.
+
+        Args:
+            request: The current request
+            export_format: The format of the exported file ("csv" for table data, or "yaml")
+            columns: A list of specific table columns to include. If None, all columns will be exported.
+        """
+        query_params = request.GET.copy()
+        for param in ('export', 'background'):
+            query_params.pop(param, None)
+
+        job_result = JobResult.enqueue_job(
+            run_table_export,
+            TABLE_EXPORT_JOB_NAME,
+            ContentType.objects.get_for_model(self.queryset.model),
+            request.user,
+            view=f'{self.__class__.__module__}.{self.__class__.__name__}',
+            query_params=query_params.urlencode(),
+            export_format=export_format,
+            columns=columns
         )
 
+        return redirect('extras:export_result', job_result_pk=job_result.pk)
+
     def export_template(self, template, request):
         """
         Render an ExportTemplate using the current queryset.
@@ -162,6 +186,8 @@ class ObjectListView(BaseMultiObjectView):
             if request.GET['export'] == 'table':
                 table = self.get_table(request, has_bulk_actions)
                 columns = [name for name, _ in table.selected_columns]
+                if 'background' in request.GET:
+                    return self.export_job(request, 'csv', columns)
                 return self.export_table(table, columns)
 
             # Render an ExportTemplate
@@ -171,13 +197,17 @@ class ObjectListView(BaseMultiObjectView):
 
             # Check for YAML export support on the model
             elif hasattr(model, 'to_yaml'):
-                response = HttpResponse(self.export_yaml(), content_type='text/yaml')
+                if 'background' in request.GET:
+                    return self.export_job(request, 'yaml')
+                response = StreamingHttpResponse(self.export_yaml(), content_type='text/yaml')
                 filename = 'netbox_{}.yaml'.format(self.queryset.model._meta.verbose_name_plural)
                 response['Content-Disposition'] = 'attachment; filename="{}"'.format(filename)
                 return response
 
             # Fall back to default table/YAML export
             else:
+                if 'background' in request.GET:
+                    return self.export_job(request, 'csv')
                 table = self.get_table(request, has_bulk_actions)
                 return self.export_table(table)
 
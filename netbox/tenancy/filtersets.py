@@ -1,6 +1,6 @@
 import django_filters
-from django.db.models import Q
 
+from extras.models import SearchIndexEntry
 from netbox.filtersets import ChangeLoggedModelFilterSet, OrganizationalModelFilterSet, NetBoxModelFilterSet
 from utilities.filters import ContentTypeFilter, TreeNodeMultipleChoiceFilter
 from .models import *
@@ -68,15 +68,7 @@ class ContactFilterSet(NetBoxModelFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(title__icontains=value) |
-            Q(phone__icontains=value) |
-            Q(email__icontains=value) |
-            Q(address__icontains=value) |
-            Q(link__icontains=value) |
-            Q(comments__icontains=value)
-        )
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
 
 class ContactAssignmentFilterSet(ChangeLoggedModelFilterSet):
@@ -163,12 +155,7 @@ class TenantFilterSet(NetBoxModelFilterSet, ContactModelFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(slug__icontains=value) |
-            Q(description__icontains=value) |
-            Q(comments__icontains=value)
-        )
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
 
 class TenancyFilterSet(django_filters.FilterSet):
@@ -1,6 +1,7 @@
 import graphene
 
 from tenancy import filtersets, models
+from netbox.graphql.loaders import load_related_objects
 from netbox.graphql.types import BaseObjectType, OrganizationalObjectType, NetBoxObjectType
 
 __all__ = (
@@ -17,7 +18,9 @@ class ContactAssignmentsMixin:
     assignments = graphene.List('tenancy.graphql.types.ContactAssignmentType')
 
     def resolve_assignments(self, info):
-        return self.assignments.restrict(info.context.user, 'view')
+        return load_related_objects(
+            self, info, 'assignments', models.ContactAssignment.objects.restrict(info.context.user, 'view')
+        )
 
 
 #
@@ -112,6 +112,10 @@ class Contact(NetBoxModel):
         blank=True
     )
 
+    search_fields = {
+        'name': 'A', 'title': 'B', 'phone': 'B', 'email': 'B', 'address': 'D', 'link': 'D', 'comments': 'D',
+    }
+
     clone_fields = [
         'group',
     ]
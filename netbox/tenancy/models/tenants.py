@@ -76,6 +76,8 @@ class Tenant(NetBoxModel):
         to='tenancy.ContactAssignment'
     )
 
+    search_fields = {'name': 'A', 'slug': 'A', 'description': 'C', 'comments': 'D'}
+
     clone_fields = [
         'group', 'description',
     ]
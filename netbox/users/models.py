@@ -1,12 +1,14 @@
 import binascii
 import os
+import uuid
 
 from django.contrib.auth.models import Group, User
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.fields import ArrayField
+from django.core.cache import cache
 from django.core.validators import MinLengthValidator
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
@@ -20,8 +22,12 @@ __all__ = (
     'ObjectPermission',
     'Token',
     'UserConfig',
+    'get_permissions_version',
 )
 
+# Cache key for the version of all users' permissions, shared by all NetBox processes
+PERMISSIONS_VERSION_KEY = 'permissions_version'
+
 
 #
 # Proxy models for admin
@@ -301,3 +307,41 @@ class ObjectPermission(models.Model):
         if type(self.constraints) is not list:
             return [self.constraints]
         return self.constraints
+
+
+#
+# Permissions versioning
+#
+
+def get_permissions_version():
+    """
+    Return an identifier which changes whenever the permissions of any user may have changed (e.g. due to the
+    modification of an ObjectPermission or of a user's group memberships). This may be included in cache keys to
+    invalidate content which depends on users' permissions.
+    """
+    version = cache.get(PERMISSIONS_VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(PERMISSIONS_VERSION_KEY, version, None)
+
+    return version
+
+
+@receiver((post_save, post_delete), sender=ObjectPermission)
+@receiver((post_save, post_delete), sender=User)
+@receiver(post_delete, sender=Group)
+@receiver(m2m_changed, sender=ObjectPermission.object_types.through)
+@receiver(m2m_changed, sender=ObjectPermission.groups.through)
+@receiver(m2m_changed, sender=ObjectPermission.users.through)
+@receiver(m2m_changed, sender=User.groups.through)
+def handle_permissions_changed(sender, update_fields=None, action=None, **kwargs):
+    """
+    Update the permissions version when permissions, users, or group memberships are modified.
+    """
+    # Ignore the update of a user's last login time
+    if update_fields is not None and set(update_fields) == {'last_login'}:
+        return
+    if action is not None and not action.startswith('post_'):
+        return
+
+    cache.set(PERMISSIONS_VERSION_KEY, uuid.uuid4().hex, None)
@@ -1,5 +1,10 @@
-from django.contrib.auth.models import User
-from django.test import TestCase
+from django.contrib.auth.models import Group, User
+from django.contrib.auth.signals import user_logged_in
+from django.contrib.contenttypes.models import ContentType
+from django.test import RequestFactory, TestCase
+
+from dcim.models import Site
+from users.models import ObjectPermission, get_permissions_version
 
 
 class UserConfigTest(TestCase):
@@ -104,3 +109,35 @@ class UserConfigTest(TestCase):
 
         # Clear a non-existing value; should fail silently
         userconfig.clear('invalid')
+
+
+class PermissionsVersionTest(TestCase):
+
+    def test_permissions_version(self):
+        user = User.objects.create_user(username='testuser')
+        group = Group.objects.create(name='Group 1')
+
+        version = get_permissions_version()
+        self.assertEqual(get_permissions_version(), version)
+
+        # Modifying a user's group memberships should update the version
+        user.groups.add(group)
+        self.assertNotEqual(get_permissions_version(), version)
+        version = get_permissions_version()
+
+        # Creating and assigning an ObjectPermission should update the version
+        permission = ObjectPermission.objects.create(name='Permission 1', actions=['view'])
+        self.assertNotEqual(get_permissions_version(), version)
+        version = get_permissions_version()
+        permission.groups.add(group)
+        self.assertNotEqual(get_permissions_version(), version)
+        version = get_permissions_version()
+
+        # Modifying the object types to which an ObjectPermission applies should update the version
+        permission.object_types.add(ContentType.objects.get_for_model(Site))
+        self.assertNotEqual(get_permissions_version(), version)
+        version = get_permissions_version()
+
+        # Recording a user's login should not update the version
+        user_logged_in.send(sender=User, request=RequestFactory().get('/'), user=user)
+        self.assertEqual(get_permissions_version(), version)
@@ -67,3 +67,11 @@ HTTP_REQUEST_META_SAFE_COPY = [
     'SERVER_NAME',
     'SERVER_PORT',
 ]
+
+
+#
+# Jinja2
+#
+
+# Number of compiled templates retained by render_jinja2()
+JINJA2_TEMPLATE_CACHE_SIZE = 512
@@ -1,3 +1,5 @@
+import datetime
+
 import django_filters
 from django import forms
 from django.conf import settings
@@ -62,6 +64,48 @@ class MultiValueWWNFilter(django_filters.MultipleChoiceFilter):
     field_class = multivalue_field_factory(forms.CharField)
 
 
+class JSONContainmentFilterMixin:
+    """
+    Match the value of a key within a JSONField using a containment query (e.g. `data @> '{"key": "value"}'`) rather
+    than a key path lookup, allowing the query to be served by a GIN index on the JSONField. The filter's `field_name`
+    takes the form `<field>__<key>`. If `contains` is True, the key is expected to hold an array, and each filter value
+    is matched as a member of that array.
+    """
+    def __init__(self, *args, contains=False, **kwargs):
+        self.contains = contains
+        super().__init__(*args, **kwargs)
+
+    def get_filter_predicate(self, v):
+        field_name, key = self.field_name.split('__', 1)
+        if isinstance(v, datetime.date):
+            v = v.isoformat()
+        return {
+            f'{field_name}__contains': {key: [v] if self.contains else v}
+        }
+
+
+class JSONContainmentBooleanFilter(JSONContainmentFilterMixin, django_filters.BooleanFilter):
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        if self.distinct:
+            qs = qs.distinct()
+        return self.get_method(qs)(**self.get_filter_predicate(value))
+
+
+class JSONContainmentCharFilter(JSONContainmentFilterMixin, MultiValueCharFilter):
+    pass
+
+
+class JSONContainmentDateFilter(JSONContainmentFilterMixin, MultiValueDateFilter):
+    pass
+
+
+class JSONContainmentNumberFilter(JSONContainmentFilterMixin, MultiValueNumberFilter):
+    pass
+
+
 class TreeNodeMultipleChoiceFilter(django_filters.ModelMultipleChoiceFilter):
     """
     Filters for a set of Models, including all descendant models within a Tree.  Example: [<Region: R1>,<Region: R2>]
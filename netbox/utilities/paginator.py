@@ -1,4 +1,11 @@
+import hashlib
+
+from django.core.cache import cache
 from django.core.paginator import Paginator, Page
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
 
 from netbox.config import get_config
 
@@ -26,6 +33,16 @@ class EnhancedPaginator(Paginator):
 
         super().__init__(object_list, per_page, orphans=orphans, **kwargs)
 
+        # Indicates whether the total count is an estimate or a cached value
+        self.count_approximate = False
+
+    @cached_property
+    def count(self):
+        if isinstance(self.object_list, QuerySet):
+            count, self.count_approximate = get_queryset_count(self.object_list)
+            return count
+        return super().count
+
     def _get_page(self, *args, **kwargs):
         return EnhancedPage(*args, **kwargs)
 
@@ -87,3 +104,74 @@ def get_paginate_count(request):
         return _max_allowed(per_page)
 
     return _max_allowed(config.PAGINATE_COUNT)
+
+
+def get_estimated_count(queryset):
+    """
+    Return the PostgreSQL planner's estimate of the number of rows in the QuerySet's table (pg_class.reltuples). An
+    estimate is only meaningful for an unfiltered QuerySet; None is returned if the QuerySet has been filtered, sliced,
+    or made distinct, or if the table has not yet been analyzed.
+    """
+    query = queryset.query
+    if query.where or query.distinct or query.combinator or query.low_mark or query.high_mark is not None:
+        return None
+
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)",
+            [connection.ops.quote_name(queryset.model._meta.db_table)]
+        )
+        row = cursor.fetchone()
+
+    # reltuples is -1 for tables which have never been vacuumed or analyzed
+    if row is None or row[0] < 0:
+        return None
+
+    return int(row[0])
+
+
+def get_count_cache_key(queryset):
+    """
+    Return the cache key under which the count of a QuerySet is stored. The key is derived from the compiled SQL, so
+    it reflects both the applied filters and any permission constraints.
+    """
+    sql, params = queryset.query.sql_with_params()
+    digest = hashlib.sha256(f'{sql}{params}'.encode('utf-8')).hexdigest()
+
+    return f'count:{queryset.model._meta.label_lower}:{digest}'
+
+
+def get_queryset_count(queryset):
+    """
+    Count the objects in a QuerySet, honoring the COUNT_ESTIMATE_THRESHOLD and COUNT_CACHE_TIMEOUT configuration
+    parameters. Returns a two-tuple of the count and a boolean indicating whether the count is approximate (i.e. an
+    estimate or a previously cached value).
+    """
+    config = get_config()
+
+    # Use the planner's estimate for unfiltered lists of very large tables
+    if config.COUNT_ESTIMATE_THRESHOLD:
+        estimate = get_estimated_count(queryset)
+        if estimate is not None and estimate >= config.COUNT_ESTIMATE_THRESHOLD:
+            return estimate, True
+
+    if not config.COUNT_CACHE_TIMEOUT:
+        return queryset.count(), False
+
+    try:
+        cache_key = get_count_cache_key(queryset)
+    except EmptyResultSet:
+        return 0, False
+
+    count = cache.get(cache_key)
+    if count is not None:
+        return count, True
+
+    count = queryset.count()
+    cache.set(cache_key, count, config.COUNT_CACHE_TIMEOUT)
+
+    return count, False
@@ -1,5 +1,6 @@
 from django.db.models import Q, QuerySet
 
+from netbox.signals import post_bulk_save
 from utilities.permissions import permission_is_exempt
 
 
@@ -48,3 +49,16 @@ class RestrictedQuerySet(QuerySet):
             qs = self.filter(attrs)
 
         return qs
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        post_bulk_save.send(sender=self.model, instances=objs, fields=None)
+
+        return objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        rows = super().bulk_update(objs, fields, *args, **kwargs)
+        post_bulk_save.send(sender=self.model, instances=objs, fields=fields)
+
+        return rows
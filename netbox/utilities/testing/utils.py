@@ -1,8 +1,10 @@
 import logging
 import re
 from contextlib import contextmanager
+from unittest.mock import patch
 
 from django.contrib.auth.models import Permission, User
+from django.db import connection
 from django.utils.text import slugify
 
 from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Site
@@ -100,3 +102,13 @@ def disable_warnings(logger_name):
     logger.setLevel(logging.ERROR)
     yield
     logger.setLevel(current_level)
+
+
+@contextmanager
+def outside_transaction():
+    """
+    Simulate operation outside of a transaction within a TestCase (which wraps each test in a transaction), e.g. to
+    enable caches which are bypassed within transactions.
+    """
+    with patch.object(connection, 'in_atomic_block', False):
+        yield
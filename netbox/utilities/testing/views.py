@@ -1,3 +1,6 @@
+import csv
+from io import StringIO
+
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist
 from django.test import override_settings
@@ -451,11 +454,14 @@ class ViewTestCases:
             response = self.client.get(f'{url}?export')
             self.assertHttpStatus(response, 200)
             self.assertEqual(response.get('Content-Type'), 'text/csv; charset=utf-8')
+            content = b''.join(response.streaming_content).decode('utf-8')
+            self.assertEqual(len(list(csv.reader(StringIO(content)))), self._get_queryset().count() + 1)
 
             # Test table-based export
             response = self.client.get(f'{url}?export=table')
             self.assertHttpStatus(response, 200)
             self.assertEqual(response.get('Content-Type'), 'text/csv; charset=utf-8')
+            b''.join(response.streaming_content)
 
     class CreateMultipleObjectsViewTestCase(ModelViewTestCase):
         """
@@ -1,6 +1,10 @@
+import json
 import urllib.parse
+from unittest.mock import patch
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection
 from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
@@ -9,6 +13,7 @@ from dcim.models import Region, Site
 from extras.choices import CustomFieldTypeChoices
 from extras.models import CustomField
 from ipam.models import VLAN
+from netbox.api.pagination import OptionalLimitOffsetPagination
 from netbox.config import get_config
 from utilities.testing import APITestCase, disable_warnings
 
@@ -169,11 +174,59 @@ class APIPaginationTestCase(APITestCase):
     def test_max_page_size_disabled(self):
         response = self.client.get(f'{self.url}?limit=0', format='json', **self.header)
 
+        # Unpaginated responses are streamed
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(data['count'], 100)
+        self.assertIsNone(data['next'])
+        self.assertIsNone(data['previous'])
+        self.assertEqual(len(data['results']), 100)
+        self.assertEqual(data['results'][0]['name'], 'Site 1')
+
+    @override_settings(MAX_PAGE_SIZE=0)
+    def test_max_page_size_disabled_chunked(self):
+        with patch.object(OptionalLimitOffsetPagination, 'stream_chunk_size', 30):
+            response = self.client.get(f'{self.url}?limit=0&offset=10&brief=1', format='json', **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        data = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(data['count'], 100)
+        self.assertEqual(len(data['results']), 90)
+        self.assertEqual(len({site['id'] for site in data['results']}), 90)
+
+    @override_settings(COUNT_ESTIMATE_THRESHOLD=50)
+    def test_estimated_count(self):
+        # Populate pg_class.reltuples for the Site table
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE dcim_site')
+
+        response = self.client.get(self.url, format='json', **self.header)
         self.assertHttpStatus(response, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 100)
-        self.assertIsNone(response.data['next'])
-        self.assertIsNone(response.data['previous'])
-        self.assertEqual(len(response.data['results']), 100)
+        self.assertTrue(response.data['count_approximate'])
+
+        # Filtered lists must always report an exact count
+        response = self.client.get(f'{self.url}?name=Site 1', format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 1)
+        self.assertNotIn('count_approximate', response.data)
+
+    @override_settings(COUNT_CACHE_TIMEOUT=60)
+    def test_cached_count(self):
+        cache.delete_pattern('count:dcim.site:*')
+
+        response = self.client.get(self.url, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 100)
+        self.assertNotIn('count_approximate', response.data)
+
+        # A subsequent request should be served from the cache
+        Site.objects.create(name='Site 101', slug='site-101')
+        response = self.client.get(self.url, format='json', **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 100)
+        self.assertTrue(response.data['count_approximate'])
 
 
 class APIDocsTestCase(TestCase):
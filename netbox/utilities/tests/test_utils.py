@@ -1,7 +1,8 @@
 from django.http import QueryDict
 from django.test import TestCase
+from jinja2.exceptions import SecurityError
 
-from utilities.utils import deepmerge, dict_to_filter_params, normalize_querydict
+from utilities.utils import compile_jinja2_template, deepmerge, dict_to_filter_params, normalize_querydict, render_jinja2
 
 
 class DictToFilterParamsTest(TestCase):
@@ -128,3 +129,27 @@ class DeepMergeTest(TestCase):
             deepmerge(dict1, dict2),
             merged
         )
+
+
+class RenderJinja2Test(TestCase):
+    """
+    Validate the rendering of Jinja2 templates using cached, compiled templates.
+    """
+
+    def setUp(self):
+        compile_jinja2_template.cache_clear()
+
+    def test_render_jinja2(self):
+        template_code = 'Hello {{ name }}'
+        self.assertEqual(render_jinja2(template_code, {'name': 'foo'}), 'Hello foo')
+        self.assertEqual(render_jinja2(template_code, {'name': 'bar'}), 'Hello bar')
+        self.assertEqual(render_jinja2('{{ name|upper }}', {'name': 'foo'}), 'FOO')
+
+        # Each template should be compiled only once
+        cache_info = compile_jinja2_template.cache_info()
+        self.assertEqual(cache_info.misses, 2)
+        self.assertEqual(cache_info.hits, 1)
+
+    def test_render_jinja2_sandboxed(self):
+        with self.assertRaises(SecurityError):
+            render_jinja2('{{ foo.__class__.__subclasses__() }}', {'foo': 'bar'})
@@ -2,11 +2,12 @@ import datetime
 import json
 from collections import OrderedDict
 from decimal import Decimal
-from itertools import count, groupby
+from functools import lru_cache
+from itertools import count, groupby, islice
 
 import bleach
 from django.core.serializers import serialize
-from django.db.models import Count, OuterRef, Subquery
+from django.db.models import Count, OuterRef, Subquery, prefetch_related_objects
 from django.db.models.functions import Coalesce
 from django.http import QueryDict
 from jinja2.sandbox import SandboxedEnvironment
@@ -16,7 +17,7 @@ from dcim.choices import CableLengthUnitChoices
 from extras.plugins import PluginConfig
 from extras.utils import is_taggable
 from netbox.config import get_config
-from utilities.constants import HTTP_REQUEST_META_SAFE_COPY
+from utilities.constants import HTTP_REQUEST_META_SAFE_COPY, JINJA2_TEMPLATE_CACHE_SIZE
 
 
 def get_viewname(model, action=None, rest_api=False):
@@ -126,6 +127,46 @@ def count_related(model, field):
     return Coalesce(subquery, 0)
 
 
+def chunked_queryset(queryset, chunk_size=1000):
+    """
+    Iterate over a QuerySet without caching its results, yielding lists of up to `chunk_size` objects. Unlike
+    QuerySet.iterator(), any prefetch_related() lookups on the QuerySet are applied to each chunk in turn.
+    """
+    lookups = queryset._prefetch_related_lookups
+    iterator = queryset.prefetch_related(None).iterator(chunk_size=chunk_size)
+
+    while chunk := list(islice(iterator, chunk_size)):
+        if lookups:
+            prefetch_related_objects(chunk, *lookups)
+        yield chunk
+
+
+class ChunkedQuerySet:
+    """
+    Wraps a QuerySet so that iterating over it retrieves objects in chunks (see chunked_queryset()) rather than caching
+    the entire result set. Other attributes and methods are passed through to the wrapped QuerySet.
+    """
+    def __init__(self, queryset, chunk_size=1000):
+        self.queryset = queryset
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        for chunk in chunked_queryset(self.queryset, self.chunk_size):
+            yield from chunk
+
+    def __len__(self):
+        return self.queryset.count()
+
+    def __bool__(self):
+        return self.queryset.exists()
+
+    def __getitem__(self, k):
+        return self.queryset[k]
+
+    def __getattr__(self, name):
+        return getattr(self.queryset, name)
+
+
 def serialize_object(obj, extra=None):
     """
     Return a generic JSON representation of an object using Django's built-in serializer. (This is used for things like
@@ -255,13 +296,31 @@ def to_meters(length, unit):
     raise ValueError(f"Unknown unit {unit}. Must be 'km', 'm', 'cm', 'mi', 'ft', or 'in'.")
 
 
-def render_jinja2(template_code, context):
+@lru_cache(maxsize=None)
+def get_jinja2_environment():
     """
-    Render a Jinja2 template with the provided context. Return the rendered content.
+    Return the sandboxed Jinja2 environment shared by all rendered templates. (As JINJA2_FILTERS is a static
+    configuration parameter, the environment is created once per process.)
     """
     environment = SandboxedEnvironment()
     environment.filters.update(get_config().JINJA2_FILTERS)
-    return environment.from_string(source=template_code).render(**context)
+    return environment
+
+
+@lru_cache(maxsize=JINJA2_TEMPLATE_CACHE_SIZE)
+def compile_jinja2_template(template_code):
+    """
+    Compile a Jinja2 template. The most recently used templates are retained, so that templates rendered repeatedly
+    (e.g. a custom link rendered for each row of a table) are compiled only once.
+    """
+    return get_jinja2_environment().from_string(source=template_code)
+
+
+def render_jinja2(template_code, context):
+    """
+    Render a Jinja2 template with the provided context. Return the rendered content.
+    """
+    return compile_jinja2_template(template_code).render(**context)
 
 
 def prepare_cloned_fields(instance):
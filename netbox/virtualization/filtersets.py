@@ -3,6 +3,7 @@ from django.db.models import Q
 
 from dcim.models import DeviceRole, Platform, Region, Site, SiteGroup
 from extras.filtersets import LocalConfigContextFilterSet
+from extras.models import SearchIndexEntry
 from ipam.models import VRF
 from netbox.filtersets import OrganizationalModelFilterSet, NetBoxModelFilterSet
 from tenancy.filtersets import TenancyFilterSet, ContactModelFilterSet
@@ -98,10 +99,7 @@ class ClusterFilterSet(NetBoxModelFilterSet, TenancyFilterSet, ContactModelFilte
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(comments__icontains=value)
-        )
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
 
 class VirtualMachineFilterSet(
@@ -219,10 +217,7 @@ class VirtualMachineFilterSet(
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(comments__icontains=value)
-        )
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
     def _has_primary_ip(self, queryset, name, value):
         params = Q(primary_ip4__isnull=False) | Q(primary_ip6__isnull=False)
@@ -286,7 +281,4 @@ class VMInterfaceFilterSet(NetBoxModelFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(description__icontains=value)
-        )
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
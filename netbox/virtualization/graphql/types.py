@@ -41,7 +41,7 @@ class VirtualMachineType(ConfigContextMixin, NetBoxObjectType):
 
     class Meta:
         model = models.VirtualMachine
-        fields = '__all__'
+        exclude = ('_config_context',)
         filterset_class = filtersets.VirtualMachineFilterSet
 
 
@@ -148,6 +148,8 @@ class Cluster(NetBoxModel):
         to='tenancy.ContactAssignment'
     )
 
+    search_fields = {'name': 'A', 'comments': 'D'}
+
     clone_fields = [
         'type', 'group', 'tenant', 'site',
     ]
@@ -268,6 +270,13 @@ class VirtualMachine(NetBoxModel, ConfigContextModel):
         blank=True
     )
 
+    # Cache the rendered config context data
+    _config_context = models.JSONField(
+        blank=True,
+        null=True,
+        editable=False
+    )
+
     # Generic relation
     contacts = GenericRelation(
         to='tenancy.ContactAssignment'
@@ -275,6 +284,8 @@ class VirtualMachine(NetBoxModel, ConfigContextModel):
 
     objects = ConfigContextModelQuerySet.as_manager()
 
+    search_fields = {'name': 'A', 'comments': 'D'}
+
     clone_fields = [
         'cluster', 'tenant', 'platform', 'status', 'role', 'vcpus', 'memory', 'disk',
     ]
@@ -399,6 +410,8 @@ class VMInterface(NetBoxModel, BaseInterface):
         related_query_name='+'
     )
 
+    search_fields = {'name': 'A', 'description': 'C'}
+
     class Meta:
         verbose_name = 'interface'
         ordering = ('virtual_machine', CollateAsChar('_name'))
@@ -1,7 +1,7 @@
 import django_filters
-from django.db.models import Q
 
 from dcim.choices import LinkStatusChoices
+from extras.models import SearchIndexEntry
 from ipam.models import VLAN
 from netbox.filtersets import OrganizationalModelFilterSet, NetBoxModelFilterSet
 from utilities.filters import MultiValueNumberFilter, TreeNodeMultipleChoiceFilter
@@ -59,11 +59,7 @@ class WirelessLANFilterSet(NetBoxModelFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        qs_filter = (
-            Q(ssid__icontains=value) |
-            Q(description__icontains=value)
-        )
-        return queryset.filter(qs_filter)
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
 
 
 class WirelessLinkFilterSet(NetBoxModelFilterSet):
@@ -86,8 +82,4 @@ class WirelessLinkFilterSet(NetBoxModelFilterSet):
     def search(self, queryset, name, value):
         if not value.strip():
             return queryset
-        qs_filter = (
-            Q(ssid__icontains=value) |
-            Q(description__icontains=value)
-        )
-        return queryset.filter(qs_filter)
+        return queryset.filter(pk__in=SearchIndexEntry.objects.search(value, queryset.model))
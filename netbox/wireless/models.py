@@ -106,6 +106,8 @@ class WirelessLAN(WirelessAuthenticationBase, NetBoxModel):
         blank=True
     )
 
+    search_fields = {'ssid': 'A', 'description': 'C'}
+
     class Meta:
         ordering = ('ssid', 'pk')
         verbose_name = 'Wireless LAN'
@@ -165,6 +167,8 @@ class WirelessLink(WirelessAuthenticationBase, NetBoxModel):
         null=True
     )
 
+    search_fields = {'ssid': 'A', 'description': 'C'}
+
     clone_fields = ('ssid', 'status')
 
     class Meta:
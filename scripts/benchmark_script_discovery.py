@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark the discovery of custom script modules.
+
+Creates a temporary scripts path containing the specified number of script modules, and reports the median time
+taken by get_scripts() to discover all scripts when every module must be imported (as on the first call, or when all
+modules have changed), when no module has changed, and when a single module has changed.
+
+Usage:
+
+    python3 scripts/benchmark_script_discovery.py [--modules 100]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'netbox'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'netbox.settings')
+
+import django  # noqa: E402
+django.setup()
+
+from django.test import override_settings  # noqa: E402
+
+from extras import utils  # noqa: E402
+from extras.scripts import get_scripts  # noqa: E402
+
+SCRIPT_MODULE = """
+import decimal
+import ipaddress
+import json
+
+from dcim.models import Device, Site
+from extras.scripts import IntegerVar, ObjectVar, Script, StringVar
+
+
+class Script{index}A(Script):
+    name = StringVar()
+    site = ObjectVar(model=Site)
+
+    def run(self, data, commit):
+        return json.dumps({{'name': data['name']}})
+
+
+class Script{index}B(Script):
+    count = IntegerVar()
+    device = ObjectVar(model=Device)
+
+    def run(self, data, commit):
+        return str(decimal.Decimal(data['count']) * ipaddress.ip_network('192.0.2.0/24').num_addresses)
+"""
+
+
+def write_module(path, index, revision=0):
+    with open(os.path.join(path, f'benchmark_script_{index:03d}.py'), 'w') as f:
+        f.write(SCRIPT_MODULE.format(index=index))
+        f.write(f'\n# Revision {revision}\n')
+
+
+def benchmark(runs, setup=None):
+    """
+    Return the median time (in milliseconds) taken by get_scripts(), calling setup() (if any) before each run.
+    """
+    timings = []
+    for run in range(runs):
+        if setup is not None:
+            setup(run)
+        start = time.perf_counter()
+        get_scripts()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--modules', type=int, default=100, help='Number of script modules to create')
+    parser.add_argument('--runs', type=int, default=10, help='Number of runs of each benchmark')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as path, override_settings(SCRIPTS_ROOT=path):
+        for index in range(args.modules):
+            write_module(path, index)
+
+        def clear_cache(run):
+            utils._module_cache.clear()
+
+        def modify_module(run):
+            write_module(path, 0, revision=run + 1)
+
+        print(f'Discovering scripts in {args.modules} modules...')
+        print(f'{"All modules imported":<40} {benchmark(args.runs, clear_cache):>10.1f} ms')
+        print(f'{"No modules changed":<40} {benchmark(args.runs):>10.1f} ms')
+        print(f'{"One module changed":<40} {benchmark(args.runs, modify_module):>10.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Benchmark the quick search (`q`) filters of large tables.
+
+Populates the database with a fixture of the specified number of devices (and a proportional number of sites and IP
+addresses), and reports the median execution time of representative quick searches with and without the indexes
+which serve them. All changes are made within a transaction which is rolled back upon completion, so the benchmark
+may be run against a development database. (It should not be run against a production database, as the tables of
+indexed objects remain locked for the duration of the benchmark.)
+
+Usage:
+
+    python3 scripts/benchmark_search.py [--devices 1000000]
+"""
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'netbox'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'netbox.settings')
+
+import django  # noqa: E402
+django.setup()
+
+from django.apps import apps  # noqa: E402
+from django.db import connection, transaction  # noqa: E402
+from django.db.models import Q  # noqa: E402
+
+from dcim.filtersets import DeviceFilterSet, SiteFilterSet  # noqa: E402
+from dcim.models import Device, DeviceRole, DeviceType, Manufacturer, Site  # noqa: E402
+from extras.models.search import create_trigram_indexes, drop_trigram_indexes  # noqa: E402
+from ipam.filtersets import IPAddressFilterSet  # noqa: E402
+from ipam.models import ASN, IPAddress, RIR  # noqa: E402
+
+BATCH_SIZE = 10000
+
+
+class Rollback(Exception):
+    pass
+
+
+def populate(device_count):
+    """
+    Create the specified number of devices, with one site (and ASN) for every 100 devices and one IP address for every
+    10 devices.
+    """
+    manufacturer = Manufacturer.objects.create(name='Benchmark Manufacturer', slug='benchmark-manufacturer')
+    device_type = DeviceType.objects.create(manufacturer=manufacturer, model='Benchmark', slug='benchmark')
+    device_role = DeviceRole.objects.create(name='Benchmark', slug='benchmark')
+    rir = RIR.objects.create(name='Benchmark RIR', slug='benchmark-rir')
+
+    site_count = max(device_count // 100, 1)
+    sites = Site.objects.bulk_create(
+        [Site(name=f'bench-site-{i:05d}', slug=f'bench-site-{i:05d}') for i in range(site_count)],
+        batch_size=BATCH_SIZE
+    )
+    asns = ASN.objects.bulk_create(
+        [ASN(asn=4200000000 + i, rir=rir) for i in range(site_count)],
+        batch_size=BATCH_SIZE
+    )
+    Site.asns.through.objects.bulk_create(
+        [Site.asns.through(site=site, asn=asn) for site, asn in zip(sites, asns)],
+        batch_size=BATCH_SIZE
+    )
+
+    for start in range(0, device_count, BATCH_SIZE):
+        Device.objects.bulk_create([
+            Device(
+                name=f'bench-device-{i:07d}',
+                serial=f'SN{i * 7919 % 10000000:07d}',
+                asset_tag=f'AT{i:07d}',
+                device_type=device_type,
+                device_role=device_role,
+                site=sites[i % site_count]
+            ) for i in range(start, min(start + BATCH_SIZE, device_count))
+        ])
+        print(f'  Created {min(start + BATCH_SIZE, device_count)} devices', end='\r', flush=True)
+    print()
+
+    IPAddress.objects.bulk_create(
+        [
+            IPAddress(address=f'10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}/16', dns_name=f'host{i}.example.com')
+            for i in range(device_count // 10)
+        ],
+        batch_size=BATCH_SIZE
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+
+
+def benchmark(queryset, runs):
+    """
+    Return the median execution time (in milliseconds) of counting the objects in a QuerySet.
+    """
+    timings = []
+    for _ in range(runs):
+        plan = queryset.order_by().values('pk').explain(analyze=True)
+        timings.append(float(re.search(r'Execution Time: ([\d.]+) ms', plan).group(1)))
+    return statistics.median(timings)
+
+
+def drop_index(name):
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP INDEX IF EXISTS {connection.ops.quote_name(name)}')
+
+
+def run(label, queryset, runs, drop=None):
+    """
+    Benchmark a QuerySet, optionally after dropping indexes (which are restored afterward).
+    """
+    try:
+        with transaction.atomic():
+            if drop is not None:
+                drop()
+            print(f'{label:<60} {benchmark(queryset, runs):>10.1f} ms')
+            raise Rollback
+    except Rollback:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--devices', type=int, default=1000000, help='Number of devices to create')
+    parser.add_argument('--runs', type=int, default=5, help='Number of runs of each query')
+    args = parser.parse_args()
+
+    try:
+        with transaction.atomic():
+            print(f'Populating {args.devices} devices...')
+            start = time.monotonic()
+            populate(args.devices)
+            print(f'  Populated in {time.monotonic() - start:.1f}s')
+
+            with connection.schema_editor() as schema_editor:
+                trigram = create_trigram_indexes(apps, schema_editor)
+            if not trigram:
+                print('The pg_trgm extension is not available; skipping trigram indexes')
+
+            def drop_trigram():
+                with connection.schema_editor() as schema_editor:
+                    drop_trigram_indexes(apps, schema_editor)
+
+            # Devices: substring of a name or serial number
+            devices = Device.objects.all()
+            for value in ('device-0123', 'sn12345'):
+                legacy_filter = (
+                    Q(name__icontains=value) |
+                    Q(serial__icontains=value) |
+                    Q(inventoryitems__serial__icontains=value) |
+                    Q(asset_tag__icontains=value) |
+                    Q(comments__icontains=value)
+                )
+                run(f'Device q={value!r} (per-field matching)', devices.filter(legacy_filter).distinct(), args.runs)
+                search = DeviceFilterSet({'q': value}, devices).qs
+                if trigram:
+                    run(f'Device q={value!r} (search index)', search, args.runs, drop=drop_trigram)
+                    run(f'Device q={value!r} (search index, trigram index)', search, args.runs)
+                else:
+                    run(f'Device q={value!r} (search index)', search, args.runs)
+
+            # Sites: numeric queries matching an assigned ASN
+            sites = Site.objects.all()
+            value = str(4200000000 + args.devices // 200)
+            legacy_filter = Q(name__icontains=value) | Q(asns__asn=int(value))
+            run(f'Site q={value!r} (ASN join)', sites.filter(legacy_filter).distinct(), args.runs)
+            run(f'Site q={value!r} (ASN subquery)', SiteFilterSet({'q': value}, sites).qs, args.runs)
+
+            # IP addresses: prefix of an address (also matched against DNS names and descriptions, which require
+            # trigram indexes)
+            def drop_ipaddress_indexes():
+                drop_index('ipam_ipaddress_address_text')
+                if trigram:
+                    drop_trigram()
+
+            search = IPAddressFilterSet({'q': '10.0.12.'}, IPAddress.objects.all()).qs
+            run("IPAddress q='10.0.12.' (unindexed)", search, args.runs, drop=drop_ipaddress_indexes)
+            run("IPAddress q='10.0.12.' (indexed)", search, args.runs)
+
+            raise Rollback
+    except Rollback:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -88,6 +88,16 @@ COMMAND="python3 netbox/manage.py trace_paths --no-input"
 echo "Checking for missing cable paths ($COMMAND)..."
 eval $COMMAND || exit 1
 
+# Compile any missing config context data (not typically needed)
+COMMAND="python3 netbox/manage.py rebuild_config_contexts"
+echo "Checking for missing config context data ($COMMAND)..."
+eval $COMMAND || exit 1
+
+# Index any objects missing from the search index
+COMMAND="python3 netbox/manage.py rebuild_search_index"
+echo "Checking for missing search index entries ($COMMAND)..."
+eval $COMMAND || exit 1
+
 # Build the local documentation
 COMMAND="mkdocs build"
 echo "Building documentation ($COMMAND)..."